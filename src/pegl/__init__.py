@@ -37,6 +37,10 @@ from .context import *
 from .context import __all__ as context_all
 __all__.extend(context_all)
 
+from .damage import *
+from .damage import __all__ as damage_all
+__all__.extend(damage_all)
+
 from .display import *
 from .display import __all__ as display_all
 __all__.extend(display_all)
@@ -49,10 +53,34 @@ from .errors import *
 from .errors import __all__ as errors_all
 __all__.extend(errors_all)
 
+from .executor import *
+from .executor import __all__ as executor_all
+__all__.extend(executor_all)
+
+from .frames import *
+from .frames import __all__ as frames_all
+__all__.extend(frames_all)
+
+from .handoff import *
+from .handoff import __all__ as handoff_all
+__all__.extend(handoff_all)
+
 from .image import *
 from .image import __all__ as image_all
 __all__.extend(image_all)
 
+from .pool import *
+from .pool import __all__ as pool_all
+__all__.extend(pool_all)
+
+from .readback import *
+from .readback import __all__ as readback_all
+__all__.extend(readback_all)
+
+from .recovery import *
+from .recovery import __all__ as recovery_all
+__all__.extend(recovery_all)
+
 from .surface import *
 from .surface import __all__ as surface_all
 __all__.extend(surface_all)
@@ -60,3 +88,7 @@ __all__.extend(surface_all)
 from .sync import *
 from .sync import __all__ as sync_all
 __all__.extend(sync_all)
+
+from .tiled import *
+from .tiled import __all__ as tiled_all
+__all__.extend(tiled_all)
@@ -19,15 +19,91 @@
 # You should have received a copy of the GNU General Public License
 # along with Pegl. If not, see <http://www.gnu.org/licenses/>.
 
-__all__ = ['cached']
+__all__ = ['cached', 'is_stale', 'memoised_property', 'stamp']
 
 # Standard library imports.
 import logging
+import os
 from weakref import WeakValueDictionary
 
 # Set up logging with the module name.
 logger = logging.getLogger(__name__)
 
+# Every class decorated with cached() is listed here, so that its caches can be
+# cleared after a fork.
+_cached_classes = []
+
+# The fork generation of this process. It is incremented in a child process
+# after a fork, so that instances inherited from the parent can be recognised.
+_generation = 0
+
+def stamp(instance):
+    """Record the fork generation in which an instance was created."""
+    instance._generation = _generation
+
+def is_stale(instance):
+    """Check whether an instance was inherited across a fork.
+
+    Stale instances hold handles that refer to the parent process's EGL
+    state. They must not be used, and in particular they must not be
+    destroyed, since that could affect objects in the parent process.
+    Instances that were never stamped are not considered stale.
+
+    """
+    return getattr(instance, '_generation', _generation) != _generation
+
+def _after_fork_in_child():
+    """Mark inherited instances as stale and forget them.
+
+    The caches are cleared without finalising anything in them (they
+    hold only weak references, so this cannot trigger any destructors).
+    New instances are then created and cached as the child asks for
+    them.
+
+    """
+    global _generation # pylint: disable=global-statement
+    _generation += 1
+
+    for cls in _cached_classes:
+        for cache in cls._caches:
+            cache.clear()
+
+    logger.debug('Cleared instance caches after fork (generation %d)',
+                 _generation)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+class memoised_property: # pylint: disable=invalid-name
+    """A read-only property whose value is computed once per instance.
+
+    This is for values that can't change over an object's lifetime, so
+    that querying them again would be wasted effort. The value is stored
+    in the instance's __dict__ under the property's own name, which then
+    takes precedence over this (non-data) descriptor. Deleting it there
+    forces the value to be computed again on next access.
+
+    If a when function is given, the value is only stored for instances
+    for which it returns true; for others, this acts as a plain property.
+
+    """
+    def __init__(self, fget, doc=None, when=None):
+        self.fget = fget
+        self.name = fget.__name__
+        self.__doc__ = fget.__doc__ if doc is None else doc
+        self.when = when
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.fget(instance)
+        if self.when is None or self.when(instance):
+            instance.__dict__[self.name] = value
+        return value
+
 def extract_key(key):
     """Ensure a key has a hashable value.
 
@@ -64,13 +140,19 @@ def cached(*cache_keys):
     instances, each cache is searched in order (again skipping any keys
     that are None) until a match is found or all caches have been tried.
 
+    Cached instances are also stamped with the current fork generation
+    (see is_stale), and the caches are cleared in a child process after
+    a fork.
+
     """
     def cached_class(cls):
         cls._cache_keys = cache_keys
         cls._caches = [WeakValueDictionary() for _ in cache_keys]
+        _cached_classes.append(cls)
 
         def _add_to_cache(cls, instance):
             """Add an instance to the cache."""
+            stamp(instance)
             used_keys = [] # For debugging only.
             for keyname, cache in zip(cls._cache_keys, cls._caches):
                 raw_key = getattr(instance, keyname)
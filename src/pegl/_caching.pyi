@@ -3,7 +3,7 @@
 # Standard library imports.
 from abc import ABC
 from typing import (Any, Callable, ClassVar, Generic, Hashable, List, Mapping,
-                    Protocol, Tuple, Union)
+                    Optional, Protocol, Tuple, Type, TypeVar, Union, overload)
 
 __all__: List[str] = ...
 
@@ -15,6 +15,28 @@ CacheKey = Union[Hashable, HasHashableValue]
 class CtypesPassable(Protocol):
     _as_parameter_: CacheKey
 
+def stamp(instance: Any) -> None: ...
+
+def is_stale(instance: Any) -> bool: ...
+
+_T = TypeVar('_T')
+
+class memoised_property(Generic[_T]):
+    fget: Callable[[Any], _T]
+    name: str
+    when: Optional[Callable[[Any], bool]]
+
+    def __init__(self, fget: Callable[[Any], _T], doc: Optional[str]=...,
+                 when: Optional[Callable[[Any], bool]]=...) -> None: ...
+
+    def __set_name__(self, owner: type, name: str) -> None: ...
+
+    @overload
+    def __get__(self, instance: None,
+                owner: Optional[type]=...) -> memoised_property[_T]: ...
+    @overload
+    def __get__(self, instance: Any, owner: Optional[type]=...) -> _T: ...
+
 def extract_key(key: CacheKey) -> Hashable: ...
 
 class CachedClass(Protocol):
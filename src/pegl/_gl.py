@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""Minimal access to client API (OpenGL and OpenGL ES) functions."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Pegl doesn't wrap the client APIs, but some of its helpers need a handful of
+# their functions. These are resolved through eglGetProcAddress when first
+# used, so that no client API library needs to be found and loaded.
+
+# Standard library imports.
+import ctypes
+from threading import Lock
+
+# Local imports.
+from .egl._common import eglGetProcAddress
+
+# Type definitions.
+GLboolean  = ctypes.c_ubyte
+GLbitfield = ctypes.c_uint
+GLenum     = ctypes.c_uint
+GLint      = ctypes.c_int
+GLintptr   = ctypes.c_ssize_t
+GLsizei    = ctypes.c_int
+GLsizeiptr = ctypes.c_ssize_t
+GLuint     = ctypes.c_uint
+GLuint_p   = ctypes.POINTER(GLuint)
+GLint_p    = ctypes.POINTER(GLint)
+
+# Constants.
+GL_NO_ERROR           = 0
+GL_TEXTURE_2D         = 0x0DE1
+GL_UNSIGNED_BYTE      = 0x1401
+GL_RGBA               = 0x1908
+GL_LINEAR             = 0x2601
+GL_TEXTURE_MAG_FILTER = 0x2800
+GL_TEXTURE_MIN_FILTER = 0x2801
+GL_MAP_READ_BIT       = 0x0001
+GL_TEXTURE_BINDING_2D = 0x8069
+GL_STREAM_READ        = 0x88E1
+GL_PIXEL_PACK_BUFFER  = 0x88EB
+
+# The return type and argument types of each function that may be used.
+_prototypes = {
+    'glBindBuffer': (None, GLenum, GLuint),
+    'glBindTexture': (None, GLenum, GLuint),
+    'glBufferData': (None, GLenum, GLsizeiptr, ctypes.c_void_p, GLenum),
+    'glDeleteBuffers': (None, GLsizei, GLuint_p),
+    'glDeleteTextures': (None, GLsizei, GLuint_p),
+    'glEGLImageTargetTexture2DOES': (None, GLenum, ctypes.c_void_p),
+    'glGenBuffers': (None, GLsizei, GLuint_p),
+    'glGenTextures': (None, GLsizei, GLuint_p),
+    'glGetError': (GLenum,),
+    'glGetIntegerv': (None, GLenum, GLint_p),
+    'glMapBufferRange': (ctypes.c_void_p, GLenum, GLintptr, GLsizeiptr,
+                         GLbitfield),
+    'glReadPixels': (None, GLint, GLint, GLsizei, GLsizei, GLenum, GLenum,
+                     ctypes.c_void_p),
+    'glTexImage2D': (None, GLenum, GLint, GLint, GLsizei, GLsizei, GLint,
+                     GLenum, GLenum, ctypes.c_void_p),
+    'glTexParameteri': (None, GLenum, GLenum, GLint),
+    'glUnmapBuffer': (GLboolean, GLenum),
+}
+_loaded = {}
+_lock = Lock()
+
+def gl_function(name):
+    """Get a client API function by name.
+
+    An ImportError is raised if EGL can't find the function. Functions
+    are found without regard to the current context, and so may be
+    unusable with it (if its client API version is too old).
+
+    """
+    with _lock:
+        try:
+            return _loaded[name]
+        except KeyError:
+            pass
+
+        restype, *argtypes = _prototypes[name]
+        address = eglGetProcAddress(name.encode())
+        if address is None:
+            raise ImportError(f"client API function '{name}' not found")
+        fn = ctypes.CFUNCTYPE(restype, *argtypes)(address)
+        _loaded[name] = fn
+        return fn
+
+def check_error(action):
+    """Raise RuntimeError if the client API has recorded an error."""
+    error = gl_function('glGetError')()
+    if error != GL_NO_ERROR:
+        raise RuntimeError(f'{action} failed with client API error '
+                           f'0x{error:04X}')
@@ -0,0 +1,32 @@
+"""Typing stubs for pegl._gl"""
+
+# Standard library imports.
+import ctypes
+from typing import Any, Callable, Dict, Tuple, Type
+
+GLboolean: Type[ctypes.c_ubyte]
+GLbitfield: Type[ctypes.c_uint]
+GLenum: Type[ctypes.c_uint]
+GLint: Type[ctypes.c_int]
+GLintptr: Type[ctypes.c_ssize_t]
+GLsizei: Type[ctypes.c_int]
+GLsizeiptr: Type[ctypes.c_ssize_t]
+GLuint: Type[ctypes.c_uint]
+GLuint_p: Any
+GLint_p: Any
+
+GL_NO_ERROR: int
+GL_TEXTURE_2D: int
+GL_UNSIGNED_BYTE: int
+GL_RGBA: int
+GL_LINEAR: int
+GL_TEXTURE_MAG_FILTER: int
+GL_TEXTURE_MIN_FILTER: int
+GL_MAP_READ_BIT: int
+GL_TEXTURE_BINDING_2D: int
+GL_STREAM_READ: int
+GL_PIXEL_PACK_BUFFER: int
+
+def gl_function(name: str) -> Callable[..., Any]: ...
+
+def check_error(action: str) -> None: ...
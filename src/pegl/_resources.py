@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""Per-display resource accounting for Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['ResourceCount', 'ResourceReport', 'ResourceTracker']
+
+# Standard library imports.
+from collections import namedtuple
+from threading import Lock
+from weakref import WeakSet
+
+ResourceCount = namedtuple('ResourceCount', ['live', 'peak'])
+ResourceReport = namedtuple('ResourceReport', ['contexts', 'surfaces',
+                                               'images', 'syncs',
+                                               'surface_bytes'])
+
+class ResourceTracker:
+    """Keep count of the EGL objects created on one display.
+
+    Objects are held by weak reference, so an object stops being counted
+    as live as soon as it is finalised. The peak count for each kind of
+    object is the most that were ever live at once.
+
+    """
+    kinds = ('contexts', 'surfaces', 'images', 'syncs')
+
+    def __init__(self):
+        self._lock = Lock()
+        self._live = {kind: WeakSet() for kind in self.kinds}
+        self._peak = dict.fromkeys(self.kinds, 0)
+
+    def add(self, kind, obj):
+        """Start counting an object of the given kind."""
+        with self._lock:
+            live = self._live[kind]
+            live.add(obj)
+            if len(live) > self._peak[kind]:
+                self._peak[kind] = len(live)
+
+    def report(self):
+        """Summarise the live and peak counts, and surface memory use.
+
+        The memory use is the sum of the estimates for each live
+        surface. If any of them can no longer be queried (say, because
+        the display has been terminated), the EGL error is raised rather
+        than the surface being left out of the sum.
+
+        """
+        with self._lock:
+            counts = {kind: ResourceCount(len(self._live[kind]),
+                                          self._peak[kind])
+                      for kind in self.kinds}
+            surfaces = list(self._live['surfaces'])
+
+        surface_bytes = sum(surface.memory_estimate for surface in surfaces)
+        return ResourceReport(surface_bytes=surface_bytes, **counts)
@@ -0,0 +1,26 @@
+"""Typing stubs for pegl._resources"""
+
+# Standard library imports.
+from typing import Any, ClassVar, List, NamedTuple, Tuple
+
+__all__: List[str] = ...
+
+class ResourceCount(NamedTuple):
+    live: int
+    peak: int
+
+class ResourceReport(NamedTuple):
+    contexts: ResourceCount
+    surfaces: ResourceCount
+    images: ResourceCount
+    syncs: ResourceCount
+    surface_bytes: int
+
+class ResourceTracker:
+    kinds: ClassVar[Tuple[str, ...]]
+
+    def __init__(self) -> None: ...
+
+    def add(self, kind: str, obj: Any) -> None: ...
+
+    def report(self) -> ResourceReport: ...
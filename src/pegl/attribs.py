@@ -21,14 +21,18 @@
 
 from __future__ import annotations
 
-__all__ = ['attrib_list', 'DONT_CARE']
+__all__ = ['attrib_list', 'ContextAttribs', 'DONT_CARE']
 
 # Standard library imports.
+from collections.abc import Mapping
 from itertools import chain
 
 # Local imports.
+from . import egl
 from .egl import EGL_DONT_CARE, EGL_NONE
 from .egl._common import EGLAttrib, EGLint
+from .enums import ContextPriority, ReleaseBehavior
+from .errors import BadAttributeError
 
 def attrib_list(attribs, new_type=False):
     """Convert a Python dict into an EGL attribute list.
@@ -52,4 +56,166 @@ def attrib_list(attribs, new_type=False):
 
     return (ctype * length)(*chain.from_iterable(attribs.items()), EGL_NONE)
 
+def _is_bool(value):
+    """Check for a boolean attribute value."""
+    return value in (False, True)
+
+def _is_version(value):
+    """Check for a version number attribute value."""
+    return isinstance(value, int) and value >= 0
+
+def _in_mask(mask):
+    """Make a check for a bitmask attribute value."""
+    return lambda value: isinstance(value, int) and value & ~mask == 0
+
+def _one_of(*values):
+    """Make a check for an attribute value from a fixed set."""
+    return lambda value: value in values
+
+_is_reset_notification = _one_of(egl.EGL_NO_RESET_NOTIFICATION_KHR,
+                                 egl.EGL_LOSE_CONTEXT_ON_RESET_KHR)
+
+# Context attributes from the core specification, with a check for each
+# one's value. Earlier versions of EGL take no context attributes.
+_CORE_CONTEXT_ATTRIBS = {}
+if egl.egl_version >= (1, 3):
+    _CORE_CONTEXT_ATTRIBS[egl.EGL_CONTEXT_CLIENT_VERSION] = _is_version
+if egl.egl_version >= (1, 5):
+    _CORE_CONTEXT_ATTRIBS.update({
+        egl.EGL_CONTEXT_MINOR_VERSION: _is_version,
+        egl.EGL_CONTEXT_OPENGL_PROFILE_MASK: _in_mask(
+            egl.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT |
+            egl.EGL_CONTEXT_OPENGL_COMPATIBILITY_PROFILE_BIT),
+        egl.EGL_CONTEXT_OPENGL_DEBUG: _is_bool,
+        egl.EGL_CONTEXT_OPENGL_FORWARD_COMPATIBLE: _is_bool,
+        egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS: _is_bool,
+        egl.EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY:
+            _is_reset_notification})
+
+# Context attributes from extensions, with the extension that each one needs
+# and a check for its value. Some of these become core attributes in later
+# versions, and are then allowed without the extension.
+_EXT_CONTEXT_ATTRIBS = {
+    egl.EGL_CONTEXT_MINOR_VERSION_KHR: ('EGL_KHR_create_context',
+                                        _is_version),
+    egl.EGL_CONTEXT_FLAGS_KHR: ('EGL_KHR_create_context', _in_mask(
+        egl.EGL_CONTEXT_OPENGL_DEBUG_BIT_KHR |
+        egl.EGL_CONTEXT_OPENGL_FORWARD_COMPATIBLE_BIT_KHR |
+        egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR)),
+    egl.EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR: ('EGL_KHR_create_context',
+                                              _in_mask(
+        egl.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT_KHR |
+        egl.EGL_CONTEXT_OPENGL_COMPATIBILITY_PROFILE_BIT_KHR)),
+    egl.EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR: (
+        'EGL_KHR_create_context', _is_reset_notification),
+    egl.EGL_CONTEXT_RELEASE_BEHAVIOR_KHR: ('EGL_KHR_context_flush_control',
+                                           _one_of(*ReleaseBehavior)),
+    egl.EGL_CONTEXT_OPENGL_NO_ERROR_KHR: ('EGL_KHR_create_context_no_error',
+                                          _is_bool),
+    egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT: (
+        'EGL_EXT_create_context_robustness', _is_bool),
+    egl.EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT: (
+        'EGL_EXT_create_context_robustness', _is_reset_notification),
+    egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG: ('EGL_IMG_context_priority',
+                                         _one_of(*ContextPriority))}
+
+# Context attributes for robust access and the reset notification strategy,
+# from the EGL_EXT_create_context_robustness extension and from EGL 1.5.
+_ROBUST_EXT_KEYS = (egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT,
+                    egl.EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT)
+_ROBUST_CORE_KEYS = ((egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS,
+                      egl.EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY)
+                     if egl.egl_version >= (1, 5) else None)
+
+class ContextAttribs(Mapping):
+    """An immutable, validated set of context attributes.
+
+    Known attributes are checked against the loaded version of EGL and
+    the display's extensions when the set is created, so that mistakes
+    are caught before EGL sees them. Unknown attributes are passed on to
+    EGL unchecked. The EGL attribute list is built at the
+    same time, and reused by every context created with the set.
+
+    """
+    def __init__(self, display, attribs=None, *, release_behavior=None,
+                 no_error=False, priority=None, robust=False,
+                 reset_notification=None):
+        """Validate a set of context attributes.
+
+        Keyword arguments:
+            display -- The display on which the attributes will be used.
+            attribs -- An optional dict of context attributes.
+
+        The remaining arguments are as for Config.create_context, and
+        are ignored if the display does not support them.
+
+        Raises BadAttributeError if a known attribute, or its value, is
+        not supported.
+
+        """
+        attribs = {} if attribs is None else dict(attribs)
+
+        # Extension attributes are only added if they're supported.
+        if (release_behavior is not None and
+            display.has_extension('EGL_KHR_context_flush_control')):
+            attribs[egl.EGL_CONTEXT_RELEASE_BEHAVIOR_KHR] = release_behavior
+        if (no_error and
+            display.has_extension('EGL_KHR_create_context_no_error')):
+            attribs[egl.EGL_CONTEXT_OPENGL_NO_ERROR_KHR] = True
+        if (priority is not None and
+            display.has_extension('EGL_IMG_context_priority')):
+            attribs[egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG] = priority
+        if robust:
+            robust_keys = (_ROBUST_EXT_KEYS if display.has_extension(
+                'EGL_EXT_create_context_robustness') else _ROBUST_CORE_KEYS)
+            if robust_keys is not None:
+                attribs[robust_keys[0]] = True
+                if reset_notification is not None:
+                    attribs[robust_keys[1]] = reset_notification
+
+        for key, value in attribs.items():
+            if key in _CORE_CONTEXT_ATTRIBS:
+                check = _CORE_CONTEXT_ATTRIBS[key]
+            elif key in _EXT_CONTEXT_ATTRIBS:
+                extension, check = _EXT_CONTEXT_ATTRIBS[key]
+                if not display.has_extension(extension):
+                    raise BadAttributeError('context attribute {:#06x} '
+                                            'needs the {} extension'.format(
+                                                key, extension))
+            elif key == EGL_NONE:
+                # This would end the attribute list early.
+                raise BadAttributeError('EGL_NONE is not a context '
+                                        'attribute')
+            else:
+                # Attributes that Pegl doesn't know, such as those from
+                # vendor extensions, are left for EGL to check.
+                continue
+            if not check(value):
+                raise BadAttributeError('invalid value {!r} for context '
+                                        'attribute {:#06x}'.format(value,
+                                                                   key))
+
+        self._attribs = attribs
+        self._array = attrib_list(attribs) if attribs else None
+
+    def __getitem__(self, key):
+        return self._attribs[key]
+
+    def __iter__(self):
+        return iter(self._attribs)
+
+    def __len__(self):
+        return len(self._attribs)
+
+    def __hash__(self):
+        return hash(frozenset(self._attribs.items()))
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._attribs)
+
+    @property
+    def array(self):
+        """The EGL attribute list, or None if there are no attributes."""
+        return self._array
+
 DONT_CARE = EGL_DONT_CARE
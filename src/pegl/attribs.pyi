@@ -1,7 +1,11 @@
 """Typing stubs for pegl.attribs"""
 
 # Standard library imports.
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+# Local imports.
+from .display import Display
+from .enums import ContextPriority, ReleaseBehavior
 
 __all__: List[str] = ...
 
@@ -10,4 +14,26 @@ CTypeArray = Iterable[int]
 def attrib_list(attribs: Optional[Dict[int, int]],
                 new_type:bool=False) -> CTypeArray: ...
 
+
+class ContextAttribs(Mapping[int, Any]):
+    def __init__(self, display: Display,
+                 attribs: Optional[Mapping[int, Any]]=..., *,
+                 release_behavior: Optional[ReleaseBehavior]=...,
+                 no_error: bool=...,
+                 priority: Optional[ContextPriority]=...,
+                 robust: bool=...,
+                 reset_notification: Optional[int]=...) -> None: ...
+
+    def __getitem__(self, key: int) -> Any: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def __len__(self) -> int: ...
+
+    def __hash__(self) -> int: ...
+
+    @property
+    def array(self) -> Optional[CTypeArray]: ...
+
+
 DONT_CARE: Any = ...
@@ -23,9 +23,10 @@ __all__ = ['Config']
 
 # Local imports.
 from . import egl
-from .attribs import attrib_list
+from .attribs import attrib_list, ContextAttribs
 from ._caching import cached
-from .enums import ConfigCaveat, SurfaceTypeFlag, TransparentType
+from .enums import (ConfigAttrib, ConfigCaveat, SurfaceTypeFlag,
+                    TransparentType)
 from .context import Context
 from .surface import Surface
 
@@ -99,31 +100,74 @@ class Config:
         return (None if self.sample_buffers == 0 else
                 '{}× MSAA'.format(self.samples))
 
-    def create_context(self, share_context=None, attribs=None):
-        """Create a rendering context that uses this configuration."""
+    def create_context(self, share_context=None, attribs=None, *,
+                       release_behavior=None, no_error=False, priority=None,
+                       robust=False, reset_notification=None):
+        """Create a rendering context that uses this configuration.
+
+        Keyword arguments:
+            share_context -- An optional context with which the new
+                context will share objects.
+            attribs -- An optional dict of context attributes, or a
+                prebuilt ContextAttribs instance.
+            release_behavior -- An optional ReleaseBehavior, determining
+                whether the context is flushed when it is released. This
+                is ignored if the display does not support the
+                EGL_KHR_context_flush_control extension.
+            no_error -- Whether or not to create a context that does no
+                error checking, for speed. This is ignored if the display
+                does not support the EGL_KHR_create_context_no_error
+                extension.
+            priority -- An optional ContextPriority to request for the
+                context. This is ignored if the display does not support
+                the EGL_IMG_context_priority extension.
+            robust -- Whether or not to create a context with robust
+                buffer access. This uses the EGL_EXT_create_context_robustness
+                extension if the display supports it, or else the EGL 1.5
+                core attribute (which is only valid for OpenGL contexts).
+                It is ignored if neither is available.
+            reset_notification -- An optional ResetNotificationStrategy
+                for a robust context. It is ignored unless robust is True.
+
+        """
+        # A prebuilt attribute set is reused as is; anything else is
+        # validated first.
+        if (not isinstance(attribs, ContextAttribs) or
+            release_behavior is not None or no_error or
+            priority is not None or robust):
+            attribs = ContextAttribs(self._display, attribs,
+                                     release_behavior=release_behavior,
+                                     no_error=no_error, priority=priority,
+                                     robust=robust,
+                                     reset_notification=reset_notification)
+
         return Context(self._display,
                        egl.eglCreateContext(self._display, self,
                                             egl.EGL_NO_CONTEXT if share_context
                                             is None else share_context,
-                                            attrib_list(attribs)))
+                                            attribs.array),
+                       attribs)
 
     def create_pbuffer_surface(self, attribs=None):
         """Create a pbuffer (off-screen) rendering surface."""
         return Surface(self._display,
                        egl.eglCreatePbufferSurface(self._display, self,
-                                                   attrib_list(attribs)))
+                                                   attrib_list(attribs)),
+                       SurfaceTypeFlag.PBUFFER)
 
     def create_pixmap_surface(self, pixmap, attribs=None):
         """Create a pixmap (off-screen) rendering surface."""
         return Surface(self._display,
                        egl.eglCreatePixmapSurface(self._display, self, pixmap,
-                                                  attrib_list(attribs)))
+                                                  attrib_list(attribs)),
+                       SurfaceTypeFlag.PIXMAP)
 
     def create_window_surface(self, win, attribs=None):
         """Create a window (on-screen) rendering surface."""
         return Surface(self._display,
                        egl.eglCreateWindowSurface(self._display, self, win,
-                                                  attrib_list(attribs)))
+                                                  attrib_list(attribs)),
+                       SurfaceTypeFlag.WINDOW)
 
     def get_config_attrib(self, attribute):
         """Get an attribute of this configuration.
@@ -271,8 +315,13 @@ class Config:
 # These are defined here to avoid a circular dependency issue, where the config
 # module depends on the context or surface module, and vice versa.
 def config(self): # pylint: disable=missing-function-docstring
-    handle = self.config_id
-    return Config._new_or_existing((None, handle), self._display, handle) # pylint: disable=no-member
+    config_id = self.config_id
+    existing = Config._get_existing((None, config_id)) # pylint: disable=no-member
+    if existing is not None:
+        return existing
+    # The ID is not a handle, so the config has to be looked up by its ID.
+    return self._display.choose_config({ConfigAttrib.CONFIG_ID: config_id},
+                                       1)[0]
 setattr(Context, 'config',
         property(config, doc='The config object used to create this context.'))
 setattr(Surface, 'config',
@@ -312,7 +361,8 @@ if egl.egl_version >= (1, 2):
         return Surface(self._display,
                        egl.eglCreatePbufferFromClientBuffer(
                            self._display, buftype, buffer, self,
-                           attrib_list(attribs)))
+                           attrib_list(attribs)),
+                       SurfaceTypeFlag.PBUFFER)
     setattr(Config, 'create_pbuffer_from_client_buffer',
             create_pbuffer_from_client_buffer)
 
@@ -374,7 +424,8 @@ if egl.egl_version >= (1, 5):
         return Surface(self._display,
                        egl.eglCreatePlatformPixmapSurface(
                            self._display, self, native_pixmap,
-                           attrib_list(attribs, new_type=True)))
+                           attrib_list(attribs, new_type=True)),
+                       SurfaceTypeFlag.PIXMAP)
     setattr(Config, 'create_platform_pixmap_surface',
             create_platform_pixmap_surface)
 
@@ -383,6 +434,7 @@ if egl.egl_version >= (1, 5):
         return Surface(self._display,
                        egl.eglCreatePlatformWindowSurface(
                            self._display, self, native_window,
-                           attrib_list(attribs, new_type=True)))
+                           attrib_list(attribs, new_type=True)),
+                       SurfaceTypeFlag.WINDOW)
     setattr(Config, 'create_platform_window_surface',
             create_platform_window_surface)
@@ -1,14 +1,16 @@
 """Typing stubs for pegl.config"""
 
 # Standard library imports.
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 # Local imports.
+from .attribs import ContextAttribs
 from .context import Context
 from .display import Display
 from .enums import (ClientAPIFlag, ClientBufferType, ColorBufferType,
-                    ConfigAttrib, ConfigCaveat, ContextAttrib, SurfaceAttrib,
-                    SurfaceTypeFlag, TransparentType)
+                    ConfigAttrib, ConfigCaveat, ContextAttrib,
+                    ContextPriority, ReleaseBehavior, SurfaceAttrib, SurfaceTypeFlag,
+                    TransparentType)
 from .surface import Surface
 
 __all__: List[str] = ...
@@ -19,7 +21,13 @@ class Config:
 
     def create_context(
         self, share_context: Optional[Context]=...,
-        attribs: Optional[Dict[ContextAttrib, Any]]=...) -> Context: ...
+        attribs: Optional[Union[Dict[ContextAttrib, Any],
+                                ContextAttribs]]=..., *,
+        release_behavior: Optional[ReleaseBehavior]=...,
+        no_error: bool=...,
+        priority: Optional[ContextPriority]=...,
+        robust: bool=...,
+        reset_notification: Optional[int]=...) -> Context: ...
 
     def create_pbuffer_from_client_buffer(
         self, buftype: ClientBufferType, buffer: Any,
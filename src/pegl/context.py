@@ -21,13 +21,162 @@
 
 __all__ = ['Context']
 
+# Standard library imports.
+from contextlib import contextmanager
+import os
+from threading import local
+from types import MappingProxyType
+from weakref import ref
+
 # Local imports.
 from . import egl
-from ._caching import cached
-from .enums import ReadOrDraw
+from .attribs import ContextAttribs
+from ._caching import cached, is_stale, memoised_property
+from .enums import ContextPriority, ReadOrDraw, ReleaseBehavior
 from .errors import BadContextError
 
 
+def _handle(obj):
+    """Get the raw EGL handle of a context or surface, or None for none."""
+    handle = getattr(obj, '_as_parameter_', obj)
+    return getattr(handle, 'value', handle)
+
+def _ref(obj):
+    """Make a weak reference to a context or surface, if there is one."""
+    if obj is None or _handle(obj) is None:
+        return lambda: None
+    return ref(obj)
+
+class _Binding(local):
+    """A record of what Pegl last made current in the calling thread.
+
+    This is only a shadow of the real EGL state, which code outside of
+    Pegl can change at any time. Redundant binding is avoided only as
+    far as a cheap check with eglGetCurrentContext and
+    eglGetCurrentSurface allows (so not at all before EGL 1.4).
+
+    Queries for the current display, context and surfaces, and the
+    binding saved by Context.bound, are answered from the record once it
+    is known, without that check unless Context.verify_binding is set.
+
+    The record holds only weak references to contexts and surfaces, so
+    that it doesn't keep them alive once the rest of the program is done
+    with them.
+
+    """
+    display = None
+    _context = _draw = _read = staticmethod(lambda: None)
+    # Whether the record reflects a binding (or release) that Pegl made.
+    # It is not known in a new thread, nor after a failed binding.
+    known = False
+
+    def __init__(self):
+        super().__init__()
+        # Bindings saved by Context.bound, to be restored in turn, as
+        # weak references.
+        self.saved = []
+
+    @property
+    def context(self):
+        """The recorded context, or None."""
+        return self._context()
+
+    @property
+    def draw(self):
+        """The recorded draw surface, or None."""
+        return self._draw()
+
+    @property
+    def read(self):
+        """The recorded read surface, or None."""
+        return self._read()
+
+    def set(self, display, context, draw, read):
+        """Record a new binding."""
+        self.display = display
+        self._context, self._draw, self._read = (_ref(context), _ref(draw),
+                                                 _ref(read))
+        self.known = True
+
+    def clear(self):
+        """Record that nothing is bound."""
+        self.set(None, None, None, None)
+
+    def forget(self):
+        """Record that the binding is unknown."""
+        self.clear()
+        self.known = False
+
+    @staticmethod
+    def matches_egl(context, draw, read):
+        """Check a binding against what EGL reports as current.
+
+        This is always False before EGL 1.4, when it can't be checked.
+
+        """
+        return (egl.egl_version >= (1, 4) and
+                egl.eglGetCurrentContext() == _handle(context) and
+                egl.eglGetCurrentSurface(egl.EGL_DRAW) == _handle(draw) and
+                egl.eglGetCurrentSurface(egl.EGL_READ) == _handle(read))
+
+    def trusted(self):
+        """Check if the record can be used in place of querying EGL.
+
+        If Context.verify_binding is set, the record is first checked
+        against the current context and surfaces reported by EGL, and
+        forgotten if the two disagree (or if the check is impossible,
+        before EGL 1.4).
+
+        """
+        if (self.known and Context.verify_binding and
+                not self.matches_egl(self.context, self.draw, self.read)):
+            self.forget()
+        return self.known
+
+    def is_current(self, context, draw, read):
+        """Check if a binding is known to be current already."""
+        return (self.context is context and
+                self.draw is (None if _handle(draw) is None else draw) and
+                self.read is (None if _handle(read) is None else read) and
+                self.matches_egl(context, draw, read))
+
+    def save(self):
+        """Save the current binding, so that it can be restored later.
+
+        The record is saved as it is if it can be trusted (see
+        trusted()), or before EGL 1.4, when there is nothing else to go
+        on. Otherwise, the binding is queried from EGL.
+
+        """
+        if self.trusted() or egl.egl_version < (1, 4):
+            context, draw, read = self.context, self.draw, self.read
+        else:
+            context = Context.get_current_context()
+            draw = Context.get_current_surface(ReadOrDraw.DRAW)
+            read = Context.get_current_surface(ReadOrDraw.READ)
+        self.saved.append((_ref(context), _ref(draw), _ref(read)))
+
+    def restore(self):
+        """Restore the most recently saved binding.
+
+        If the saved context has since been deleted, the current context
+        is released instead.
+
+        """
+        context, draw, read = (saved() for saved in self.saved.pop())
+        if context is None:
+            Context.release_current()
+        else:
+            context.make_current(draw, read)
+
+_binding = _Binding()
+
+# A child process after a fork inherits the thread that forked, but not the
+# binding it had.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_binding.forget)
+
+
 class ContextMeta(type):
     """Metaclass for EGL contexts, to enable class properties."""
     # Note that Context.get_current_surface is added to the class by the
@@ -47,13 +196,32 @@ class ContextMeta(type):
 @cached('_as_parameter_')
 class Context(metaclass=ContextMeta):
     """An EGL rendering context."""
-    def __init__(self, display, handle):
+    # Whether to check Pegl's record of the current binding against EGL
+    # before using it to answer get_current_* queries or to save the
+    # binding in bound(). Set this if code outside of Pegl may make
+    # contexts current in the same threads.
+    verify_binding = False
+    # The properties reported by describe(). Later versions add more.
+    _described = ('config_id', 'no_error', 'priority', 'release_behavior',
+                  'robust')
+
+    def __init__(self, display, handle, attribs=None):
         self._display = display
         self._as_parameter_ = handle
+        # A validated attribute set is already immutable.
+        self._attribs = (attribs if isinstance(attribs, ContextAttribs) else
+                         MappingProxyType({} if attribs is None else
+                                          dict(attribs)))
 
         self.__class__._add_to_cache(self) # pylint: disable=no-member
+        display._resources.add('contexts', self)
 
     def __del__(self):
+        # Leave alone any context inherited from a parent process, since its
+        # handle belongs to the parent's EGL state.
+        if is_stale(self):
+            return
+
         # Remove this context from the cache.
         try:
             self.__class__._remove_from_cache(self)
@@ -82,6 +250,23 @@ class Context(metaclass=ContextMeta):
         # Implemented in pegl.display to avoid dependency problems.
         raise NotImplementedError # pragma: nocover
 
+    @contextmanager
+    def bound(self, draw=None, read=None):
+        """Make this context current for the duration of a with block.
+
+        The surfaces are specified as for make_current(). When the block
+        ends, whatever context and surfaces were current beforehand are
+        made current again (or the context is released, if there was
+        none). Such blocks may be nested.
+
+        """
+        _binding.save()
+        try:
+            self.make_current(draw, read)
+            yield self
+        finally:
+            _binding.restore()
+
     def make_current(self, draw=None, read=None):
         """Make this context current for the calling thread.
 
@@ -91,6 +276,12 @@ class Context(metaclass=ContextMeta):
         for both—but not for just one of them. If only one surface is
         supplied, it will be bound for both drawing and reading.
 
+        If this context is already current in the calling thread, with
+        the same surfaces bound, nothing is done. Pegl keeps track of
+        what it has made current in each thread, and checks that record
+        against the current context and surfaces reported by EGL, so
+        that a binding changed by other code is noticed.
+
         """
         if draw is None:
             if read is not None:
@@ -100,7 +291,28 @@ class Context(metaclass=ContextMeta):
         elif read is None:
             read = draw
 
+        if _binding.is_current(self, draw, read):
+            return
+
+        # Forget the old binding first, in case this fails and leaves the
+        # binding in an unknown state.
+        _binding.forget()
         egl.eglMakeCurrent(self._display, draw, read, self)
+        _binding.set(self._display, self, draw, read)
+
+    def describe(self):
+        """Get a snapshot of this context's properties, as a dict.
+
+        Properties that can't change are only queried once, and then
+        remembered, whether they are read here or individually.
+
+        """
+        return {name: getattr(self, name) for name in self._described}
+
+    @property
+    def attribs(self):
+        """The attributes used to create this context, if known."""
+        return self._attribs
 
     @property
     def config(self):
@@ -108,11 +320,42 @@ class Context(metaclass=ContextMeta):
         # Implemented in pegl.config to avoid dependency problems.
         raise NotImplementedError # pragma: nocover
 
-    @property
+    @memoised_property
     def config_id(self):
         """The unique ID of the config used to create this context."""
         return egl.eglQueryContext(self._display, self, egl.EGL_CONFIG_ID)
 
+    @property
+    def no_error(self):
+        """Whether or not this context was created without error checking."""
+        # Again, there's no query for this.
+        return bool(self._attribs.get(egl.EGL_CONTEXT_OPENGL_NO_ERROR_KHR,
+                                      False))
+
+    @property
+    def robust(self):
+        """Whether or not this context was created with robust access."""
+        # As with no_error, this is known only from the attributes.
+        return bool(
+            self._attribs.get(egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT) or
+            (egl.egl_version >= (1, 5) and
+             self._attribs.get(egl.EGL_CONTEXT_OPENGL_ROBUST_ACCESS)))
+
+    @property
+    def priority(self):
+        """The priority level granted to this context, if supported."""
+        if not self._display.has_extension('EGL_IMG_context_priority'):
+            return None
+        return ContextPriority(egl.eglQueryContext(
+            self._display, self, egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG))
+
+    @property
+    def release_behavior(self):
+        """Whether or not this context is flushed when released."""
+        # EGL has no query for this, so it's taken from the attributes.
+        return ReleaseBehavior(self._attribs.get(
+            egl.EGL_CONTEXT_RELEASE_BEHAVIOR_KHR, ReleaseBehavior.FLUSH))
+
 
 if egl.egl_version >= (1, 2):
     from .enums import ClientAPI, RenderBuffer
@@ -132,26 +375,34 @@ if egl.egl_version >= (1, 2):
         """The client API this context supports."""
         return ClientAPI(egl.eglQueryContext(self._display, self,
                                              egl.EGL_CONTEXT_CLIENT_TYPE))
-    setattr(Context, 'client_type', property(client_type))
+    setattr(Context, 'client_type', memoised_property(client_type))
 
     def render_buffer(self):
         """Which buffer client APIs will render to."""
-        buffer = RenderBuffer(egl.eglQueryContext(self._display, self,
-                                                  egl.EGL_RENDER_BUFFER))
-        return None if buffer == RenderBuffer.NONE else buffer
+        # A context with no surface bound reports EGL_NONE, which is not a
+        # RenderBuffer member.
+        buffer = egl.eglQueryContext(self._display, self,
+                                     egl.EGL_RENDER_BUFFER)
+        return None if buffer == egl.EGL_NONE else RenderBuffer(buffer)
     setattr(Context, 'render_buffer', property(render_buffer))
 
+    Context._described += ('client_type', 'render_buffer')
+
 
 if egl.egl_version >= (1, 3):
     def client_version(self):
         """The major version of the client API this context supports."""
         return egl.eglQueryContext(self._display, self,
                                    egl.EGL_CONTEXT_CLIENT_VERSION)
-    setattr(Context, 'client_version', property(client_version))
+    setattr(Context, 'client_version', memoised_property(client_version))
     # Alias for consistency with context creation, where as of EGL 1.5,
     # CLIENT_VERSION is renamed to MAJOR_VERSION and MINOR_VERSION is
     # provided alongside.
-    setattr(Context, 'major_version', property(client_version))
+    setattr(Context, 'major_version',
+            property(lambda self: self.client_version,
+                     doc=client_version.__doc__))
+
+    Context._described += ('client_version',)
 
 
 if egl.egl_version >= (1, 4):
@@ -1,13 +1,13 @@
 """Typing stubs for pegl.context"""
 
 # Standard library imports.
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Mapping, Optional
 
 # Local imports.
 from .config import Config
 from .display import Display
-from .enums import (ClientAPI, ImageAttrib, ImageTarget, ReadOrDraw,
-                    RenderBuffer)
+from .enums import (ClientAPI, ContextAttrib, ContextPriority, ImageAttrib,
+                    ImageTarget, ReadOrDraw, ReleaseBehavior, RenderBuffer)
 from .image import Image
 from .surface import Surface
 
@@ -23,7 +23,10 @@ class ContextMeta(type):
 
 
 class Context(metaclass=ContextMeta):
-    def __init__(self, display: Display, handle: Any) -> None: ...
+    verify_binding: bool
+
+    def __init__(self, display: Display, handle: Any,
+                 attribs: Optional[Dict[ContextAttrib, Any]]=None) -> None: ...
 
     def __del__(self) -> None: ...
 
@@ -37,6 +40,11 @@ class Context(metaclass=ContextMeta):
     @classmethod
     def release_current(cls) -> None: ...
 
+    def bound(self, draw: Optional[Surface]=None,
+              read: Optional[Surface]=None) -> ContextManager[Context]: ...
+
+    def describe(self) -> Dict[str, Any]: ...
+
     def create_image(
         self, target: ImageTarget, buffer: int,
         attribs: Optional[Dict[ImageAttrib, Any]]=None) -> Image: ...
@@ -44,6 +52,9 @@ class Context(metaclass=ContextMeta):
     def make_current(self, draw: Optional[Surface]=None,
                      read: Optional[Surface]=None) -> None: ...
 
+    @property
+    def attribs(self) -> Mapping[ContextAttrib, Any]: ...
+
     @property
     def client_type(self) -> ClientAPI: ...
 
@@ -56,6 +67,18 @@ class Context(metaclass=ContextMeta):
     @property
     def config_id(self) -> int: ...
 
+    @property
+    def no_error(self) -> bool: ...
+
+    @property
+    def priority(self) -> Optional[ContextPriority]: ...
+
+    @property
+    def release_behavior(self) -> ReleaseBehavior: ...
+
+    @property
+    def robust(self) -> bool: ...
+
     @property
     def render_buffer(self) -> Optional[RenderBuffer]: ...
 
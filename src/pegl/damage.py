@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""Damage tracking for partial redraws in Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['DamageTracker']
+
+# Standard library imports.
+from collections import deque
+from itertools import islice
+
+def _contains(outer, inner):
+    """Check whether one rectangle lies entirely within another."""
+    ox, oy, ow, oh = outer
+    ix, iy, iw, ih = inner
+    return (ox <= ix and oy <= iy and
+            ix + iw <= ox + ow and iy + ih <= oy + oh)
+
+def _clip(rect, width, height):
+    """Clip a rectangle to a surface, or return None if nothing is left."""
+    x, y, w, h = rect
+    left, bottom = max(x, 0), max(y, 0)
+    right, top = min(x + w, width), min(y + h, height)
+    if right <= left or top <= bottom:
+        return None
+    return (left, bottom, right - left, top - bottom)
+
+class DamageTracker:
+    """Keep track of what changed in recent frames of a window surface.
+
+    Rectangles are (x, y, width, height) tuples, measured from the
+    bottom-left corner of the surface as EGL does.
+
+    """
+    def __init__(self, surface, max_age=4):
+        self.surface = surface
+        self.max_age = max_age
+        # The damage of each posted frame, most recent first.
+        self._history = deque(maxlen=max_age)
+        self._damage = []
+        # The surface size when the last frame was posted.
+        self._size = None
+
+    def add(self, x, y, width, height):
+        """Mark a rectangle as changed in the current frame."""
+        if width > 0 and height > 0:
+            self._damage.append((x, y, width, height))
+
+    def add_all(self):
+        """Mark the whole surface as changed in the current frame."""
+        self._damage = [(0, 0, self.surface.width, self.surface.height)]
+
+    @property
+    def damage(self):
+        """The rectangles changed so far in the current frame."""
+        return list(self._damage)
+
+    def begin_frame(self, age=None):
+        """Get the rectangles to repaint, and limit rendering to them.
+
+        The region is found as for repaint_region(), and then set as the
+        surface's damage region, so that a tiled renderer can skip the
+        rest. Call this after the frame's damage has been added and
+        before anything is drawn.
+
+        """
+        rects = self.repaint_region(age)
+        self.surface.set_damage_region(rects)
+        return rects
+
+    def repaint_region(self, age=None):
+        """Get the rectangles that must be repainted this frame.
+
+        This is the current frame's damage, plus everything that changed
+        since the frame now in the back buffer. If the buffer's age is
+        zero or further back than the history goes, or the surface has
+        been resized, the whole surface must be repainted.
+
+        Keyword arguments:
+            age -- The age of the back buffer. If omitted, the surface's
+                buffer_age is queried.
+
+        """
+        if age is None:
+            age = self.surface.buffer_age
+        size = (self.surface.width, self.surface.height)
+        if age <= 0 or age - 1 > len(self._history) or size != self._size:
+            return [(0, 0) + size]
+
+        rects = list(self._damage)
+        for frame in islice(self._history, age - 1):
+            rects.extend(frame)
+        # Drop duplicates and rectangles covered by another.
+        clipped = []
+        for rect in rects:
+            rect = _clip(rect, *size)
+            if rect is not None and rect not in clipped:
+                clipped.append(rect)
+        return [rect for rect in clipped
+                if not any(other != rect and _contains(other, rect)
+                           for other in clipped)]
+
+    def repaint_bounds(self, age=None):
+        """Get one rectangle enclosing the region to repaint, or None.
+
+        This suits a client API scissor test, which takes only one
+        rectangle. The age is as for repaint_region().
+
+        """
+        rects = self.repaint_region(age)
+        if not rects:
+            return None
+        left = min(x for x, _, _, _ in rects)
+        bottom = min(y for _, y, _, _ in rects)
+        right = max(x + w for x, _, w, _ in rects)
+        top = max(y + h for _, y, _, h in rects)
+        return (left, bottom, right - left, top - bottom)
+
+    def swap_buffers(self):
+        """Post the surface's back buffer, and start a new frame.
+
+        The current frame's damage is passed on to the surface, so that
+        the window system need only update what changed, and is added
+        to the history.
+
+        """
+        size = (self.surface.width, self.surface.height)
+        if size != self._size:
+            # The earlier frames no longer line up with this one.
+            self._history.clear()
+            self._damage = [(0, 0) + size]
+        self.surface.swap_buffers(damage=self._damage)
+        self._history.appendleft(tuple(self._damage))
+        self._damage = []
+        self._size = size
+
+    def reset(self):
+        """Forget all damage, so that the next frame is fully repainted."""
+        self._history.clear()
+        self._damage = []
+        self._size = None
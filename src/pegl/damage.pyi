@@ -0,0 +1,34 @@
+"""Typing stubs for pegl.damage"""
+
+# Standard library imports.
+from typing import List, Optional, Tuple
+
+# Local imports.
+from .surface import Surface
+
+__all__: List[str] = ...
+
+Rect = Tuple[int, int, int, int]
+
+class DamageTracker:
+    surface: Surface
+    max_age: int
+
+    def __init__(self, surface: Surface, max_age: int=...) -> None: ...
+
+    def add(self, x: int, y: int, width: int, height: int) -> None: ...
+
+    def add_all(self) -> None: ...
+
+    def begin_frame(self, age: Optional[int]=...) -> List[Rect]: ...
+
+    @property
+    def damage(self) -> List[Rect]: ...
+
+    def repaint_bounds(self, age: Optional[int]=...) -> Optional[Rect]: ...
+
+    def repaint_region(self, age: Optional[int]=...) -> List[Rect]: ...
+
+    def reset(self) -> None: ...
+
+    def swap_buffers(self) -> None: ...
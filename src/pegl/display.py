@@ -22,16 +22,21 @@
 __all__ = ['Display', 'NoDisplay']
 
 # Standard library imports.
+from concurrent.futures import Future
 from ctypes import ArgumentError
+from threading import Thread
+from time import perf_counter
 from types import MappingProxyType
 
 # Local imports.
 from . import egl
 from .attribs import attrib_list
-from ._caching import cached
+from ._caching import cached, is_stale
+from ._resources import ResourceTracker
+from .enums import ConfigAttrib, ReadOrDraw, SurfaceAttrib, SurfaceTypeFlag
 from .errors import BadDisplayError
 from .config import Config
-from .context import Context
+from .context import Context, _binding
 from .surface import Surface
 
 
@@ -61,6 +66,14 @@ class Display:
         # (which may be called if __init__ fails, say if a display_id was
         # omitted prior to EGL version 1.4).
         self._as_parameter_ = None
+        # The set of supported extensions is fetched when first needed.
+        self._extensions = None
+
+        # Keep count of the objects created on this display. Since this
+        # method runs again whenever a cached display is looked up, don't
+        # lose any counts already made.
+        if not hasattr(self, '_resources'):
+            self._resources = ResourceTracker()
 
         # Specifying a display by its EGLDisplay handle overrides everything
         # else.
@@ -90,6 +103,11 @@ class Display:
             egl.eglInitialize(self)
 
     def __del__(self):
+        # Leave alone any display inherited from a parent process, since its
+        # handle belongs to the parent's EGL state.
+        if is_stale(self):
+            return
+
         # Remove this display from the cache.
         try:
             self.__class__._remove_from_cache(self)
@@ -121,6 +139,7 @@ class Display:
             # thread.
             if egl.egl_version >= (1, 2):
                 egl.eglReleaseThread()
+                _binding.clear()
 
     def __bool__(self):
         return self._as_parameter_ is not egl.EGL_NO_DISPLAY
@@ -156,6 +175,9 @@ class Display:
     @classmethod
     def get_current_display(cls):
         """Get the display for the current context on the calling thread."""
+        if _binding.trusted():
+            return NoDisplay if _binding.display is None else _binding.display
+
         handle = egl.eglGetCurrentDisplay()
         # The mismatch between c_void_p(None) (the value of EGL_NO_DISPLAY) and
         # a plain None is causing issues. So, while it breaks encapsulation,
@@ -189,14 +211,117 @@ class Display:
                                              self, configs[n])
                      for n in range(actual_count))
 
+    def has_extension(self, name):
+        """Check whether this display supports an EGL extension.
+
+        Keyword arguments:
+            name -- The full name of the extension, such as
+                'EGL_KHR_fence_sync'.
+
+        """
+        if self._extensions is None:
+            self._extensions = frozenset(self.extensions.split())
+        return name in self._extensions
+
     def initialize(self):
         """Initialise this display."""
+        self._extensions = None
         return egl.eglInitialize(self)
 
     def terminate(self):
         """Terminate all resources associated with this display."""
+        self._extensions = None
         egl.eglTerminate(self)
 
+    def resource_report(self):
+        """Count the EGL objects created on this display.
+
+        The result is a named tuple with fields contexts, surfaces,
+        images, and syncs, each of which gives the number currently
+        live and the peak number live at once, plus surface_bytes,
+        which is the estimated memory used by the live surfaces.
+
+        """
+        return self._resources.report()
+
+    def warm_up(self, config_attribs=None, context_attribs=None, *, api=None,
+                background=False):
+        """Exercise the slow first-time paths of the EGL implementation.
+
+        Many drivers defer loading and setup work until a context is
+        first created, made current, and released. This method does all
+        of that up front with a throwaway context and a 1×1 pbuffer
+        surface, so that later work does not pay the cost. It returns
+        the time taken, in seconds.
+
+        Keyword arguments:
+            config_attribs -- Attributes used to choose the config, as
+                for choose_config(). Pbuffer support is always added to
+                the requirements.
+            context_attribs -- Attributes used to create the context.
+            api -- The client API to bind before creating the context.
+                If omitted, whatever API is bound in the warming-up
+                thread is used. It is ignored before EGL 1.2.
+            background -- If True, warm up on a new thread and return a
+                concurrent.futures.Future for the time taken. Otherwise,
+                warm up on the calling thread, and then restore whatever
+                binding and client API it had beforehand.
+
+        """
+        if not background:
+            return self._warm_up(config_attribs, context_attribs, api)
+
+        future = Future()
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._warm_up(config_attribs,
+                                                context_attribs, api))
+            except BaseException as e: # pylint: disable=broad-except
+                future.set_exception(e)
+            finally:
+                if egl.egl_version >= (1, 2):
+                    egl.eglReleaseThread()
+        Thread(target=run, name='pegl-warm-up', daemon=True).start()
+        return future
+
+    def _warm_up(self, config_attribs, context_attribs, api):
+        """Do the work of warm_up() on the calling thread."""
+        start = perf_counter()
+
+        attribs = dict(config_attribs or {})
+        attribs[ConfigAttrib.SURFACE_TYPE] = (
+            SurfaceTypeFlag(attribs.get(ConfigAttrib.SURFACE_TYPE, 0)) |
+            SurfaceTypeFlag.PBUFFER)
+        try:
+            config = self.choose_config(attribs, 1)[0]
+        except IndexError:
+            raise ValueError('no config with pbuffer support matches the '
+                             'given attributes') from None
+
+        # Before EGL 1.2, OpenGL ES is the only client API.
+        previous_api = None
+        if api is not None and egl.egl_version >= (1, 2):
+            previous_api = egl.eglQueryAPI()
+            egl.eglBindAPI(api)
+        try:
+            ctx = config.create_context(attribs=context_attribs)
+            surf = config.create_pbuffer_surface({SurfaceAttrib.WIDTH: 1,
+                                                  SurfaceAttrib.HEIGHT: 1})
+            # Restoring the previous binding (or none) releases this one.
+            _binding.save()
+            try:
+                ctx.make_current(surf)
+            finally:
+                _binding.restore()
+            del ctx, surf
+        finally:
+            if previous_api is not None:
+                egl.eglBindAPI(previous_api)
+
+        return perf_counter() - start
+
     @property
     def attribs(self):
         """The attributes used to create this display, if any."""
@@ -240,17 +365,49 @@ def get_current_surface(cls, readdraw): # pylint: disable=unused-argument
     the class properties current_draw_surface and current_read_surface,
     which are syntactic sugar for this method.
 
+    If Pegl made the current binding, the surface is taken from its
+    record, without asking EGL.
+
     """
+    if _binding.trusted():
+        surface = (_binding.read if readdraw == ReadOrDraw.READ else
+                   _binding.draw)
+        return surface if isinstance(surface, Surface) else None
+
     handle = egl.eglGetCurrentSurface(readdraw)
-    return (None if handle == egl.EGL_NO_SURFACE else
-            Surface._new_or_existing((handle,),  # pylint: disable=no-member
-                                     Display.get_current_display(), handle))
+    # A null handle comes back from ctypes as None, not EGL_NO_SURFACE.
+    if handle is None:
+        return None
+    # The current display is only needed for a surface not seen before.
+    surface = Surface._get_existing((handle,)) # pylint: disable=no-member
+    return (surface if surface is not None else
+            Surface(Display.get_current_display(), handle))
 setattr(Context, 'get_current_surface', classmethod(get_current_surface))
 
 def release_current(cls): # pylint: disable=unused-argument
-    """Release the current context for the calling thread."""
-    egl.eglMakeCurrent(Display.get_current_display(), egl.EGL_NO_SURFACE,
-                       egl.EGL_NO_SURFACE, egl.EGL_NO_CONTEXT)
+    """Release the current context for the calling thread.
+
+    Nothing is done if no context is current. When Pegl made the
+    current context current, the display it recorded for that binding
+    is used instead of asking EGL for the current display.
+
+    """
+    if egl.egl_version >= (1, 4):
+        handle = egl.eglGetCurrentContext()
+        if handle is None:
+            _binding.clear()
+            return
+        if (_binding.context is not None and
+            handle == _binding.context._as_parameter_):
+            dpy = _binding.display
+        else:
+            dpy = Display.get_current_display()
+    else:
+        dpy = Display.get_current_display()
+
+    egl.eglMakeCurrent(dpy, egl.EGL_NO_SURFACE, egl.EGL_NO_SURFACE,
+                       egl.EGL_NO_CONTEXT)
+    _binding.clear()
 setattr(Context, 'release_current', classmethod(release_current))
 
 
@@ -282,6 +439,7 @@ if egl.egl_version >= (1, 2):
 
         """
         egl.eglReleaseThread()
+        _binding.clear()
 
     __all__.extend(['release_thread'])
 
@@ -290,10 +448,16 @@ if egl.egl_version >= (1, 4):
     # This is defined here for the same reason as get_current_surface, above.
     def get_current_context(cls):
         """Get the current context for the calling thread."""
+        if _binding.trusted():
+            return _binding.context
+
         handle = egl.eglGetCurrentContext()
-        return (None if handle == egl.EGL_NO_CONTEXT else
-                cls._new_or_existing((handle,), Display.get_current_display(),
-                                     handle))
+        # As for get_current_surface, no context comes back as None.
+        if handle is None:
+            return None
+        ctx = cls._get_existing((handle,))
+        return (ctx if ctx is not None else
+                cls(Display.get_current_display(), handle))
     setattr(Context, 'get_current_context', classmethod(get_current_context))
 
 
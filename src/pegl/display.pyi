@@ -1,13 +1,15 @@
 """Typing stubs for pegl.display"""
 
 # Standard library imports.
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Local imports.
 from .config import Config
 from .context import Context
-from .enums import (ConfigAttrib, DisplayAttrib, ImageAttrib, ImageTarget,
-                    Platform, SyncAttrib, SyncType)
+from .enums import (ClientAPI, ConfigAttrib, ContextAttrib, DisplayAttrib,
+                    ImageAttrib, ImageTarget, Platform, SyncAttrib, SyncType)
+from ._resources import ResourceReport
 from .image import Image
 from .surface import Surface
 from .sync import Sync
@@ -49,10 +51,20 @@ class Display:
     def get_configs(self,
                     num_config: Optional[int]=None) -> Tuple[Config, ...]: ...
 
+    def has_extension(self, name: str) -> bool: ...
+
     def initialize(self) -> Tuple[int, int]: ...
 
+    def resource_report(self) -> ResourceReport: ...
+
     def terminate(self) -> None: ...
 
+    def warm_up(
+        self, config_attribs: Optional[Dict[ConfigAttrib, Any]]=...,
+        context_attribs: Optional[Dict[ContextAttrib, Any]]=...,
+        *, api: Optional[ClientAPI]=...,
+        background: bool=...) -> Union[float, Future[float]]: ...
+
     @property
     def attribs(self) -> Dict[DisplayAttrib, Any]: ...
 
@@ -106,3 +106,8 @@ if requested_version > (1, 0):
                                 __all__.extend(egl1_5_all)
                                 egl_version = (1, 5)
 logger.info('Loaded EGL version %d.%d', *egl_version)
+
+# Extension constants are always loaded, whatever the EGL version.
+from .extensions import *
+from .extensions import __all__ as extensions_all
+__all__.extend(extensions_all)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+'''EGL extension functions and constants for Pegl.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+#
+# This file is based on the header file eglext.h, which carries the following
+# copyright statement and licensing information:
+#
+#     Copyright (c) 2013-2017 The Khronos Group Inc.
+#
+#     Permission is hereby granted, free of charge, to any person obtaining a
+#     copy of this software and/or associated documentation files (the
+#     "Materials"), to deal in the Materials without restriction, including
+#     without limitation the rights to use, copy, modify, merge, publish,
+#     distribute, sublicense, and/or sell copies of the Materials, and to
+#     permit persons to whom the Materials are furnished to do so, subject to
+#     the following conditions:
+#
+#     The above copyright notice and this permission notice shall be included
+#     in all copies or substantial portions of the Materials.
+#
+#     THE MATERIALS ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#     EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#     MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#     IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+#     CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+#     TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+#     MATERIALS OR THE USE OR OTHER DEALINGS IN THE MATERIALS.
+
+# Unlike the core EGL functions, extension functions may be missing even when
+# the library loads. Any that can't be loaded are set to None, and callers must
+# check for that (as well as checking that the display supports the extension).
+# Their constants are always defined.
+
+__all__ = ['EGL_CONTEXT_MAJOR_VERSION_KHR', 'EGL_CONTEXT_MINOR_VERSION_KHR',
+           'EGL_CONTEXT_FLAGS_KHR', 'EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR',
+           'EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR',
+           'EGL_NO_RESET_NOTIFICATION_KHR', 'EGL_LOSE_CONTEXT_ON_RESET_KHR',
+           'EGL_CONTEXT_OPENGL_DEBUG_BIT_KHR',
+           'EGL_CONTEXT_OPENGL_FORWARD_COMPATIBLE_BIT_KHR',
+           'EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR',
+           'EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT_KHR',
+           'EGL_CONTEXT_OPENGL_COMPATIBILITY_PROFILE_BIT_KHR',
+           'EGL_OPENGL_ES3_BIT_KHR',
+           'EGL_CONTEXT_RELEASE_BEHAVIOR_KHR',
+           'EGL_CONTEXT_RELEASE_BEHAVIOR_NONE_KHR',
+           'EGL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR',
+           'EGL_CONTEXT_OPENGL_NO_ERROR_KHR',
+           'EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT',
+           'EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT',
+           'EGL_NO_RESET_NOTIFICATION_EXT', 'EGL_LOSE_CONTEXT_ON_RESET_EXT',
+           'EGL_CONTEXT_PRIORITY_LEVEL_IMG', 'EGL_CONTEXT_PRIORITY_HIGH_IMG',
+           'EGL_CONTEXT_PRIORITY_MEDIUM_IMG', 'EGL_CONTEXT_PRIORITY_LOW_IMG',
+           'EGL_BUFFER_AGE_EXT', 'EGL_BUFFER_AGE_KHR',
+           'eglSwapBuffersWithDamageEXT', 'eglSwapBuffersWithDamageKHR',
+           'eglSetDamageRegionKHR',
+           'EGL_READ_SURFACE_BIT_KHR', 'EGL_WRITE_SURFACE_BIT_KHR',
+           'EGL_LOCK_SURFACE_BIT_KHR', 'EGL_OPTIMAL_FORMAT_BIT_KHR',
+           'EGL_MAP_PRESERVE_PIXELS_KHR', 'EGL_LOCK_USAGE_HINT_KHR',
+           'EGL_BITMAP_POINTER_KHR', 'EGL_BITMAP_PITCH_KHR',
+           'EGL_BITMAP_ORIGIN_KHR', 'EGL_BITMAP_PIXEL_RED_OFFSET_KHR',
+           'EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR',
+           'EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR',
+           'EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR',
+           'EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR',
+           'EGL_BITMAP_PIXEL_SIZE_KHR', 'EGL_LOWER_LEFT_KHR',
+           'EGL_UPPER_LEFT_KHR', 'EGLAttribKHR', 'EGLAttribKHR_p',
+           'eglLockSurfaceKHR', 'eglUnlockSurfaceKHR',
+           'eglQuerySurface64KHR']
+
+# Standard library imports.
+import ctypes
+
+# Local imports.
+from ._common import (_load_function, Arg, EGLAttrib, EGLBoolean, EGLDisplay,
+                      EGLSurface, EGLint, EGLint_p)
+
+# Types used by extensions.
+EGLAttribKHR         = EGLAttrib
+EGLAttribKHR_p       = ctypes.POINTER(EGLAttribKHR)
+
+# EGL_KHR_create_context
+EGL_CONTEXT_MAJOR_VERSION_KHR                      = 0x3098
+EGL_CONTEXT_MINOR_VERSION_KHR                      = 0x30FB
+EGL_CONTEXT_FLAGS_KHR                              = 0x30FC
+EGL_CONTEXT_OPENGL_PROFILE_MASK_KHR                = 0x30FD
+EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_KHR = 0x31BD
+EGL_NO_RESET_NOTIFICATION_KHR                      = 0x31BE
+EGL_LOSE_CONTEXT_ON_RESET_KHR                      = 0x31BF
+EGL_CONTEXT_OPENGL_DEBUG_BIT_KHR                   = 0x00000001
+EGL_CONTEXT_OPENGL_FORWARD_COMPATIBLE_BIT_KHR      = 0x00000002
+EGL_CONTEXT_OPENGL_ROBUST_ACCESS_BIT_KHR           = 0x00000004
+EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT_KHR            = 0x00000001
+EGL_CONTEXT_OPENGL_COMPATIBILITY_PROFILE_BIT_KHR   = 0x00000002
+EGL_OPENGL_ES3_BIT_KHR                             = 0x00000040
+
+# EGL_KHR_context_flush_control
+EGL_CONTEXT_RELEASE_BEHAVIOR_KHR                   = 0x2097
+EGL_CONTEXT_RELEASE_BEHAVIOR_NONE_KHR              = 0
+EGL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR             = 0x2098
+
+# EGL_KHR_create_context_no_error
+EGL_CONTEXT_OPENGL_NO_ERROR_KHR                    = 0x31B3
+
+# EGL_EXT_create_context_robustness
+EGL_CONTEXT_OPENGL_ROBUST_ACCESS_EXT               = 0x30BF
+EGL_CONTEXT_OPENGL_RESET_NOTIFICATION_STRATEGY_EXT = 0x3138
+EGL_NO_RESET_NOTIFICATION_EXT                      = 0x31BE
+EGL_LOSE_CONTEXT_ON_RESET_EXT                      = 0x31BF
+
+# EGL_IMG_context_priority
+EGL_CONTEXT_PRIORITY_LEVEL_IMG                     = 0x3100
+EGL_CONTEXT_PRIORITY_HIGH_IMG                      = 0x3101
+EGL_CONTEXT_PRIORITY_MEDIUM_IMG                    = 0x3102
+EGL_CONTEXT_PRIORITY_LOW_IMG                       = 0x3103
+
+# EGL_EXT_buffer_age
+EGL_BUFFER_AGE_EXT                                 = 0x313D
+
+
+# EGL_EXT_swap_buffers_with_damage
+try:
+    eglSwapBuffersWithDamageEXT = _load_function(
+        'eglSwapBuffersWithDamageEXT', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        (EGLint_p, Arg.IN, 'rects'), (EGLint, Arg.IN, 'n_rects'),
+        error_on=False)
+except ImportError:
+    eglSwapBuffersWithDamageEXT = None
+
+# EGL_KHR_swap_buffers_with_damage
+try:
+    eglSwapBuffersWithDamageKHR = _load_function(
+        'eglSwapBuffersWithDamageKHR', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        (EGLint_p, Arg.IN, 'rects'), (EGLint, Arg.IN, 'n_rects'),
+        error_on=False)
+except ImportError:
+    eglSwapBuffersWithDamageKHR = None
+
+# EGL_KHR_partial_update
+EGL_BUFFER_AGE_KHR                                 = 0x313D
+try:
+    eglSetDamageRegionKHR = _load_function(
+        'eglSetDamageRegionKHR', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        (EGLint_p, Arg.IN, 'rects'), (EGLint, Arg.IN, 'n_rects'),
+        error_on=False)
+except ImportError:
+    eglSetDamageRegionKHR = None
+
+# EGL_KHR_lock_surface3 (including EGL_KHR_lock_surface and _surface2)
+EGL_READ_SURFACE_BIT_KHR                           = 0x0001
+EGL_WRITE_SURFACE_BIT_KHR                          = 0x0002
+EGL_LOCK_SURFACE_BIT_KHR                           = 0x0080
+EGL_OPTIMAL_FORMAT_BIT_KHR                         = 0x0100
+EGL_MAP_PRESERVE_PIXELS_KHR                        = 0x30C4
+EGL_LOCK_USAGE_HINT_KHR                            = 0x30C5
+EGL_BITMAP_POINTER_KHR                             = 0x30C6
+EGL_BITMAP_PITCH_KHR                               = 0x30C7
+EGL_BITMAP_ORIGIN_KHR                              = 0x30C8
+EGL_BITMAP_PIXEL_RED_OFFSET_KHR                    = 0x30C9
+EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR                  = 0x30CA
+EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR                   = 0x30CB
+EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR                  = 0x30CC
+EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR              = 0x30CD
+EGL_BITMAP_PIXEL_SIZE_KHR                          = 0x3110
+EGL_LOWER_LEFT_KHR                                 = 0x30CE
+EGL_UPPER_LEFT_KHR                                 = 0x30CF
+try:
+    eglLockSurfaceKHR = _load_function(
+        'eglLockSurfaceKHR', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        (EGLint_p, Arg.IN, 'attrib_list'),
+        error_on=False)
+    eglUnlockSurfaceKHR = _load_function(
+        'eglUnlockSurfaceKHR', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        error_on=False)
+    eglQuerySurface64KHR = _load_function(
+        'eglQuerySurface64KHR', EGLBoolean,
+        (EGLDisplay, Arg.IN, 'dpy'), (EGLSurface, Arg.IN, 'surface'),
+        (EGLint, Arg.IN, 'attribute'), (EGLAttribKHR_p, Arg.OUT, 'value'),
+        error_on=False)
+except ImportError:
+    eglLockSurfaceKHR = eglUnlockSurfaceKHR = eglQuerySurface64KHR = None
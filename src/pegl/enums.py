@@ -437,5 +437,53 @@ if egl.egl_version >= (1, 5):
         SYNC_CL_EVENT = egl.EGL_SYNC_CL_EVENT
 
     __all__.extend(['DisplayAttrib', 'GLColorspace', 'ImageAttrib',
-                    'ImageTarget', 'Platform', 'SyncAttrib', 'SyncCondition',
-                    'SyncFlag', 'SyncResult', 'SyncType'])
+                    'ImageTarget', 'OpenGLProfileFlag', 'Platform',
+                    'ResetNotificationStrategy', 'SyncAttrib',
+                    'SyncCondition', 'SyncFlag', 'SyncResult', 'SyncType'])
+
+
+# Enumerations for EGL extensions. Their values are always defined, whatever
+# the EGL version, but whether they can be used depends on the display.
+class ContextPriority(IntEnum):
+    """Priority levels for contexts."""
+    HIGH = egl.EGL_CONTEXT_PRIORITY_HIGH_IMG
+    CONTEXT_PRIORITY_HIGH = egl.EGL_CONTEXT_PRIORITY_HIGH_IMG
+    MEDIUM = egl.EGL_CONTEXT_PRIORITY_MEDIUM_IMG
+    CONTEXT_PRIORITY_MEDIUM = egl.EGL_CONTEXT_PRIORITY_MEDIUM_IMG
+    LOW = egl.EGL_CONTEXT_PRIORITY_LOW_IMG
+    CONTEXT_PRIORITY_LOW = egl.EGL_CONTEXT_PRIORITY_LOW_IMG
+
+class ReleaseBehavior(IntEnum):
+    """Whether a context is flushed when it is released."""
+    NONE = egl.EGL_CONTEXT_RELEASE_BEHAVIOR_NONE_KHR
+    CONTEXT_RELEASE_BEHAVIOR_NONE = egl.EGL_CONTEXT_RELEASE_BEHAVIOR_NONE_KHR
+    FLUSH = egl.EGL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR
+    CONTEXT_RELEASE_BEHAVIOR_FLUSH = egl.EGL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR
+
+class BitmapOrigin(IntEnum):
+    """Which corner of a locked surface its bitmap starts from."""
+    LOWER_LEFT = egl.EGL_LOWER_LEFT_KHR
+    UPPER_LEFT = egl.EGL_UPPER_LEFT_KHR
+
+__all__.extend(['BitmapOrigin', 'ContextPriority', 'ReleaseBehavior'])
+
+for name, value in [('LOCK_SURFACE', egl.EGL_LOCK_SURFACE_BIT_KHR),
+                    ('LOCK_SURFACE_BIT', egl.EGL_LOCK_SURFACE_BIT_KHR),
+                    ('OPTIMAL_FORMAT', egl.EGL_OPTIMAL_FORMAT_BIT_KHR),
+                    ('OPTIMAL_FORMAT_BIT', egl.EGL_OPTIMAL_FORMAT_BIT_KHR)]:
+    extend_enum(SurfaceTypeFlag, name, value)
+
+if egl.egl_version >= (1, 2):
+    for name, value in [('RELEASE_BEHAVIOR',
+                         egl.EGL_CONTEXT_RELEASE_BEHAVIOR_KHR),
+                        ('CONTEXT_RELEASE_BEHAVIOR',
+                         egl.EGL_CONTEXT_RELEASE_BEHAVIOR_KHR),
+                        ('PRIORITY_LEVEL',
+                         egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG),
+                        ('CONTEXT_PRIORITY_LEVEL',
+                         egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG),
+                        ('OPENGL_NO_ERROR',
+                         egl.EGL_CONTEXT_OPENGL_NO_ERROR_KHR),
+                        ('CONTEXT_OPENGL_NO_ERROR',
+                         egl.EGL_CONTEXT_OPENGL_NO_ERROR_KHR)]:
+        extend_enum(ContextAttrib, name, value)
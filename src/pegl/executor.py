@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+"""Executing rendering tasks on threads with bound contexts."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['RenderExecutor']
+
+# Standard library imports.
+from collections import namedtuple
+from concurrent.futures import Executor, Future
+from queue import SimpleQueue
+from threading import Lock, Thread
+
+# Local imports.
+from . import egl
+from .context import Context
+from .enums import SurfaceAttrib
+
+class RenderExecutor(Executor):
+    """An executor whose worker threads each have a current context.
+
+    Each worker's context is created from the given config and
+    attributes, and shares objects with the root context. The root
+    context is share_context, if given, or else a new context created
+    from the same config. A worker's context is made current when the
+    worker starts, and stays current until it exits, so submitted tasks
+    can render straight away.
+
+    If surface_attribs is None and the display supports surfaceless
+    contexts, the worker contexts are bound without surfaces. Otherwise,
+    each worker binds its context to a pbuffer surface created with
+    surface_attribs (by default, a 1×1 pbuffer).
+
+    """
+    def __init__(self, config, workers=1, share_context=None, attribs=None,
+                 surface_attribs=None):
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.config = config
+        self.root_context = (config.create_context(attribs=attribs)
+                             if share_context is None else share_context)
+
+        self._queue = SimpleQueue()
+        self._shutdown_lock = Lock()
+        self._shutdown = False
+
+        surfaceless = (surface_attribs is None and
+                       config._display.has_extension(
+                           'EGL_KHR_surfaceless_context'))
+        if surface_attribs is None:
+            surface_attribs = {SurfaceAttrib.WIDTH: 1,
+                               SurfaceAttrib.HEIGHT: 1}
+        api = egl.eglQueryAPI() if egl.egl_version >= (1, 2) else None
+
+        # Contexts and surfaces are created here, so that any errors are
+        # raised in the calling thread.
+        self._threads = []
+        for num in range(workers):
+            ctx = config.create_context(self.root_context, attribs)
+            surf = (None if surfaceless else
+                    config.create_pbuffer_surface(surface_attribs))
+            # The pair is passed in a list, so that the worker can drop its
+            # references before it exits.
+            thread = Thread(target=self._work, args=([ctx, surf], api),
+                            name='pegl-render-{}'.format(num), daemon=True)
+            self._threads.append(thread)
+        del ctx, surf
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, binding, api):
+        """Bind a context in this thread, then run tasks until shut down."""
+        ctx, surf = binding
+        binding.clear()
+        bind_error = None
+        try:
+            if api is not None:
+                egl.eglBindAPI(api)
+            ctx.make_current(surf)
+        except Exception as exc: # pylint: disable=broad-except
+            # Every task given to this worker will fail with this error.
+            bind_error = exc
+
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if bind_error is None:
+                    self._run(*item)
+                elif item[0].set_running_or_notify_cancel():
+                    item[0].set_exception(bind_error)
+                del item
+        finally:
+            if bind_error is None:
+                Context.release_current()
+            del ctx, surf
+            if egl.egl_version >= (1, 2):
+                egl.eglReleaseThread()
+
+    @staticmethod
+    def _run(future, fn, args, kwargs):
+        """Run one task and set its result.
+
+        This is kept out of the worker loop so that exceptions, which are
+        kept by the future, do not keep the worker's context alive.
+
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc: # pylint: disable=broad-except
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def submit(self, fn, *args, **kwargs): # pylint: disable=arguments-differ
+        """Schedule a callable to be run on a worker thread.
+
+        The callable runs with the worker's context current, and the
+        result is available through the returned Future.
+
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'shutdown')
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """Stop accepting tasks, and let the worker threads exit.
+
+        Workers finish the tasks already scheduled, unless cancel_futures
+        is True, in which case tasks that have not started are cancelled.
+        If wait is True, this blocks until all workers have exited.
+
+        """
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                if cancel_futures:
+                    while not self._queue.empty():
+                        item = self._queue.get_nowait()
+                        item[0].cancel()
+                for _ in self._threads:
+                    self._queue.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+if egl.egl_version >= (1, 5):
+    from .sync import _flushed_fence
+
+    Upload = namedtuple('Upload', ['value', 'sync'])
+
+    class ResourceLoader(RenderExecutor):
+        """A worker thread for uploading resources in the background.
+
+        The worker has a loader context that shares objects with the
+        given context, so that textures, buffers, and the like that are
+        created by submitted tasks can then be used with it. Each task is
+        followed by a fence sync, which the render thread can wait on
+        (using Sync.wait_sync) before using what the task uploaded.
+
+        The loader context is created from the given config, or the
+        config of the given context if that is None. The other arguments
+        are as for RenderExecutor.
+
+        """
+        def __init__(self, context, config=None, attribs=None,
+                     surface_attribs=None):
+            super().__init__(context.config if config is None else config,
+                             1, context, attribs, surface_attribs)
+
+        @staticmethod
+        def _upload(fn, args, kwargs):
+            """Run an upload task, and fence the commands it issued."""
+            value = fn(*args, **kwargs)
+            return Upload(value, _flushed_fence(
+                Context.get_current_context()._display))
+
+        def submit(self, fn, *args, **kwargs):
+            """Schedule an upload task to be run on the loader thread.
+
+            The returned Future's result is an Upload, holding the value
+            returned by the task and a fence sync that is signalled when
+            the commands issued by the task have completed.
+
+            """
+            return super().submit(self._upload, fn, args, kwargs)
+
+    __all__.extend(['ResourceLoader', 'Upload'])
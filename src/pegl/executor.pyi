@@ -0,0 +1,44 @@
+"""Typing stubs for pegl.executor"""
+
+# Standard library imports.
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+# Local imports.
+from .config import Config
+from .context import Context
+from .sync import Sync
+
+__all__: List[str] = ...
+
+_T = TypeVar('_T')
+
+
+class RenderExecutor(Executor):
+    config: Config
+    root_context: Context
+
+    def __init__(self, config: Config, workers: int=1,
+                 share_context: Optional[Context]=None,
+                 attribs: Optional[Dict[Any, Any]]=None,
+                 surface_attribs: Optional[Dict[Any, Any]]=None) -> None: ...
+
+    def submit(self, fn: Callable[..., _T], *args: Any,
+               **kwargs: Any) -> Future[_T]: ...
+
+    def shutdown(self, wait: bool=True, *,
+                 cancel_futures: bool=False) -> None: ...
+
+
+class Upload(Generic[_T]):
+    value: _T
+    sync: Sync
+
+
+class ResourceLoader(RenderExecutor):
+    def __init__(self, context: Context, config: Optional[Config]=None,
+                 attribs: Optional[Dict[Any, Any]]=None,
+                 surface_attribs: Optional[Dict[Any, Any]]=None) -> None: ...
+
+    def submit(self, fn: Callable[..., _T], *args: Any,  # type: ignore[override]
+               **kwargs: Any) -> Future[Upload[_T]]: ...
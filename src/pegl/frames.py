@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+"""Frame timing statistics for Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['FrameStats', 'FrameTimer', 'Timings']
+
+# Standard library imports.
+from bisect import bisect_left
+from collections import deque, namedtuple
+from statistics import pstdev
+from threading import Lock
+
+FrameStats = namedtuple('FrameStats', ['frames', 'swap_interval',
+                                       'swap_time', 'work_time', 'frame_time',
+                                       'jitter', 'histogram'])
+
+Timings = namedtuple('Timings', ['mean', 'median', 'p90', 'p99', 'max'])
+
+# The default upper bounds of the histogram bins, in seconds: a frame at
+# 240, 120, 60, 30, 20, or 10 frames per second, and anything slower.
+DEFAULT_BOUNDS = (1/240, 1/120, 1/60, 1/30, 1/20, 1/10, float('inf'))
+
+def _percentile(ordered, fraction):
+    """Interpolate a percentile from a sorted, non-empty list."""
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position -
+                                                                 lower)
+
+def _timings(values):
+    """Summarise a list of times, or return None if it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return Timings(mean=sum(ordered) / len(ordered),
+                   median=_percentile(ordered, 0.5),
+                   p90=_percentile(ordered, 0.9),
+                   p99=_percentile(ordered, 0.99),
+                   max=ordered[-1])
+
+class FrameTimer:
+    """Record the timing of the last few buffer swaps.
+
+    Each swap is recorded by the times (from time.perf_counter) that the
+    swap call started and ended. From these come the time spent in the
+    swap call, which includes any blocking by the driver; the time spent
+    between swaps, which is the program's own work on the frame; and the
+    frame time, which is the interval from one swap's end to the next.
+
+    """
+    def __init__(self, window=120, bounds=None):
+        self.window = window
+        self.bounds = tuple(DEFAULT_BOUNDS if bounds is None else bounds)
+        self._lock = Lock()
+        # (swap time, work time) for each swap, oldest first. The work
+        # time is None for the first swap, since there's no frame before.
+        self._swaps = deque(maxlen=window)
+        self._last_end = None
+
+    def record(self, start, end):
+        """Record a swap that started and ended at the given times."""
+        with self._lock:
+            work = None if self._last_end is None else start - self._last_end
+            self._swaps.append((end - start, work))
+            self._last_end = end
+
+    def reset(self):
+        """Forget all recorded swaps."""
+        with self._lock:
+            self._swaps.clear()
+            self._last_end = None
+
+    def stats(self, swap_interval=None):
+        """Get statistics on the recorded swaps, as a FrameStats tuple.
+
+        Times are in seconds. The histogram is a tuple of (upper bound,
+        count) pairs, counting frame times up to each bound. Jitter is
+        the standard deviation of the frame times. Any statistic that
+        needs more swaps than have been recorded is None.
+
+        Keyword arguments:
+            swap_interval -- The swap interval to report, if known.
+
+        """
+        with self._lock:
+            swaps = list(self._swaps)
+
+        swap_times = [swap for swap, _ in swaps]
+        work_times = [work for _, work in swaps if work is not None]
+        frame_times = [swap + work for swap, work in swaps if work is not None]
+
+        counts = [0] * len(self.bounds)
+        for frame_time in frame_times:
+            counts[min(bisect_left(self.bounds, frame_time),
+                       len(counts) - 1)] += 1
+
+        return FrameStats(frames=len(swaps), swap_interval=swap_interval,
+                          swap_time=_timings(swap_times),
+                          work_time=_timings(work_times),
+                          frame_time=_timings(frame_times),
+                          jitter=(pstdev(frame_times) if frame_times else
+                                  None),
+                          histogram=tuple(zip(self.bounds, counts)))
@@ -0,0 +1,40 @@
+"""Typing stubs for pegl.frames"""
+
+# Standard library imports.
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+__all__: List[str] = ...
+
+DEFAULT_BOUNDS: Tuple[float, ...]
+
+
+class Timings(NamedTuple):
+    mean: float
+    median: float
+    p90: float
+    p99: float
+    max: float
+
+
+class FrameStats(NamedTuple):
+    frames: int
+    swap_interval: Optional[int]
+    swap_time: Optional[Timings]
+    work_time: Optional[Timings]
+    frame_time: Optional[Timings]
+    jitter: Optional[float]
+    histogram: Tuple[Tuple[float, int], ...]
+
+
+class FrameTimer:
+    window: int
+    bounds: Tuple[float, ...]
+
+    def __init__(self, window: int=...,
+                 bounds: Optional[Sequence[float]]=...) -> None: ...
+
+    def record(self, start: float, end: float) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def stats(self, swap_interval: Optional[int]=...) -> FrameStats: ...
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+"""Sharing rendered frames between contexts through EGL images."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = []
+
+# Standard library imports.
+from contextlib import contextmanager
+from queue import Empty, Queue
+from threading import Lock
+
+# Local imports.
+from . import egl
+from ._gl import (check_error, gl_function, GL_LINEAR, GL_RGBA,
+                  GL_TEXTURE_2D, GL_TEXTURE_BINDING_2D, GL_TEXTURE_MAG_FILTER,
+                  GL_TEXTURE_MIN_FILTER, GL_UNSIGNED_BYTE, GLint, GLuint)
+from .context import Context
+
+if egl.egl_version >= (1, 5):
+    from .enums import ImageAttrib, ImageTarget
+    from .sync import _flushed_fence
+
+    @contextmanager
+    def _texture_bound(texture):
+        """Bind a 2D texture, restoring the previous binding afterwards."""
+        previous = GLint()
+        gl_function('glGetIntegerv')(GL_TEXTURE_BINDING_2D, previous)
+        gl_function('glBindTexture')(GL_TEXTURE_2D, texture)
+        try:
+            yield
+        finally:
+            gl_function('glBindTexture')(GL_TEXTURE_2D, previous.value)
+
+    def export_texture(context, texture, level=0):
+        """Create an image from a 2D texture of the given context.
+
+        The texture is given by its client API name, and must be
+        complete. The image and the texture share the same pixels.
+
+        """
+        return context.create_image(ImageTarget.GL_TEXTURE_2D, texture,
+                                    {ImageAttrib.GL_TEXTURE_LEVEL: level})
+
+    def import_image(image, texture=None):
+        """Make a 2D texture of the current context share an image's pixels.
+
+        The texture is given by its client API name. If it is None, a
+        new texture is created. Either way, its name is returned. This
+        needs the GL_OES_EGL_image extension to the client API.
+
+        """
+        if texture is None:
+            name = GLuint()
+            gl_function('glGenTextures')(1, name)
+            texture = name.value
+        with _texture_bound(texture):
+            gl_function('glEGLImageTargetTexture2DOES')(GL_TEXTURE_2D, image)
+            gl_function('glTexParameteri')(GL_TEXTURE_2D,
+                                           GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            gl_function('glTexParameteri')(GL_TEXTURE_2D,
+                                           GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        check_error('importing image')
+        return texture
+
+    class HandoffFrame:
+        """One frame of a handoff pool.
+
+        The producer renders into texture, a texture of the producer
+        context. The image shares its pixels, and consumer_texture is the
+        same pixels imported into the consumer's context.
+
+        """
+        def __init__(self, texture, image, width, height):
+            self.texture = texture
+            self.image = image
+            self.width = width
+            self.height = height
+            self.tag = None
+            self.consumer_texture = None
+            # The fence that must be waited on before the next stage
+            # uses the frame.
+            self._sync = None
+            # The texture imported into each consumer context.
+            self._imported = {}
+
+    class HandoffPool:
+        """Pass rendered frames from one context to another without copies.
+
+        The pool holds n_slots frames, each a texture of the producer
+        context shared through an EGL image. The producer acquires a
+        frame, renders into it, and submits it; the consumer, in another
+        context (typically on another thread), receives the frame, uses
+        it as a texture of its own, and releases it back to the pool.
+        Fence syncs keep each stage from touching a frame before the
+        other has finished with it, without either thread waiting on the
+        GPU.
+
+        The producer context must be current when the pool is created.
+
+        """
+        def __init__(self, context, width, height, n_slots=3):
+            if context is not Context.get_current_context():
+                raise ValueError('the producer context must be current')
+            self.context = context
+            self.width = width
+            self.height = height
+            self.n_slots = n_slots
+            self._closed = False
+            self._lock = Lock()
+
+            names = (GLuint * n_slots)()
+            gl_function('glGenTextures')(n_slots, names)
+            for name in names:
+                with _texture_bound(name):
+                    gl_function('glTexImage2D')(GL_TEXTURE_2D, 0, GL_RGBA,
+                                                width, height, 0, GL_RGBA,
+                                                GL_UNSIGNED_BYTE, None)
+                    # Without mipmaps, the texture is only complete if its
+                    # minification filter doesn't use them.
+                    gl_function('glTexParameteri')(GL_TEXTURE_2D,
+                                                   GL_TEXTURE_MIN_FILTER,
+                                                   GL_LINEAR)
+            check_error('creating textures')
+
+            self._names = names
+            self.frames = [HandoffFrame(name, export_texture(context, name),
+                                        width, height)
+                           for name in names]
+            self._free = Queue()
+            self._ready = Queue()
+            for frame in self.frames:
+                self._free.put(frame)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.close()
+
+        def _check_open(self):
+            """Raise an exception if the pool is closed."""
+            if self._closed:
+                raise ValueError('handoff pool is closed')
+
+        @staticmethod
+        def _take(queue, timeout):
+            """Take a frame from a queue, and wait for its fence."""
+            try:
+                frame = queue.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError('no frame became available') from None
+            if frame._sync is not None:
+                frame._sync.wait_sync()
+                frame._sync = None
+            return frame
+
+        def acquire(self, timeout=None):
+            """Get a free frame for the producer to render into.
+
+            This must be called with the producer context current. It
+            waits until a frame is released, if none is free, and raises
+            TimeoutError if none is released within the timeout.
+
+            """
+            self._check_open()
+            return self._take(self._free, timeout)
+
+        def submit(self, frame, tag=None):
+            """Pass a frame that has been rendered on to the consumer.
+
+            This must be called with the producer context current. The
+            tag is attached to the frame.
+
+            """
+            self._check_open()
+            frame.tag = tag
+            frame._sync = _flushed_fence(self.context._display)
+            self._ready.put(frame)
+
+        def receive(self, timeout=None):
+            """Get the next submitted frame, for the consumer to use.
+
+            This must be called with the consumer context current. The
+            frame's consumer_texture is set to a texture of that context
+            sharing the frame's pixels. Rendering by the producer is
+            complete before the consumer's commands use it.
+
+            """
+            self._check_open()
+            frame = self._take(self._ready, timeout)
+            context = Context.get_current_context()
+            with self._lock:
+                texture = frame._imported.get(context)
+                if texture is None:
+                    texture = import_image(frame.image)
+                    frame._imported[context] = texture
+            frame.consumer_texture = texture
+            return frame
+
+        def release(self, frame):
+            """Return a frame that the consumer has finished with.
+
+            This must be called with the consumer context current. The
+            frame is not rendered into again until the consumer's
+            commands using it are complete.
+
+            """
+            self._check_open()
+            frame.consumer_texture = None
+            frame._sync = _flushed_fence(
+                Context.get_current_context()._display)
+            self._free.put(frame)
+
+        @contextmanager
+        def receiving(self, timeout=None):
+            """Receive a frame for the duration of a with block."""
+            frame = self.receive(timeout)
+            try:
+                yield frame
+            finally:
+                self.release(frame)
+
+        def close_consumer(self):
+            """Delete the textures imported into the current context."""
+            context = Context.get_current_context()
+            with self._lock:
+                names = [frame._imported.pop(context)
+                         for frame in self.frames
+                         if context in frame._imported]
+            if names:
+                gl_function('glDeleteTextures')(len(names),
+                                                (GLuint * len(names))(*names))
+
+        def close(self):
+            """Delete the frames' images and producer textures.
+
+            This must be called with the producer context current, after
+            the consumer has finished with the frames. Textures imported
+            by consumers keep the pixels alive until they are deleted,
+            which can be done with close_consumer().
+
+            """
+            if self._closed:
+                return
+            self._closed = True
+            for frame in self.frames:
+                frame.image = frame._sync = None
+            gl_function('glDeleteTextures')(self.n_slots, self._names)
+
+    __all__.extend(['HandoffFrame', 'HandoffPool', 'export_texture',
+                    'import_image'])
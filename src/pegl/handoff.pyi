@@ -0,0 +1,61 @@
+"""Typing stubs for pegl.handoff"""
+
+# Standard library imports.
+from types import TracebackType
+from typing import Any, ContextManager, List, Optional, Type
+
+# Local imports.
+from .context import Context
+from .image import Image
+
+__all__: List[str] = ...
+
+
+def export_texture(context: Context, texture: int,
+                   level: int=...) -> Image: ...
+
+def import_image(image: Image, texture: Optional[int]=...) -> int: ...
+
+
+class HandoffFrame:
+    texture: int
+    image: Optional[Image]
+    width: int
+    height: int
+    tag: Any
+    consumer_texture: Optional[int]
+
+    def __init__(self, texture: int, image: Image, width: int,
+                 height: int) -> None: ...
+
+
+class HandoffPool:
+    context: Context
+    width: int
+    height: int
+    n_slots: int
+    frames: List[HandoffFrame]
+
+    def __init__(self, context: Context, width: int, height: int,
+                 n_slots: int=...) -> None: ...
+
+    def __enter__(self) -> HandoffPool: ...
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None: ...
+
+    def acquire(self, timeout: Optional[float]=...) -> HandoffFrame: ...
+
+    def submit(self, frame: HandoffFrame, tag: Any=...) -> None: ...
+
+    def receive(self, timeout: Optional[float]=...) -> HandoffFrame: ...
+
+    def release(self, frame: HandoffFrame) -> None: ...
+
+    def receiving(self, timeout: Optional[float]=...
+                  ) -> ContextManager[HandoffFrame]: ...
+
+    def close_consumer(self) -> None: ...
+
+    def close(self) -> None: ...
@@ -23,6 +23,7 @@ __all__ = []
 
 # Local imports.
 from . import egl
+from ._caching import is_stale, stamp
 
 if egl.egl_version >= (1, 5):
     __all__.extend(['Image'])
@@ -38,5 +39,14 @@ if egl.egl_version >= (1, 5):
             self._display = display
             self._as_parameter_ = handle
 
+            # Images aren't cached, but they still need to know if they were
+            # inherited across a fork.
+            stamp(self)
+            display._resources.add('images', self)
+
         def __del__(self):
+            # Leave alone any image inherited from a parent process.
+            if is_stale(self):
+                return
+
             egl.eglDestroyImage(self._display, self)
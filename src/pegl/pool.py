@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+
+"""Pools of reusable EGL objects."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['ContextPool', 'PoolStats', 'SurfacePool', 'SurfacePoolStats']
+
+# Standard library imports.
+from bisect import bisect_left
+from collections import OrderedDict, deque, namedtuple
+from contextlib import contextmanager
+from threading import Condition, Lock, Thread
+from time import monotonic
+
+# Local imports.
+from . import egl
+from .context import Context, _binding
+from .surface import _estimate_bytes
+
+PoolStats = namedtuple('PoolStats', ['size', 'idle', 'in_use', 'peak_in_use',
+                                     'created', 'evicted', 'resets',
+                                     'checkouts', 'waits', 'timeouts',
+                                     'total_wait', 'max_wait', 'utilisation'])
+
+SurfacePoolStats = namedtuple('SurfacePoolStats',
+                              ['idle', 'in_use', 'idle_bytes', 'created',
+                               'evicted', 'hits', 'misses', 'hit_rate'])
+
+class ContextPool:
+    """A pool of rendering contexts that can be checked out and returned.
+
+    Contexts are created with the given config, attributes, and share
+    context, up to a maximum of max_size at once (or without limit, if
+    that is None). A background thread keeps at least min_size contexts
+    in the pool, and destroys contexts that have been idle for more than
+    idle_timeout seconds (if that is not None), down to min_size.
+
+    Contexts are created for the client API that is bound in the thread
+    that creates the pool, regardless of the thread that actually
+    creates them. If priority is not None, each context is created with
+    that ContextPriority (if supported), so separate pools can serve
+    jobs of different priorities.
+
+    """
+    def __init__(self, config, attribs=None, share_context=None, *,
+                 min_size=0, max_size=None, idle_timeout=None,
+                 priority=None):
+        if max_size is not None and max_size < max(min_size, 1):
+            raise ValueError('max_size must be at least 1 and at least '
+                             'min_size')
+        self.config = config
+        self.attribs = attribs
+        self.share_context = share_context
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.priority = priority
+
+        self._api = (egl.eglQueryAPI() if egl.egl_version >= (1, 2) else
+                     None)
+        self._cond = Condition()
+        self._closed = False
+        # Idle contexts, paired with the time they were returned. New
+        # check-outs take from the right; evictions take from the left.
+        self._idle = deque()
+        self._in_use = set()
+        # Checked-out contexts that are to be destroyed, not reused, when
+        # they are returned.
+        self._discard = set()
+        # The number of contexts in the pool, including any that are still
+        # being created.
+        self._size = 0
+
+        self._created = self._evicted = self._resets = 0
+        self._checkouts = self._waits = self._timeouts = 0
+        self._total_wait = self._max_wait = 0.0
+        self._peak_in_use = 0
+        self._start_time = self._last_change = monotonic()
+        self._busy_time = 0.0
+
+        if min_size > 0 or idle_timeout is not None:
+            self._thread = Thread(target=self._maintain,
+                                  name='pegl-context-pool', daemon=True)
+            self._thread.start()
+        else:
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create(self):
+        """Create a new context for the pool.
+
+        This is called without holding the lock.
+
+        """
+        if self._api is None or egl.eglQueryAPI() == self._api:
+            return self.config.create_context(self.share_context,
+                                              self.attribs,
+                                              priority=self.priority)
+
+        previous_api = egl.eglQueryAPI()
+        egl.eglBindAPI(self._api)
+        try:
+            return self.config.create_context(self.share_context,
+                                              self.attribs,
+                                              priority=self.priority)
+        finally:
+            egl.eglBindAPI(previous_api)
+
+    def _tally_busy_time(self):
+        """Add up the time spent with contexts checked out.
+
+        This must be called, while holding the lock, whenever the number
+        of contexts in use changes.
+
+        """
+        now = monotonic()
+        self._busy_time += len(self._in_use) * (now - self._last_change)
+        self._last_change = now
+
+    def _maintain(self):
+        """Prewarm the pool and evict idle contexts, until closed."""
+        if self._api is not None:
+            egl.eglBindAPI(self._api)
+        try:
+            while True:
+                with self._cond:
+                    if self._closed:
+                        return
+                    evicted = self._evict_idle()
+                    grow = self._kept_size() < self.min_size
+                    if grow:
+                        self._size += 1
+                    elif not evicted:
+                        self._cond.wait(self._next_eviction())
+                        continue
+                # Let evicted contexts be destroyed outside the lock.
+                del evicted
+                if grow:
+                    self._add_new()
+        finally:
+            if egl.egl_version >= (1, 2):
+                egl.eglReleaseThread()
+
+    def _add_new(self):
+        """Create a context and put it in the pool as idle.
+
+        The pool's size must already have been increased to allow for it.
+
+        """
+        resets = self._resets
+        try:
+            ctx = self._create()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._created += 1
+            if not self._closed and self._resets == resets:
+                self._idle.append((ctx, monotonic()))
+                self._cond.notify_all()
+                return
+            # The pool was closed or reset while the context was being
+            # created, so it can't be kept.
+            self._size -= 1
+            self._cond.notify_all()
+        # Let the context be destroyed outside the lock.
+        del ctx
+
+    def _kept_size(self):
+        """Count the contexts that are not to be discarded on return."""
+        return self._size - len(self._discard)
+
+    def _evict_idle(self):
+        """Remove contexts that have been idle for too long.
+
+        This must be called while holding the lock. The evicted contexts
+        are returned, so that the caller can let them be destroyed after
+        releasing the lock.
+
+        """
+        evicted = []
+        if self.idle_timeout is None:
+            return evicted
+
+        cutoff = monotonic() - self.idle_timeout
+        while (self._idle and self._kept_size() > self.min_size and
+               self._idle[0][1] <= cutoff):
+            evicted.append(self._idle.popleft()[0])
+            self._size -= 1
+        self._evicted += len(evicted)
+        return evicted
+
+    def _next_eviction(self):
+        """Get the time to wait before the next idle context expires.
+
+        If no idle context can be evicted, this is None (that is, wait
+        until a context is returned to the pool).
+
+        """
+        if (self.idle_timeout is None or not self._idle or
+            self._kept_size() <= self.min_size):
+            return None
+        return max(self._idle[0][1] + self.idle_timeout - monotonic(), 0)
+
+    def acquire(self, timeout=None):
+        """Check out a context from the pool.
+
+        If no context is idle and the pool is at its maximum size, wait
+        until one is released, or until the timeout (in seconds, or None
+        to wait indefinitely) expires. In the latter case, TimeoutError
+        is raised.
+
+        """
+        start = monotonic()
+        deadline = None if timeout is None else start + timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ValueError('context pool is closed')
+                if self._idle:
+                    ctx = self._idle.pop()[0]
+                    break
+                if self.max_size is None or self._size < self.max_size:
+                    ctx = None
+                    self._size += 1
+                    break
+
+                remaining = (None if deadline is None else
+                             deadline - monotonic())
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    raise TimeoutError('no context became available')
+                waited = True
+                self._cond.wait(remaining)
+
+            self._checkouts += 1
+            if waited:
+                wait = monotonic() - start
+                self._waits += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            if ctx is not None:
+                self._check_out(ctx)
+                return ctx
+            resets = self._resets
+
+        try:
+            ctx = self._create()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._created += 1
+            self._check_out(ctx)
+            if self._resets != resets:
+                # The pool was reset while the context was being created,
+                # so it can be used but not kept.
+                self._discard.add(ctx)
+        return ctx
+
+    def _check_out(self, ctx):
+        """Mark a context as in use. This must be called with the lock."""
+        self._tally_busy_time()
+        self._in_use.add(ctx)
+        self._peak_in_use = max(self._peak_in_use, len(self._in_use))
+
+    def release(self, ctx):
+        """Return a context to the pool.
+
+        If the context is current in the calling thread, it is released
+        from the thread first. A context that is still current in some
+        other thread must be released from that thread before it can be
+        used again.
+
+        """
+        if (_binding.context is ctx or
+            (egl.egl_version >= (1, 4) and
+             egl.eglGetCurrentContext() == ctx._as_parameter_)):
+            Context.release_current()
+
+        with self._cond:
+            if ctx not in self._in_use:
+                raise ValueError('context was not checked out of this pool')
+            self._tally_busy_time()
+            self._in_use.remove(ctx)
+            if self._closed or ctx in self._discard:
+                self._discard.discard(ctx)
+                self._size -= 1
+            else:
+                self._idle.append((ctx, monotonic()))
+            self._cond.notify_all()
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """Check out a context for the duration of a with block.
+
+        The timeout is as for acquire(). The context is returned to the
+        pool when the block ends.
+
+        """
+        ctx = self.acquire(timeout)
+        try:
+            yield ctx
+        finally:
+            self.release(ctx)
+
+    def close(self):
+        """Close the pool and destroy its idle contexts.
+
+        Contexts that are checked out at the time are destroyed when
+        they are returned. The pool cannot be used after it is closed.
+
+        """
+        with self._cond:
+            self._closed = True
+            idle = [ctx for ctx, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        del idle
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def reset(self, share_context=None):
+        """Discard every context in the pool, such as after a reset.
+
+        Idle contexts are destroyed at once, and contexts that are checked
+        out are destroyed when they are returned. New contexts are then
+        created as needed (and the pool is prewarmed again, if it has a
+        minimum size).
+
+        Keyword arguments:
+            share_context -- An optional context to share objects with in
+                place of the pool's current share context, which will not
+                be usable if it too was lost.
+
+        """
+        with self._cond:
+            if share_context is not None:
+                self.share_context = share_context
+            idle = [ctx for ctx, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._discard.update(self._in_use)
+            self._resets += 1
+            self._cond.notify_all()
+        del idle
+
+    def stats(self):
+        """Get statistics for sizing the pool.
+
+        The waits count and times refer to check-outs that had to wait
+        for a context to be returned. The utilisation is the average
+        number of contexts in use over the life of the pool, as a
+        fraction of the maximum size (or of the peak number in use, if
+        there is no maximum size).
+
+        """
+        with self._cond:
+            self._tally_busy_time()
+            elapsed = self._last_change - self._start_time
+            capacity = (self.max_size if self.max_size is not None else
+                        self._peak_in_use)
+            utilisation = (self._busy_time / (elapsed * capacity)
+                           if elapsed > 0 and capacity > 0 else 0.0)
+            return PoolStats(size=self._size, idle=len(self._idle),
+                             in_use=len(self._in_use),
+                             peak_in_use=self._peak_in_use,
+                             created=self._created, evicted=self._evicted,
+                             resets=self._resets,
+                             checkouts=self._checkouts, waits=self._waits,
+                             timeouts=self._timeouts,
+                             total_wait=self._total_wait,
+                             max_wait=self._max_wait,
+                             utilisation=utilisation)
+
+
+class SurfacePool:
+    """A pool of pbuffer surfaces, reused by config, size and attributes.
+
+    Requested sizes are rounded up to a bucket, so that a surface can be
+    reused for any request that fits within it. By default, the buckets
+    are powers of two; otherwise, buckets is a sequence of sizes, and a
+    request larger than all of them is not rounded.
+
+    Idle surfaces are kept until their estimated memory use exceeds
+    max_bytes (if that is not None), after which the least recently
+    used are destroyed.
+
+    """
+    def __init__(self, *, buckets=None, max_bytes=None):
+        self.buckets = None if buckets is None else sorted(buckets)
+        self.max_bytes = max_bytes
+
+        self._lock = Lock()
+        self._closed = False
+        # Idle surfaces, mapped to their keys, from least to most recently
+        # used, and the same surfaces grouped by key.
+        self._idle = OrderedDict()
+        self._idle_by_key = {}
+        # Checked-out surfaces, mapped to their keys.
+        self._in_use = {}
+        # Checked-out surfaces that are to be destroyed, not reused, when
+        # they are returned.
+        self._discard = set()
+        # The estimated memory use of each surface in the pool.
+        self._bytes = {}
+        self._idle_bytes = 0
+
+        self._created = self._evicted = 0
+        self._hits = self._misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def bucket(self, size):
+        """Round a width or height up to its bucket."""
+        if self.buckets is None:
+            return 1 << max(size - 1, 0).bit_length()
+        index = bisect_left(self.buckets, size)
+        return self.buckets[index] if index < len(self.buckets) else size
+
+    def _key(self, config, width, height, attribs):
+        """Get the key for surfaces that can serve a request."""
+        extra = frozenset(() if attribs is None else
+                          ((key, value) for key, value in attribs.items()
+                           if key not in (egl.EGL_WIDTH, egl.EGL_HEIGHT)))
+        return config, self.bucket(width), self.bucket(height), extra
+
+    def _evict(self):
+        """Remove least recently used surfaces until within the memory cap.
+
+        This must be called while holding the lock. The evicted surfaces
+        are returned, so that the caller can let them be destroyed after
+        releasing the lock.
+
+        """
+        evicted = []
+        while (self._idle and self.max_bytes is not None and
+               self._idle_bytes > self.max_bytes):
+            surface, key = self._idle.popitem(last=False)
+            self._take_idle(surface, key)
+            del self._bytes[surface]
+            evicted.append(surface)
+        self._evicted += len(evicted)
+        return evicted
+
+    def _take_idle(self, surface, key):
+        """Remove an idle surface from the lookup by key and memory count.
+
+        This must be called while holding the lock.
+
+        """
+        same_key = self._idle_by_key[key]
+        same_key.remove(surface)
+        if not same_key:
+            del self._idle_by_key[key]
+        self._idle_bytes -= self._bytes[surface]
+
+    def acquire(self, config, width, height, attribs=None):
+        """Check out a pbuffer surface of at least the given size.
+
+        The surface is created from the given config, with the given
+        attributes (apart from the width and height, which are rounded
+        up to their buckets). It may be larger than was asked for, and
+        its contents are undefined.
+
+        """
+        key = self._key(config, width, height, attribs)
+        with self._lock:
+            if self._closed:
+                raise ValueError('surface pool is closed')
+            same_key = self._idle_by_key.get(key)
+            if same_key:
+                surface = same_key[-1]
+                self._take_idle(surface, key)
+                del self._idle[surface]
+                self._in_use[surface] = key
+                self._hits += 1
+                return surface
+            self._misses += 1
+
+        _, bucket_width, bucket_height, extra = key
+        surface_attribs = dict(extra)
+        surface_attribs[egl.EGL_WIDTH] = bucket_width
+        surface_attribs[egl.EGL_HEIGHT] = bucket_height
+        surface = config.create_pbuffer_surface(surface_attribs)
+        nbytes = _estimate_bytes(config, bucket_width, bucket_height)
+        with self._lock:
+            self._created += 1
+            self._bytes[surface] = nbytes
+            self._in_use[surface] = key
+        return surface
+
+    def release(self, surface):
+        """Return a surface to the pool."""
+        with self._lock:
+            try:
+                key = self._in_use.pop(surface)
+            except KeyError:
+                raise ValueError('surface was not checked out of this '
+                                 'pool') from None
+            if self._closed or surface in self._discard:
+                self._discard.discard(surface)
+                del self._bytes[surface]
+                evicted = [surface]
+            else:
+                self._idle[surface] = key
+                self._idle_by_key.setdefault(key, []).append(surface)
+                self._idle_bytes += self._bytes[surface]
+                evicted = self._evict()
+        # Let evicted surfaces be destroyed outside the lock.
+        del evicted, surface
+
+    @contextmanager
+    def checkout(self, config, width, height, attribs=None):
+        """Check out a surface for the duration of a with block.
+
+        The arguments are as for acquire(). The surface is returned to
+        the pool when the block ends.
+
+        """
+        surface = self.acquire(config, width, height, attribs)
+        try:
+            yield surface
+        finally:
+            self.release(surface)
+
+    def _drop_idle(self):
+        """Remove all idle surfaces, and return them.
+
+        This must be called while holding the lock.
+
+        """
+        idle = list(self._idle)
+        for surface in idle:
+            del self._bytes[surface]
+        self._idle.clear()
+        self._idle_by_key.clear()
+        self._idle_bytes = 0
+        return idle
+
+    def close(self):
+        """Close the pool and destroy its idle surfaces.
+
+        Surfaces that are checked out at the time are destroyed when
+        they are returned. The pool cannot be used after it is closed.
+
+        """
+        with self._lock:
+            self._closed = True
+            idle = self._drop_idle()
+        del idle
+
+    def reset(self):
+        """Discard every surface in the pool.
+
+        Idle surfaces are destroyed at once, and surfaces that are
+        checked out are destroyed when they are returned.
+
+        """
+        with self._lock:
+            idle = self._drop_idle()
+            self._discard.update(self._in_use)
+        del idle
+
+    def stats(self):
+        """Get statistics on the reuse of surfaces.
+
+        The hit rate is the fraction of check-outs that reused an idle
+        surface.
+
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return SurfacePoolStats(
+                idle=len(self._idle), in_use=len(self._in_use),
+                idle_bytes=self._idle_bytes, created=self._created,
+                evicted=self._evicted, hits=self._hits, misses=self._misses,
+                hit_rate=self._hits / requests if requests else 0.0)
@@ -0,0 +1,109 @@
+"""Typing stubs for pegl.pool"""
+
+# Standard library imports.
+from typing import (Any, ContextManager, Dict, List, NamedTuple, Optional,
+                    Sequence, Type)
+from types import TracebackType
+
+# Local imports.
+from .config import Config
+from .context import Context
+from .enums import ContextPriority, SurfaceAttrib
+from .surface import Surface
+
+__all__: List[str] = ...
+
+
+class PoolStats(NamedTuple):
+    size: int
+    idle: int
+    in_use: int
+    peak_in_use: int
+    created: int
+    evicted: int
+    resets: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    total_wait: float
+    max_wait: float
+    utilisation: float
+
+
+class SurfacePoolStats(NamedTuple):
+    idle: int
+    in_use: int
+    idle_bytes: int
+    created: int
+    evicted: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class ContextPool:
+    config: Config
+    attribs: Optional[Dict[Any, Any]]
+    share_context: Optional[Context]
+    min_size: int
+    max_size: Optional[int]
+    idle_timeout: Optional[float]
+    priority: Optional[ContextPriority]
+
+    def __init__(self, config: Config,
+                 attribs: Optional[Dict[Any, Any]]=None,
+                 share_context: Optional[Context]=None, *, min_size: int=0,
+                 max_size: Optional[int]=None,
+                 idle_timeout: Optional[float]=None,
+                 priority: Optional[ContextPriority]=None) -> None: ...
+
+    def __enter__(self) -> ContextPool: ...
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None: ...
+
+    def acquire(self, timeout: Optional[float]=None) -> Context: ...
+
+    def release(self, ctx: Context) -> None: ...
+
+    def checkout(self,
+                 timeout: Optional[float]=None) -> ContextManager[Context]: ...
+
+    def close(self) -> None: ...
+
+    def reset(self, share_context: Optional[Context]=None) -> None: ...
+
+    def stats(self) -> PoolStats: ...
+
+
+class SurfacePool:
+    buckets: Optional[List[int]]
+    max_bytes: Optional[int]
+
+    def __init__(self, *, buckets: Optional[Sequence[int]]=None,
+                 max_bytes: Optional[int]=None) -> None: ...
+
+    def __enter__(self) -> SurfacePool: ...
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None: ...
+
+    def bucket(self, size: int) -> int: ...
+
+    def acquire(self, config: Config, width: int, height: int,
+                attribs: Optional[Dict[SurfaceAttrib, Any]]=None) -> Surface: ...
+
+    def release(self, surface: Surface) -> None: ...
+
+    def checkout(
+        self, config: Config, width: int, height: int,
+        attribs: Optional[Dict[SurfaceAttrib, Any]]=None
+        ) -> ContextManager[Surface]: ...
+
+    def close(self) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def stats(self) -> SurfacePoolStats: ...
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+"""Asynchronous pixel readback for Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = []
+
+# Standard library imports.
+from collections import deque
+import ctypes
+from threading import Lock
+
+# Local imports.
+from . import egl
+from ._gl import (check_error, gl_function, GL_MAP_READ_BIT,
+                  GL_PIXEL_PACK_BUFFER, GL_RGBA, GL_STREAM_READ,
+                  GL_UNSIGNED_BYTE, GLuint)
+from .context import Context
+
+if egl.egl_version >= (1, 5):
+    from .sync import _flushed_fence
+
+    class ReadbackFrame:
+        """The pixels of one frame, read back into host memory.
+
+        The pixels are RGBA, one byte per component, with the bottom
+        row first. The buffer attribute is a memoryview of them. When
+        the frame has been dealt with, release it so that its memory can
+        be reused for a later frame.
+
+        """
+        def __init__(self, queue, tag, width, height, data):
+            self.tag = tag
+            self.width = width
+            self.height = height
+            self.buffer = memoryview(data)
+            self._queue = queue
+            self._data = data
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.release()
+
+        def as_array(self):
+            """Get a NumPy array viewing the pixels, without copying them.
+
+            The array has shape (height, width, 4), with unsigned bytes
+            as elements. NumPy must be installed to use this.
+
+            """
+            import numpy # pylint: disable=import-outside-toplevel
+            return numpy.frombuffer(self.buffer, dtype=numpy.uint8).reshape(
+                self.height, self.width, 4)
+
+        def release(self):
+            """Give the frame's memory back to the queue for reuse.
+
+            If any other views of the buffer (such as arrays from
+            as_array) still exist, the memory is left to them instead.
+
+            """
+            if self._data is None:
+                return
+            try:
+                self.buffer.release()
+                # Resizing fails if any other views still exist.
+                self._data.append(0)
+            except BufferError:
+                pass
+            else:
+                self._data.pop()
+                self._queue._give_back(self._data)
+            self._data = None
+
+    class ReadbackQueue:
+        """Read back rendered frames without waiting for each one.
+
+        Each readback copies the pixels into one of a ring of pixel pack
+        buffers on the GPU, and is followed by a fence sync. The frames
+        are then collected in order, once their fences are signalled,
+        into host buffers taken from a pool. Rendering can therefore go
+        on while earlier frames are still being read back.
+
+        The source is the surface to read from, or a context whose
+        current read surface is to be read from. Either way, the context
+        must be current when the queue is created and used, and must
+        support pixel pack buffers (OpenGL 2.1 or OpenGL ES 3.0).
+
+        """
+        def __init__(self, source, n_slots=3):
+            if isinstance(source, Context):
+                context, surface = source, Context.current_read_surface
+            else:
+                context, surface = Context.get_current_context(), source
+            if (context is None or
+                    context is not Context.get_current_context()):
+                raise ValueError('the context must be current')
+            if surface is None:
+                raise ValueError('no surface to read from')
+
+            self.context = context
+            self.width = surface.width
+            self.height = surface.height
+            self.n_slots = n_slots
+            self._size = self.width * self.height * 4
+            self._closed = False
+
+            names = (GLuint * n_slots)()
+            gl_function('glGenBuffers')(n_slots, names)
+            for name in names:
+                gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, name)
+                gl_function('glBufferData')(GL_PIXEL_PACK_BUFFER, self._size,
+                                            None, GL_STREAM_READ)
+            gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, 0)
+            check_error('creating pixel pack buffers')
+
+            self._names = names
+            self._free = deque(names)
+            # Readbacks in flight, as (buffer name, sync, tag), oldest first.
+            self._pending = deque()
+            # Frames already collected but not yet taken.
+            self._ready = deque()
+            self._spare_lock = Lock()
+            self._spare = [bytearray(self._size) for _ in range(n_slots)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.close()
+
+        def __len__(self):
+            return len(self._pending) + len(self._ready)
+
+        def _check_open(self):
+            """Raise an exception if the queue is closed."""
+            if self._closed:
+                raise ValueError('readback queue is closed')
+
+        def _give_back(self, data):
+            """Return a host buffer to the pool."""
+            with self._spare_lock:
+                self._spare.append(data)
+
+        def _collect(self, name, sync, tag):
+            """Wait for a readback, and copy it into a host buffer."""
+            sync.client_wait_sync()
+            with self._spare_lock:
+                data = (self._spare.pop() if self._spare else
+                        bytearray(self._size))
+
+            gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, name)
+            pixels = gl_function('glMapBufferRange')(
+                GL_PIXEL_PACK_BUFFER, 0, self._size, GL_MAP_READ_BIT)
+            if pixels is None:
+                gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, 0)
+                self._free.append(name)
+                self._give_back(data)
+                check_error('mapping pixel pack buffer')
+                raise RuntimeError('mapping pixel pack buffer failed')
+            ctypes.memmove((ctypes.c_char * self._size).from_buffer(data),
+                           pixels, self._size)
+            gl_function('glUnmapBuffer')(GL_PIXEL_PACK_BUFFER)
+            gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, 0)
+
+            self._free.append(name)
+            return ReadbackFrame(self, tag, self.width, self.height, data)
+
+        def read(self, tag=None):
+            """Start reading back the current contents of the surface.
+
+            This returns without waiting for the pixels, unless every
+            buffer in the ring is in use, in which case the oldest
+            readback is collected first (and kept for get to return).
+
+            Keyword arguments:
+                tag -- Any value, which is attached to the frame so that
+                    it can be identified when collected.
+
+            """
+            self._check_open()
+            if not self._free:
+                self._ready.append(self._collect(*self._pending.popleft()))
+
+            name = self._free.popleft()
+            gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, name)
+            gl_function('glReadPixels')(0, 0, self.width, self.height,
+                                        GL_RGBA, GL_UNSIGNED_BYTE, None)
+            gl_function('glBindBuffer')(GL_PIXEL_PACK_BUFFER, 0)
+            try:
+                check_error('reading pixels')
+            except RuntimeError:
+                self._free.appendleft(name)
+                raise
+
+            sync = _flushed_fence(self.context._display)
+            self._pending.append((name, sync, tag))
+
+        def get(self, block=False):
+            """Get the oldest frame that has been read back.
+
+            Frames are returned in the order they were read. If the
+            oldest is not yet complete, None is returned, unless block
+            is True, in which case this waits for it. None is also
+            returned if there are no frames to get.
+
+            """
+            self._check_open()
+            if self._ready:
+                return self._ready.popleft()
+            if not self._pending:
+                return None
+            if not block and not self._pending[0][1].sync_status:
+                return None
+            return self._collect(*self._pending.popleft())
+
+        def drain(self):
+            """Wait for and yield every remaining frame, in order."""
+            while self:
+                yield self.get(block=True)
+
+        def close(self):
+            """Discard any readbacks in flight and free the GPU buffers.
+
+            The context must be current. Frames that have already been
+            returned remain valid.
+
+            """
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.clear()
+            self._ready.clear()
+            gl_function('glDeleteBuffers')(self.n_slots, self._names)
+
+    __all__.extend(['ReadbackFrame', 'ReadbackQueue'])
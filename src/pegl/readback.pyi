@@ -0,0 +1,57 @@
+"""Typing stubs for pegl.readback"""
+
+# Standard library imports.
+from types import TracebackType
+from typing import Any, Iterator, List, Optional, Type, Union
+
+# Local imports.
+from .context import Context
+from .surface import Surface
+
+__all__: List[str] = ...
+
+
+class ReadbackFrame:
+    tag: Any
+    width: int
+    height: int
+    buffer: memoryview
+
+    def __init__(self, queue: ReadbackQueue, tag: Any, width: int,
+                 height: int, data: bytearray) -> None: ...
+
+    def __enter__(self) -> ReadbackFrame: ...
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None: ...
+
+    def as_array(self) -> Any: ...
+
+    def release(self) -> None: ...
+
+
+class ReadbackQueue:
+    context: Context
+    width: int
+    height: int
+    n_slots: int
+
+    def __init__(self, source: Union[Surface, Context],
+                 n_slots: int=...) -> None: ...
+
+    def __enter__(self) -> ReadbackQueue: ...
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def close(self) -> None: ...
+
+    def drain(self) -> Iterator[ReadbackFrame]: ...
+
+    def get(self, block: bool=...) -> Optional[ReadbackFrame]: ...
+
+    def read(self, tag: Any=...) -> None: ...
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+"""Recovery from lost contexts for Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['ResetRecovery']
+
+# Standard library imports.
+from contextlib import contextmanager
+import logging
+from threading import Lock
+
+# Local imports.
+from .context import Context
+from .errors import ContextLostError, EGLError
+
+# Set up logging with the module name.
+logger = logging.getLogger(__name__)
+
+class ResetRecovery:
+    """Detect lost contexts, and recreate what was lost.
+
+    Contexts are lost after a GPU reset or a power management event,
+    which EGL reports by raising ContextLostError from whichever call
+    first notices. When that happens during a guarded call, every
+    registered resource (such as a ContextPool) is reset, so that it
+    creates new contexts with the same config, and then every callback
+    is called, so that the application can recreate its own objects.
+
+    However many threads notice the same loss, recovery is done once.
+
+    """
+    def __init__(self, max_retries=1):
+        self.max_retries = max_retries
+        self._lock = Lock()
+        self._resources = []
+        self._callbacks = []
+        # The number of recoveries so far.
+        self.generation = 0
+
+    def register(self, resource, share_context=None):
+        """Reset a resource when recovering.
+
+        The resource must have a reset() method. It is returned, so that
+        this can be used when creating it.
+
+        Keyword arguments:
+            share_context -- An optional function (with no arguments)
+                that creates a new context for the resource to share
+                objects with, in place of one that was lost along with
+                the rest. If given, its result is passed to the
+                resource's reset() method as share_context; otherwise,
+                reset() is called with no arguments.
+
+        """
+        with self._lock:
+            self._resources.append((resource, share_context))
+        return resource
+
+    def unregister(self, resource):
+        """Stop resetting a resource when recovering."""
+        with self._lock:
+            for index, (registered, _) in enumerate(self._resources):
+                if registered is resource:
+                    del self._resources[index]
+                    return
+        raise ValueError('resource is not registered')
+
+    def on_reset(self, callback):
+        """Call a function (with no arguments) after recovering.
+
+        The callback is returned, so that this can be used as a
+        decorator.
+
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def recover(self, generation=None):
+        """Reset all registered resources, and notify the callbacks.
+
+        Keyword arguments:
+            generation -- The value of the generation attribute when the
+                failed work began. If recovery has happened since then,
+                nothing more is done. If omitted, recovery always happens.
+
+        The return value is True if recovery was done by this call.
+
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+
+            logger.warning('Context lost; recovering (generation %d)',
+                           self.generation)
+            # The lost context can't stay current in this thread.
+            try:
+                Context.release_current()
+            except EGLError:
+                pass
+
+            for resource, share_context in self._resources:
+                if share_context is None:
+                    resource.reset()
+                else:
+                    resource.reset(share_context=share_context())
+            self.generation += 1
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback()
+        return True
+
+    @contextmanager
+    def guard(self):
+        """Recover if a context is lost during a with block.
+
+        The ContextLostError is raised again after recovering, so that the
+        caller knows the work in the block was not done.
+
+        """
+        generation = self.generation
+        try:
+            yield self
+        except ContextLostError:
+            self.recover(generation)
+            raise
+
+    def call(self, fn, *args, **kwargs):
+        """Call a function, recovering and retrying if a context is lost.
+
+        The function is retried up to max_retries times before the
+        ContextLostError is allowed to propagate.
+
+        """
+        retries = self.max_retries
+        while True:
+            generation = self.generation
+            try:
+                return fn(*args, **kwargs)
+            except ContextLostError:
+                self.recover(generation)
+                if retries <= 0:
+                    raise
+                retries -= 1
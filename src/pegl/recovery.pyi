@@ -0,0 +1,33 @@
+"""Typing stubs for pegl.recovery"""
+
+# Standard library imports.
+from typing import Any, Callable, ContextManager, List, Optional, TypeVar
+
+# Local imports.
+from .context import Context
+
+__all__: List[str] = ...
+
+_T = TypeVar('_T')
+_F = TypeVar('_F', bound=Callable[[], Any])
+
+
+class ResetRecovery:
+    generation: int
+    max_retries: int
+
+    def __init__(self, max_retries: int=...) -> None: ...
+
+    def call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T: ...
+
+    def guard(self) -> ContextManager[ResetRecovery]: ...
+
+    def on_reset(self, callback: _F) -> _F: ...
+
+    def recover(self, generation: Optional[int]=...) -> bool: ...
+
+    def register(self, resource: _T,
+                 share_context: Optional[Callable[[], Context]]=...
+                 ) -> _T: ...
+
+    def unregister(self, resource: Any) -> None: ...
@@ -19,23 +19,167 @@
 # You should have received a copy of the GNU General Public License
 # along with Pegl. If not, see <http://www.gnu.org/licenses/>.
 
-__all__ = ['Surface']
+__all__ = ['LockedBitmap', 'Surface']
+
+# Standard library imports.
+from contextlib import contextmanager
+import ctypes
+from functools import partial
+from itertools import chain
+import sys
+from time import perf_counter
 
 # Local imports.
 from . import egl
-from ._caching import cached
-from .errors import BadSurfaceError
+from .attribs import attrib_list
+from ._caching import cached, is_stale, memoised_property
+from .egl._common import EGLint
+from .enums import BitmapOrigin, SurfaceTypeFlag
+from .errors import BadAccessError, BadSurfaceError
+from .frames import FrameTimer
+
+def _fixed_size(surface):
+    """Check whether a surface's size is known never to change."""
+    return surface.surface_type in (SurfaceTypeFlag.PBUFFER,
+                                    SurfaceTypeFlag.PIXMAP)
+
+def _rect_array(rects):
+    """Convert rectangles to an array of EGLint, and count them.
+
+    The rectangles may be a sequence of (x, y, width, height) sequences,
+    or an object supporting the buffer protocol (such as an N×4 NumPy
+    array of int32) with four native-order 32-bit integers for each
+    rectangle. A writable buffer is used without copying it.
+
+    """
+    try:
+        view = memoryview(rects)
+    except TypeError:
+        # Not a buffer, so it's a sequence.
+        values = list(chain.from_iterable(rects))
+        count, extra = divmod(len(values), 4)
+        if extra:
+            raise ValueError('rectangles must have four values each')
+        return (EGLint * len(values))(*values) if count else None, count
+
+    if (view.itemsize != ctypes.sizeof(EGLint) or
+            view.format.lstrip('@=') not in ('i', 'l')):
+        raise TypeError('rectangles must be 32-bit integers')
+    if not view.c_contiguous:
+        raise ValueError('rectangle buffer must be contiguous')
+    count, extra = divmod(view.nbytes // view.itemsize, 4)
+    if extra:
+        raise ValueError('rectangles must have four values each')
+    if not count:
+        return None, 0
+
+    array_type = EGLint * (count * 4)
+    if view.readonly:
+        return array_type.from_buffer_copy(view), count
+    return array_type.from_buffer(view), count
+
+def _estimate_bytes(config, width, height):
+    """Estimate the memory used by a surface of a config and size."""
+    bits_per_pixel = (config.buffer_size + config.depth_size +
+                      config.stencil_size) * max(config.samples, 1)
+    return (width * height * bits_per_pixel + 7) // 8
+
+def _swap_with_damage(display):
+    """Get the function for swapping with damage, or None if unsupported."""
+    if (egl.eglSwapBuffersWithDamageKHR is not None and
+            display.has_extension('EGL_KHR_swap_buffers_with_damage')):
+        return egl.eglSwapBuffersWithDamageKHR
+    if (egl.eglSwapBuffersWithDamageEXT is not None and
+            display.has_extension('EGL_EXT_swap_buffers_with_damage')):
+        return egl.eglSwapBuffersWithDamageEXT
+    return None
+
+class LockedBitmap:
+    """The pixels of a locked surface, mapped into memory.
+
+    The buffer attribute is a memoryview of the mapped bytes, which are
+    used directly rather than copied. Each row of pixels starts pitch
+    bytes after the one before, and each pixel is pixel_size bits, with
+    its components at the given bit offsets. Neither the buffer nor any
+    view of it may be used once the surface is unlocked, and unlocking
+    raises BufferError if any view (such as a slice, or an array from
+    as_array()) is still alive then.
+
+    """
+    def __init__(self, surface):
+        query = partial(egl.eglQuerySurface64KHR, surface._display, surface)
+        self.width = surface.width
+        self.height = surface.height
+        self.pitch = query(egl.EGL_BITMAP_PITCH_KHR)
+        self.origin = BitmapOrigin(query(egl.EGL_BITMAP_ORIGIN_KHR))
+        self.pixel_size = query(egl.EGL_BITMAP_PIXEL_SIZE_KHR)
+        self.red_offset = query(egl.EGL_BITMAP_PIXEL_RED_OFFSET_KHR)
+        self.green_offset = query(egl.EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR)
+        self.blue_offset = query(egl.EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR)
+        self.alpha_offset = query(egl.EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR)
+        self.luminance_offset = query(
+            egl.EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR)
+
+        # The pixels are mapped when the pointer is first queried.
+        pointer = query(egl.EGL_BITMAP_POINTER_KHR)
+        self._bytes = (ctypes.c_ubyte *
+                       (self.pitch * self.height)).from_address(pointer)
+        self.buffer = memoryview(self._bytes).cast('B')
+
+    def as_array(self):
+        """Get a NumPy array viewing the pixels, without copying them.
+
+        The array has shape (height, width, bytes per pixel), with the
+        rows in memory order (see the origin attribute), and unsigned
+        bytes as elements. It must be deleted before the surface is
+        unlocked; copy it first to keep the pixels. NumPy must be
+        installed to use this.
+
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+        pixel_bytes = self.pixel_size // 8
+        return numpy.ndarray((self.height, self.width, pixel_bytes),
+                             dtype=numpy.uint8, buffer=self.buffer,
+                             strides=(self.pitch, pixel_bytes, 1))
+
+    def _release(self):
+        """Stop the buffer being used after the surface is unlocked.
+
+        BufferError is raised if other views of the mapped bytes are
+        still alive, since they can't be stopped from using them.
+
+        """
+        mapped, self._bytes = self._bytes, None
+        # This fails if anything has exported the buffer itself...
+        self.buffer.release()
+        # ...but slices of it don't count as exports, and only show up as
+        # references to the mapped bytes (besides this one and the call's).
+        if sys.getrefcount(mapped) > 2:
+            raise BufferError('views of the locked pixels are still alive')
 
 @cached('_as_parameter_')
 class Surface:
     """A rendering surface."""
-    def __init__(self, display, handle):
+    # The properties reported by describe(). Later versions add more.
+    _described = ('surface_type', 'config_id', 'width', 'height',
+                  'largest_pbuffer')
+
+    def __init__(self, display, handle, surface_type=None):
         self._display = display
         self._as_parameter_ = handle
+        self._surface_type = surface_type
+        # Swap timings are only recorded on request.
+        self._frame_timer = None
 
         self.__class__._add_to_cache(self) # pylint: disable=no-member
+        display._resources.add('surfaces', self)
 
     def __del__(self):
+        # Leave alone any surface inherited from a parent process, since its
+        # handle belongs to the parent's EGL state.
+        if is_stale(self):
+            return
+
         # Remove this surface from the cache.
         try:
             self.__class__._remove_from_cache(self)
@@ -58,14 +202,142 @@ class Surface:
         """Copy the color buffer of this surface to a native pixmap."""
         egl.eglCopyBuffers(self._display, self, target)
 
-    def swap_buffers(self, target):
+    @contextmanager
+    def lock(self, read=True, write=False, preserve_pixels=False):
+        """Map this surface's pixels into memory for a with block.
+
+        The surface is locked and a LockedBitmap describing its pixels
+        is returned, so that they can be read or written directly by the
+        CPU without copying. It is unlocked when the block ends. Only
+        surfaces created from a config with the LOCK_SURFACE surface
+        type can be locked, and client APIs can't render to them while
+        they are locked.
+
+        The surface is always unlocked when the block ends, but if any
+        view of the pixels is still alive by then, BufferError is raised
+        afterwards, since that view now points at unmapped memory and
+        must not be used.
+
+        Keyword arguments:
+            read -- Whether the pixels will be read.
+            write -- Whether the pixels will be written.
+            preserve_pixels -- Whether the mapped pixels must hold the
+                surface's contents (when reading them) or be written
+                back in full (when writing them).
+
+        """
+        if (egl.eglLockSurfaceKHR is None or
+                not self._display.has_extension('EGL_KHR_lock_surface3')):
+            raise BadAccessError('surface locking is not supported')
+
+        usage = ((egl.EGL_READ_SURFACE_BIT_KHR if read else 0) |
+                 (egl.EGL_WRITE_SURFACE_BIT_KHR if write else 0))
+        egl.eglLockSurfaceKHR(self._display, self, attrib_list(
+            {egl.EGL_LOCK_USAGE_HINT_KHR: usage,
+             egl.EGL_MAP_PRESERVE_PIXELS_KHR: preserve_pixels}))
+        bitmap = None
+        try:
+            bitmap = LockedBitmap(self)
+            yield bitmap
+        finally:
+            try:
+                if bitmap is not None:
+                    bitmap._release()
+            finally:
+                egl.eglUnlockSurfaceKHR(self._display, self)
+
+    def set_damage_region(self, rects):
+        """Limit this frame's rendering to the given rectangles.
+
+        This lets tiled renderers skip loading and storing the tiles
+        that won't change. It must be called after the back buffer's
+        age is queried and before anything is drawn in the frame, and
+        only once per frame. Anything drawn outside the rectangles may
+        be lost. The rectangles are as for swap_buffers(). If the
+        display doesn't support partial updates, nothing is done.
+
+        """
+        if (egl.eglSetDamageRegionKHR is None or
+                not self._display.has_extension('EGL_KHR_partial_update')):
+            return
+        rects, count = _rect_array(rects)
+        egl.eglSetDamageRegionKHR(self._display, self, rects, count)
+
+    def swap_buffers(self, damage=None):
         """Post the surface's back buffer to the window.
 
         This method is valid, but has no effect, on pbuffer, pixmap, and
         single-buffered window surfaces.
 
+        Keyword arguments:
+            damage -- The rectangles that changed since the last frame,
+                as (x, y, width, height) from the bottom left, so that
+                the window system need only update those. This may be a
+                sequence of rectangles, or a buffer of 32-bit integers,
+                four for each rectangle. If omitted, or if the display
+                doesn't support swapping with damage, the whole surface
+                is posted.
+
         """
-        egl.eglSwapBuffers(self._display, self, target)
+        swap, args = egl.eglSwapBuffers, ()
+        if damage is not None:
+            damage_swap = _swap_with_damage(self._display)
+            if damage_swap is not None:
+                swap, args = damage_swap, _rect_array(damage)
+
+        timer = self._frame_timer
+        if timer is None:
+            swap(self._display, self, *args)
+        else:
+            start = perf_counter()
+            swap(self._display, self, *args)
+            timer.record(start, perf_counter())
+
+    def track_frames(self, window=120):
+        """Start or stop recording the timing of buffer swaps.
+
+        Keyword arguments:
+            window -- How many of the latest swaps to keep statistics
+                on. If this is None, recording stops. Otherwise, any
+                earlier recording is discarded.
+
+        """
+        self._frame_timer = None if window is None else FrameTimer(window)
+
+    def frame_stats(self):
+        """Get statistics on the latest buffer swaps, if recorded.
+
+        The return value is a FrameStats tuple, or None if swaps are not
+        being recorded (see track_frames).
+
+        """
+        timer = self._frame_timer
+        if timer is None:
+            return None
+        return timer.stats(getattr(self._display, 'swap_interval', None))
+
+    def describe(self):
+        """Get a snapshot of this surface's properties, as a dict.
+
+        Properties that can't change are only queried once, and then
+        remembered, whether they are read here or individually.
+
+        """
+        return {name: getattr(self, name) for name in self._described}
+
+    @property
+    def buffer_age(self):
+        """How many frames old the back buffer's contents are.
+
+        Zero means the contents are undefined, as they always are if
+        the display can't report the age.
+
+        """
+        if not (self._display.has_extension('EGL_EXT_buffer_age') or
+                self._display.has_extension('EGL_KHR_partial_update')):
+            return 0
+        return egl.eglQuerySurface(self._display, self,
+                                   egl.EGL_BUFFER_AGE_EXT)
 
     @property
     def config(self):
@@ -73,26 +345,43 @@ class Surface:
         # Implemented in pegl.config to avoid dependency problems.
         raise NotImplementedError # pragma: nocover
 
-    @property
+    @memoised_property
     def config_id(self):
         """The unique ID of the config used to create this surface."""
         return egl.eglQuerySurface(self._display, self, egl.EGL_CONFIG_ID)
 
-    @property
     def height(self):
         """The height in pixels of this surface."""
         return egl.eglQuerySurface(self._display, self, egl.EGL_HEIGHT)
+    # Window surfaces can be resized, so only other sizes are remembered.
+    height = memoised_property(height, when=_fixed_size)
 
     @property
+    def memory_estimate(self):
+        """A rough estimate of the memory used by this surface, in bytes.
+
+        The estimate allows for the color, depth, and stencil buffers of
+        the surface's config, at one sample per pixel or at the number
+        of samples used for multisampling, whichever is more.
+
+        """
+        return _estimate_bytes(self.config, self.width, self.height)
+
+    @memoised_property
     def largest_pbuffer(self):
         """Could the largest available pbuffer be returned as a fallback?"""
         return bool(egl.eglQuerySurface(self._display, self,
                                         egl.EGL_LARGEST_PBUFFER))
 
     @property
+    def surface_type(self):
+        """Whether this is a pbuffer, pixmap, or window surface, if known."""
+        return self._surface_type
+
     def width(self):
         """The width in pixels of this surface."""
         return egl.eglQuerySurface(self._display, self, egl.EGL_WIDTH)
+    width = memoised_property(width, when=_fixed_size)
 
 
 if egl.egl_version >= (1, 1):
@@ -139,7 +428,7 @@ if egl.egl_version >= (1, 1):
         """Should storage be allocated for OpenGL ES mipmaps?"""
         return bool(egl.eglQuerySurface(self._display, self,
                                         egl.EGL_MIPMAP_TEXTURE))
-    setattr(Surface, 'mipmap_texture', property(mipmap_texture))
+    setattr(Surface, 'mipmap_texture', memoised_property(mipmap_texture))
 
     def render_buffer(self):
         """The buffer that client APIs are requested to render to."""
@@ -151,13 +440,16 @@ if egl.egl_version >= (1, 1):
         """The OpenGL ES texture format used when binding this surface."""
         fmt = egl.eglQuerySurface(self._display, self, egl.EGL_TEXTURE_FORMAT)
         return None if fmt == egl.EGL_NO_TEXTURE else TextureFormat(fmt)
-    setattr(Surface, 'texture_format', property(texture_format))
+    setattr(Surface, 'texture_format', memoised_property(texture_format))
 
     def texture_target(self):
         """The OpenGL ES texture target used when binding this surface."""
         tgt = egl.eglQuerySurface(self._display, self, egl.EGL_TEXTURE_TARGET)
         return None if tgt == egl.EGL_NO_TEXTURE else TextureTarget(tgt)
-    setattr(Surface, 'texture_target', property(texture_target))
+    setattr(Surface, 'texture_target', memoised_property(texture_target))
+
+    Surface._described += ('mipmap_level', 'mipmap_texture', 'render_buffer',
+                           'texture_format', 'texture_target')
 
 
 if egl.egl_version >= (1, 2):
@@ -193,6 +485,9 @@ if egl.egl_version >= (1, 2):
                 scaled_value / egl.EGL_DISPLAY_SCALING)
     setattr(Surface, 'vertical_resolution', property(vertical_resolution))
 
+    Surface._described += ('horizontal_resolution', 'pixel_aspect_ratio',
+                           'swap_behavior', 'vertical_resolution')
+
 
 if egl.egl_version >= (1, 4):
     from .enums import MultisampleResolve
@@ -208,3 +503,5 @@ if egl.egl_version >= (1, 4):
                              method)
     setattr(Surface, 'multisample_resolve',
             property(get_multisample_resolve, set_multisample_resolve))
+
+    Surface._described += ('multisample_resolve',)
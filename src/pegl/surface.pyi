@@ -1,18 +1,39 @@
 """Typing stubs for pegl.surface"""
 
 # Standard library imports.
-from typing import Any, List, Optional
+from typing import (Any, ContextManager, Dict, List, Optional, Sequence,
+                    Union)
 
 __all__: List[str] = ...
 
 # Local imports.
 from .config import Config
 from .display import Display
-from .enums import (MultisampleResolve, RenderBuffer, SwapBehavior,
-                    TextureFormat, TextureTarget)
+from .enums import (BitmapOrigin, MultisampleResolve, RenderBuffer,
+                    SurfaceTypeFlag, SwapBehavior, TextureFormat,
+                    TextureTarget)
+from .frames import FrameStats
+
+class LockedBitmap:
+    buffer: memoryview
+    width: int
+    height: int
+    pitch: int
+    origin: BitmapOrigin
+    pixel_size: int
+    red_offset: int
+    green_offset: int
+    blue_offset: int
+    alpha_offset: int
+    luminance_offset: int
+
+    def __init__(self, surface: Surface) -> None: ...
+
+    def as_array(self) -> Any: ...
 
 class Surface:
-    def __init__(self, display: Display, handle: Any) -> None: ...
+    def __init__(self, display: Display, handle: Any,
+                 surface_type: Optional[SurfaceTypeFlag]=...) -> None: ...
 
     def __del__(self) -> None: ...
 
@@ -20,9 +41,25 @@ class Surface:
 
     def copy_buffers(self, target: int) -> None: ...
 
+    def describe(self) -> Dict[str, Any]: ...
+
+    def frame_stats(self) -> Optional[FrameStats]: ...
+
     def release_tex_image(self, buffer: RenderBuffer=...) -> None: ...
 
-    def swap_buffers(self, target: int) -> None: ...
+    def lock(self, read: bool=..., write: bool=...,
+             preserve_pixels: bool=...) -> ContextManager[LockedBitmap]: ...
+
+    def set_damage_region(self, rects: Union[Sequence[Sequence[int]],
+                                             Any]) -> None: ...
+
+    def swap_buffers(self, damage: Optional[Union[Sequence[Sequence[int]],
+                                                 Any]]=...) -> None: ...
+
+    def track_frames(self, window: Optional[int]=...) -> None: ...
+
+    @property
+    def buffer_age(self) -> int: ...
 
     @property
     def config(self) -> Config: ...
@@ -39,6 +76,9 @@ class Surface:
     @property
     def largest_pbuffer(self) -> bool: ...
 
+    @property
+    def memory_estimate(self) -> int: ...
+
     @property
     def mipmap_level(self) -> int: ...
     @mipmap_level.setter
@@ -61,6 +101,9 @@ class Surface:
     @property
     def swap_behavior(self) -> SwapBehavior: ...
 
+    @property
+    def surface_type(self) -> Optional[SurfaceTypeFlag]: ...
+
     @property
     def texture_format(self) -> Optional[TextureFormat]: ...
 
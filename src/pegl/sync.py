@@ -23,7 +23,9 @@ __all__ = ['wait_gl', 'wait_native']
 
 # Local imports.
 from . import egl
+from ._caching import is_stale, stamp
 from .enums import NativeEngine
+from .errors import BadParameterError
 
 def wait_gl():
     """Instruct native rendering to wait on any OpenGL ES rendering.
@@ -68,6 +70,21 @@ if egl.egl_version >= (1, 5):
             self._as_parameter_ = handle
             self._display = display
 
+            stamp(self)
+            display._resources.add('syncs', self)
+
+        def __del__(self):
+            # Leave alone any sync inherited from a parent process.
+            if is_stale(self):
+                return
+
+            try:
+                egl.eglDestroySync(self._display, self)
+            except BadParameterError:
+                # This instance has an invalid handle, so there's nothing to
+                # destroy.
+                pass
+
         def client_wait_sync(self, flags=SyncFlag.NONE, timeout=None):
             """Block the calling thread, waiting on this sync.
 
@@ -97,8 +114,9 @@ if egl.egl_version >= (1, 5):
         @property
         def sync_status(self):
             """Is this sync object signaled?"""
-            return bool(egl.eglGetSyncAttrib(self._display, self,
-                                             egl.EGL_SYNC_STATUS))
+            return (egl.eglGetSyncAttrib(self._display, self,
+                                         egl.EGL_SYNC_STATUS) ==
+                    egl.EGL_SIGNALED)
 
         @property
         def sync_type(self):
@@ -106,4 +124,15 @@ if egl.egl_version >= (1, 5):
             return SyncType(egl.eglGetSyncAttrib(self._display, self,
                                                  egl.EGL_SYNC_TYPE))
 
+    def _flushed_fence(display):
+        """Create a fence sync in the current context, and flush it.
+
+        The flush is done without waiting, so that the fence can be
+        signalled without the calling thread doing any more work.
+
+        """
+        sync = display.create_sync(SyncType.FENCE)
+        sync.client_wait_sync(SyncFlag.FLUSH_COMMANDS, 0)
+        return sync
+
     __all__.extend(['Sync'])
@@ -13,6 +13,8 @@ __all__: List[str] = ...
 class Sync:
     def __init__(self, display: Display, handle: Any) -> None: ...
 
+    def __del__(self) -> None: ...
+
     def client_wait_sync(self, flags: SyncFlag=...,
                          timeout: Optional[int]=...) -> SyncResult: ...
 
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+"""Tiled rendering of large images for Pegl."""
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+__all__ = ['Tile', 'TiledRenderer', 'split_tiles']
+
+# Standard library imports.
+from collections import namedtuple
+import ctypes
+import os
+from threading import Lock
+
+# Local imports.
+from ._gl import check_error, gl_function, GL_RGBA, GL_UNSIGNED_BYTE
+from .context import Context
+from .pool import SurfacePool
+
+Tile = namedtuple('Tile', ['x', 'y', 'width', 'height'])
+
+def _floor_power_of_two(size):
+    """Round a positive size down to a power of two."""
+    return 1 << (size.bit_length() - 1)
+
+def split_tiles(width, height, tile_width, tile_height):
+    """Split an image into tiles no larger than the given size.
+
+    Tiles are measured in pixels from the bottom-left corner of the
+    image, as EGL and the client APIs do. They are listed in the order
+    that their pixels appear in a top-down image: the top row of tiles
+    first, each row from left to right.
+
+    """
+    if min(width, height, tile_width, tile_height) < 1:
+        raise ValueError('image and tile sizes must be positive')
+    tiles = []
+    for top in range(height, 0, -tile_height):
+        bottom = max(top - tile_height, 0)
+        for left in range(0, width, tile_width):
+            tiles.append(Tile(left, bottom, min(tile_width, width - left),
+                              top - bottom))
+    return tiles
+
+class TiledRenderer:
+    """Render an image too large for one pbuffer, a tile at a time.
+
+    The image is split into tiles, each of which is rendered on a
+    pbuffer surface checked out of a SurfacePool, then read back and
+    written to the output. The whole image is never held in memory.
+
+    The render callable is called with each Tile, with a context current
+    and a surface bound that is at least tile_size. It must draw that
+    tile's part of the image in the bottom-left corner of the surface
+    (for instance, by setting the viewport to the tile's size and
+    offsetting its projection by the tile's position).
+
+    By default, tiles are rendered in the calling thread, which must
+    have a context current that was created from config. If executor is
+    a RenderExecutor, tiles are instead rendered by its workers, with
+    their own contexts.
+
+    The tile size defaults to the smallest power of two in each
+    dimension that covers the image, within the config's limits on the
+    size of a pbuffer. The tile size is used as the size of every
+    surface, so that the smaller tiles at the edges can reuse them; with
+    the pool's default buckets, a power of two is not rounded up.
+
+    """
+    def __init__(self, config, width, height, render, *, tile_size=None,
+                 executor=None, pool=None, attribs=None):
+        self.config = config
+        self.width = width
+        self.height = height
+        self.render_tile = render
+        self.tile_size = (self._default_tile_size() if tile_size is None
+                          else tuple(tile_size))
+        self.executor = executor
+        self.pool = pool
+        self.attribs = attribs
+        self.tiles = split_tiles(width, height, *self.tile_size)
+
+        self._write_lock = Lock()
+
+    def _default_tile_size(self):
+        """Find the largest useful tile size that a pbuffer can have."""
+        tile_width = min(1 << (self.width - 1).bit_length(),
+                         _floor_power_of_two(self.config.max_pbuffer_width))
+        tile_height = min(1 << (self.height - 1).bit_length(),
+                          _floor_power_of_two(self.config.max_pbuffer_height))
+        # Some implementations report no limit on the pixel count as zero.
+        max_pixels = self.config.max_pbuffer_pixels
+        while max_pixels > 0 and tile_width * tile_height > max_pixels:
+            if tile_width >= tile_height:
+                tile_width //= 2
+            else:
+                tile_height //= 2
+        return tile_width, tile_height
+
+    @property
+    def nbytes(self):
+        """The size in bytes of the whole image."""
+        return self.width * self.height * 4
+
+    def _render_one(self, tile, pool, write):
+        """Render and read back one tile, in the calling thread."""
+        context = Context.get_current_context()
+        if context is None:
+            raise ValueError('a context must be current to render tiles')
+        pixels = bytearray(tile.width * tile.height * 4)
+        with pool.checkout(self.config, *self.tile_size,
+                           self.attribs) as surface:
+            with context.bound(surface):
+                self.render_tile(tile)
+                gl_function('glReadPixels')(
+                    0, 0, tile.width, tile.height, GL_RGBA,
+                    GL_UNSIGNED_BYTE,
+                    (ctypes.c_char * len(pixels)).from_buffer(pixels))
+                check_error('reading pixels')
+        with self._write_lock:
+            write(tile, pixels)
+
+    def _write_rows(self, tile, pixels, put):
+        """Write the rows of a tile, top row first, at their offsets."""
+        row_bytes = tile.width * 4
+        pixels = memoryview(pixels)
+        for row in range(tile.height):
+            # Rows are read back from the bottom up.
+            image_row = self.height - 1 - (tile.y + row)
+            offset = (image_row * self.width + tile.x) * 4
+            put(offset, pixels[row * row_bytes:(row + 1) * row_bytes])
+
+    def render(self, output):
+        """Render every tile, and write the image to the output.
+
+        The image is written as RGBA pixels, with one unsigned byte per
+        component, and the top row first. The output may be a writable
+        buffer of at least nbytes bytes, such as a bytearray, an
+        mmap.mmap, or a C-contiguous numpy.memmap of shape (height,
+        width, 4) and type uint8. Otherwise, it may be a binary file
+        object that can seek, or the path to a file to create.
+
+        """
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'wb') as file:
+                file.truncate(self.nbytes)
+                self.render(file)
+            return
+
+        if hasattr(output, 'seek') and hasattr(output, 'write'):
+            def put(offset, data):
+                output.seek(offset)
+                output.write(data)
+        else:
+            view = memoryview(output).cast('B')
+            if view.readonly:
+                raise ValueError('output buffer is read-only')
+            if view.nbytes < self.nbytes:
+                raise ValueError(f'output buffer holds {view.nbytes} bytes, '
+                                 f'but the image needs {self.nbytes}')
+            def put(offset, data):
+                view[offset:offset + len(data)] = data
+
+        def write(tile, pixels):
+            self._write_rows(tile, pixels, put)
+
+        pool = SurfacePool() if self.pool is None else self.pool
+        try:
+            if self.executor is None:
+                for tile in self.tiles:
+                    self._render_one(tile, pool, write)
+            else:
+                futures = [self.executor.submit(self._render_one, tile, pool,
+                                                write)
+                           for tile in self.tiles]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            if self.pool is None:
+                pool.close()
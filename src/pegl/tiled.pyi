@@ -0,0 +1,49 @@
+"""Typing stubs for pegl.tiled"""
+
+# Standard library imports.
+import os
+from typing import (Any, BinaryIO, Callable, List, NamedTuple, Optional,
+                    Tuple, Union)
+
+# Local imports.
+from .config import Config
+from .executor import RenderExecutor
+from .pool import SurfacePool
+
+__all__: List[str] = ...
+
+
+class Tile(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+def split_tiles(width: int, height: int, tile_width: int,
+                tile_height: int) -> List[Tile]: ...
+
+
+class TiledRenderer:
+    config: Config
+    width: int
+    height: int
+    render_tile: Callable[[Tile], Any]
+    tile_size: Tuple[int, int]
+    executor: Optional[RenderExecutor]
+    pool: Optional[SurfacePool]
+    attribs: Optional[dict]
+    tiles: List[Tile]
+
+    def __init__(self, config: Config, width: int, height: int,
+                 render: Callable[[Tile], Any], *,
+                 tile_size: Optional[Tuple[int, int]]=...,
+                 executor: Optional[RenderExecutor]=...,
+                 pool: Optional[SurfacePool]=...,
+                 attribs: Optional[dict]=...) -> None: ...
+
+    @property
+    def nbytes(self) -> int: ...
+
+    def render(self, output: Union[str, os.PathLike, BinaryIO, Any]
+               ) -> None: ...
@@ -24,6 +24,7 @@ import unittest
 
 # Import test utilities.
 from util_test_attribs import compare_array
+from util_test_common import needs_display
 
 # Import the module to be tested.
 import pegl
@@ -73,3 +74,116 @@ class TestAttribList(unittest.TestCase):
              pegl.SurfaceAttrib.WIDTH, 480,
              pegl.SurfaceAttrib.LARGEST_PBUFFER, False,
              pegl.egl.EGL_NONE]))
+
+
+@needs_display
+class TestContextAttribs(unittest.TestCase):
+    """Test validated context attribute sets."""
+    def test_empty(self):
+        """Test an empty attribute set.
+
+        This test passes if:
+
+        - The set is empty, and its attribute list is None
+
+        """
+        ctx_attribs = attribs.ContextAttribs(self.dpy)
+        self.assertEqual(len(ctx_attribs), 0)
+        self.assertIsNone(ctx_attribs.array)
+
+    @unittest.skipIf(pegl.egl_version < (1, 3), 'EGL version too low')
+    def test_array(self):
+        """Test the attribute list of a typical set.
+
+        This test passes if:
+
+        - The set holds the given attributes
+        - The attribute list is built once, terminated by EGL_NONE
+        - Equal sets have equal hashes
+
+        """
+        ctx_attribs = attribs.ContextAttribs(
+            self.dpy, {pegl.ContextAttrib.CLIENT_VERSION: 2})
+        self.assertEqual(dict(ctx_attribs),
+                         {pegl.ContextAttrib.CLIENT_VERSION: 2})
+        self.assertIs(ctx_attribs.array, ctx_attribs.array)
+        self.assertTrue(compare_array(
+            ctx_attribs.array,
+            [pegl.ContextAttrib.CLIENT_VERSION, 2, pegl.egl.EGL_NONE]))
+        self.assertEqual(hash(ctx_attribs), hash(attribs.ContextAttribs(
+            self.dpy, {pegl.ContextAttrib.CLIENT_VERSION: 2})))
+
+    def test_bad_key(self):
+        """Test the list terminator as an attribute.
+
+        This test passes if:
+
+        - BadAttributeError is raised
+
+        """
+        with self.assertRaises(pegl.BadAttributeError):
+            attribs.ContextAttribs(self.dpy, {pegl.egl.EGL_NONE: 0})
+
+    def test_unknown_key(self):
+        """Test an attribute that Pegl does not know.
+
+        This test passes if:
+
+        - The attribute and its value are kept, unchecked
+        - They are included in the attribute list
+
+        """
+        ctx_attribs = attribs.ContextAttribs(self.dpy, {0x7A00: -5})
+        self.assertEqual(dict(ctx_attribs), {0x7A00: -5})
+        self.assertTrue(compare_array(ctx_attribs.array,
+                                      [0x7A00, -5, pegl.egl.EGL_NONE]))
+
+    @unittest.skipIf(pegl.egl_version < (1, 3), 'EGL version too low')
+    def test_bad_value(self):
+        """Test an invalid attribute value.
+
+        This test passes if:
+
+        - BadAttributeError is raised
+
+        """
+        with self.assertRaises(pegl.BadAttributeError):
+            attribs.ContextAttribs(self.dpy,
+                                   {pegl.ContextAttrib.CLIENT_VERSION: -1})
+
+    def test_extension(self):
+        """Test an attribute from an extension.
+
+        This test passes if:
+
+        - The attribute is accepted if the display supports the extension
+        - Otherwise, BadAttributeError is raised
+
+        """
+        attrs = {pegl.egl.EGL_CONTEXT_PRIORITY_LEVEL_IMG:
+                 pegl.ContextPriority.LOW}
+        if self.dpy.has_extension('EGL_IMG_context_priority'):
+            self.assertEqual(dict(attribs.ContextAttribs(self.dpy, attrs)),
+                             attrs)
+        else:
+            with self.assertRaises(pegl.BadAttributeError):
+                attribs.ContextAttribs(self.dpy, attrs)
+
+    def test_ignored_option(self):
+        """Test an option that the display does not support.
+
+        This test passes if:
+
+        - The option is ignored, rather than raising an error
+
+        """
+        if self.dpy.has_extension('EGL_IMG_context_priority'):
+            self.skipTest('context priority supported')
+        ctx_attribs = attribs.ContextAttribs(
+            self.dpy, priority=pegl.ContextPriority.LOW)
+        self.assertEqual(len(ctx_attribs), 0)
+
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
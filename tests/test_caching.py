@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl._caching module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import os
+import unittest
+from unittest.mock import patch
+
+# Import test utilities.
+from util_test_common import needs_display
+
+# Import the module to be tested.
+import pegl
+from pegl import _caching
+
+
+@_caching.cached('_as_parameter_')
+class Dummy:
+    """A minimal cached class for testing."""
+    def __init__(self, handle):
+        self._as_parameter_ = handle
+        self.__class__._add_to_cache(self) # pylint: disable=no-member
+
+
+class TestForkHandling(unittest.TestCase):
+    """Test how cached instances are treated after a fork."""
+    def test_fresh_instance(self):
+        """Check that a newly created instance is not stale.
+
+        This test passes if:
+
+        - A cached instance is not stale when created
+
+        """
+        obj = Dummy(1)
+        self.assertFalse(_caching.is_stale(obj))
+
+    def test_unstamped_instance(self):
+        """Check that an instance that was never stamped is not stale.
+
+        This test passes if:
+
+        - An object with no fork generation recorded is not stale
+
+        """
+        self.assertFalse(_caching.is_stale(object()))
+
+    def test_after_fork(self):
+        """Simulate the child side of a fork.
+
+        This test passes if:
+
+        - After the fork handler runs, an existing instance is stale
+        - The instance is no longer found in the cache
+        - A new instance with the same handle is cached and not stale
+
+        """
+        obj = Dummy(2)
+        self.assertIs(Dummy._get_existing((2,)), obj)
+
+        # Patch out the real classes' caches, so that they're unaffected.
+        with patch('pegl._caching._generation', _caching._generation), \
+             patch('pegl._caching._cached_classes', [Dummy]):
+            _caching._after_fork_in_child()
+
+            self.assertTrue(_caching.is_stale(obj))
+            self.assertIsNone(Dummy._get_existing((2,)))
+
+            new_obj = Dummy(2)
+            self.assertFalse(_caching.is_stale(new_obj))
+            self.assertIs(Dummy._get_existing((2,)), new_obj)
+
+
+class TestMemoisedProperty(unittest.TestCase):
+    """Test properties that are computed once per instance."""
+    def test_memoised(self):
+        """Check that a memoised property is only computed once.
+
+        This test passes if:
+
+        - The value is computed on first access and reused thereafter
+        - Each instance has its own value
+        - Deleting the stored value forces it to be computed again
+
+        """
+        calls = []
+        class Thing:
+            """A class with a memoised property."""
+            @_caching.memoised_property
+            def value(self):
+                """A value that is expensive to compute."""
+                calls.append(self)
+                return len(calls)
+
+        thing, other = Thing(), Thing()
+        self.assertEqual(thing.value, 1)
+        self.assertEqual(thing.value, 1)
+        self.assertEqual(other.value, 2)
+        del thing.value
+        self.assertEqual(thing.value, 3)
+        self.assertEqual(Thing.value.__doc__,
+                         'A value that is expensive to compute.')
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'fork not available')
+@needs_display
+class TestRealFork(unittest.TestCase):
+    """Test forking a process that holds a display."""
+    def test_child_forgets_display(self):
+        """Fork and check the display cache in the child.
+
+        This test passes if:
+
+        - The child process sees the inherited display as stale
+        - The child process does not find it in the display cache
+        - Deleting the inherited display in the child does not terminate
+          it in the parent
+
+        """
+        pid = os.fork()
+        if pid == 0:
+            # Child process. Report results through the exit status, and
+            # skip all cleanup handlers.
+            status = 0
+            try:
+                if not _caching.is_stale(self.dpy):
+                    status = 1
+                elif pegl.Display._get_existing((self.dpy._as_parameter_,
+                                                 None)) is not None:
+                    status = 2
+                else:
+                    del self.dpy
+            finally:
+                os._exit(status)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+        # The display should still work in the parent.
+        self.assertFalse(_caching.is_stale(self.dpy))
+        self.assertTrue(self.dpy.version_string)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
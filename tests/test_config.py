@@ -22,6 +22,7 @@
 # Standard library imports.
 import re
 import unittest
+from unittest.mock import patch
 
 # Import test utilities.
 from util_test_common import needs_config, needs_display
@@ -350,6 +351,170 @@ class TestMethods(unittest.TestCase):
             expected += 'A'
         self.assertEqual(match.group(4), expected)
 
+    def test_create_context_attribs(self):
+        """Check that a new context records its attributes.
+
+        This test passes if:
+
+        - The context's attribs match those it was created with
+        - Without attributes, the context's attribs are empty
+
+        """
+        ctx = self.cfg.create_context()
+        self.assertEqual(dict(ctx.attribs), {})
+        del ctx
+
+        attribs = {pegl.egl.EGL_CONTEXT_CLIENT_VERSION: 2}
+        ctx = self.cfg.create_context(attribs=attribs)
+        self.assertEqual(dict(ctx.attribs), attribs)
+        del ctx
+
+    def test_create_context_prebuilt(self):
+        """Try creating contexts from a prebuilt attribute set.
+
+        This test passes if:
+
+        - Each context keeps the same attribute set, without rebuilding it
+
+        """
+        attribs = pegl.ContextAttribs(self.dpy)
+        ctx1 = self.cfg.create_context(attribs=attribs)
+        ctx2 = self.cfg.create_context(attribs=attribs)
+        self.assertIs(ctx1.attribs, attribs)
+        self.assertIs(ctx2.attribs, attribs)
+        del ctx1, ctx2
+
+    def test_create_context_bad_attrib(self):
+        """Try creating a context with the list terminator as an attribute.
+
+        This test passes if:
+
+        - BadAttributeError is raised without calling EGL
+
+        """
+        with patch('pegl.config.egl.eglCreateContext') as mock_create:
+            with self.assertRaises(pegl.BadAttributeError):
+                self.cfg.create_context(attribs={pegl.egl.EGL_NONE: 0})
+        mock_create.assert_not_called()
+
+    def test_create_context_unknown_attrib(self):
+        """Try creating a context with an attribute that Pegl does not know.
+
+        This test passes if:
+
+        - The attribute is passed on to eglCreateContext unchanged
+
+        """
+        with patch('pegl.config.egl.eglCreateContext') as mock_create:
+            # Stop the context from being created, rather than destroying
+            # a mock handle later.
+            mock_create.side_effect = pegl.BadAttributeError
+            with self.assertRaises(pegl.BadAttributeError):
+                self.cfg.create_context(attribs={0x7A00: 1})
+            attrib_array = mock_create.call_args[0][3]
+            mock_create.reset_mock()
+        self.assertEqual(list(attrib_array), [0x7A00, 1, pegl.egl.EGL_NONE])
+
+    def test_create_context_release_behavior(self):
+        """Try creating a context that is not flushed on release.
+
+        This test passes if:
+
+        - The context reports the requested release behaviour, if the
+          display supports flush control
+        - Otherwise, the request is ignored and the context reports
+          the default behaviour (flushing)
+
+        """
+        supported = self.dpy.has_extension('EGL_KHR_context_flush_control')
+        ctx = self.cfg.create_context(
+            release_behavior=pegl.ReleaseBehavior.NONE)
+        self.assertEqual(ctx.release_behavior,
+                         pegl.ReleaseBehavior.NONE if supported else
+                         pegl.ReleaseBehavior.FLUSH)
+        del ctx
+
+        with patch.object(self.dpy, 'has_extension', return_value=False):
+            ctx = self.cfg.create_context(
+                release_behavior=pegl.ReleaseBehavior.NONE)
+        self.assertEqual(ctx.release_behavior, pegl.ReleaseBehavior.FLUSH)
+        self.assertEqual(dict(ctx.attribs), {})
+        del ctx
+
+    def test_create_context_no_error(self):
+        """Try creating a context without error checking.
+
+        This test passes if:
+
+        - The context reports no-error mode if the display supports it
+        - Otherwise, the request is ignored and an ordinary context is
+          created
+
+        """
+        # No-error mode is only defined for OpenGL ES 2.0 and later.
+        if pegl.egl_version < (1, 3):
+            self.skipTest('EGL version too low')
+        if not self.cfg.renderable_type & pegl.ClientAPIFlag.OPENGL_ES2:
+            self.skipTest('OpenGL ES 2.0 not supported')
+        attribs = {pegl.ContextAttrib.CLIENT_VERSION: 2}
+
+        supported = self.dpy.has_extension('EGL_KHR_create_context_no_error')
+        ctx = self.cfg.create_context(attribs=attribs, no_error=True)
+        self.assertEqual(ctx.no_error, supported)
+        del ctx
+
+        with patch.object(self.dpy, 'has_extension', return_value=False):
+            ctx = self.cfg.create_context(attribs=attribs, no_error=True)
+        self.assertFalse(ctx.no_error)
+        del ctx
+
+    def test_create_context_priority(self):
+        """Try creating a context with a priority level.
+
+        This test passes if:
+
+        - The context reports a priority level if the display supports
+          context priorities
+        - Otherwise, the request is ignored and the context reports no
+          priority
+
+        """
+        ctx = self.cfg.create_context(priority=pegl.ContextPriority.LOW)
+        if self.dpy.has_extension('EGL_IMG_context_priority'):
+            self.assertIsInstance(ctx.priority, pegl.ContextPriority)
+            self.assertEqual(ctx.attribs[pegl.ContextAttrib.PRIORITY_LEVEL],
+                             pegl.ContextPriority.LOW)
+        else:
+            self.assertIsNone(ctx.priority)
+            self.assertEqual(dict(ctx.attribs), {})
+        del ctx
+
+    def test_create_context_robust(self):
+        """Try creating a context with robust buffer access.
+
+        This test passes if:
+
+        - The context reports robust access if the display supports the
+          robustness extension
+        - Without the extension or EGL 1.5, the request is ignored and
+          an ordinary context is created
+
+        """
+        if not self.dpy.has_extension('EGL_EXT_create_context_robustness'):
+            self.skipTest('robustness extension not supported')
+        ctx = self.cfg.create_context(
+            robust=True,
+            reset_notification=pegl.egl.EGL_LOSE_CONTEXT_ON_RESET_EXT)
+        self.assertTrue(ctx.robust)
+        del ctx
+
+        if pegl.egl_version < (1, 5):
+            with patch.object(self.dpy, 'has_extension', return_value=False):
+                ctx = self.cfg.create_context(robust=True)
+            self.assertFalse(ctx.robust)
+            self.assertEqual(dict(ctx.attribs), {})
+            del ctx
+
 
 @needs_config
 class TestProperties(unittest.TestCase):
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.context module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import unittest
+from unittest.mock import patch
+from weakref import ref
+
+# Import test utilities.
+from util_test_common import needs_context
+
+# Import the module to be tested.
+import pegl
+from pegl import context
+
+
+@unittest.skipIf(pegl.egl_version < (1, 4), 'EGL version too low')
+@needs_context
+class TestRedundantBinding(unittest.TestCase):
+    """Test that binding what is already bound is skipped."""
+    def test_rebind_same(self):
+        """Try making the current context current again.
+
+        This test passes if:
+
+        - eglMakeCurrent is not called when the same context and surfaces
+          are made current again
+
+        """
+        with patch('pegl.egl.eglMakeCurrent') as mock_makecurrent:
+            self.ctx.make_current(self.surf)
+            mock_makecurrent.assert_not_called()
+
+    def test_rebind_different_surface(self):
+        """Try binding the current context to a different surface.
+
+        This test passes if:
+
+        - eglMakeCurrent is called when the surfaces differ from those
+          already bound
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        with patch('pegl.egl.eglMakeCurrent') as mock_makecurrent:
+            self.ctx.make_current(surf)
+            mock_makecurrent.assert_called_once_with(self.dpy, surf, surf,
+                                                     self.ctx)
+            # Don't let the mock keep the surface alive past tearDown.
+            mock_makecurrent.reset_mock()
+
+    def test_foreign_binding(self):
+        """Try rebinding after other code has released the context.
+
+        This test passes if:
+
+        - eglMakeCurrent is called when EGL reports that a different
+          context is current, even though Pegl's record has not changed
+
+        """
+        pegl.egl.eglMakeCurrent(self.dpy, pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_CONTEXT)
+        self.ctx.make_current(self.surf)
+        self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                         self.ctx._as_parameter_)
+
+    def test_foreign_surfaces(self):
+        """Try rebinding after other code has bound different surfaces.
+
+        This test passes if:
+
+        - eglMakeCurrent is called when EGL reports that the same context
+          is current with different surfaces
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        pegl.egl.eglMakeCurrent(self.dpy, surf, surf, self.ctx)
+        self.ctx.make_current(self.surf)
+        self.assertEqual(pegl.egl.eglGetCurrentSurface(pegl.egl.EGL_DRAW),
+                         self.surf._as_parameter_)
+        self.assertEqual(pegl.egl.eglGetCurrentSurface(pegl.egl.EGL_READ),
+                         self.surf._as_parameter_)
+
+    def test_weak_record(self):
+        """Check that the binding record doesn't keep a context alive.
+
+        This test passes if:
+
+        - A context released by other code can be deleted
+
+        """
+        ctx2 = self.cfg.create_context()
+        ctx2.make_current(self.surf)
+        pegl.egl.eglMakeCurrent(self.dpy, pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_CONTEXT)
+        ctx2_ref = ref(ctx2)
+        del ctx2
+        self.assertIsNone(ctx2_ref())
+
+    def test_release_twice(self):
+        """Try releasing the current context twice.
+
+        This test passes if:
+
+        - The first release calls eglMakeCurrent and leaves no context
+          current
+        - The second release does not call eglMakeCurrent
+
+        """
+        pegl.Context.release_current()
+        self.assertIsNone(pegl.egl.eglGetCurrentContext())
+        with patch('pegl.egl.eglMakeCurrent') as mock_makecurrent:
+            pegl.Context.release_current()
+            mock_makecurrent.assert_not_called()
+
+    def test_failed_binding(self):
+        """Check the binding record after a failed call.
+
+        This test passes if:
+
+        - The record of the current binding is cleared if eglMakeCurrent
+          raises an error
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        with patch('pegl.egl.eglMakeCurrent',
+                   side_effect=pegl.BadMatchError) as mock_makecurrent:
+            with self.assertRaises(pegl.BadMatchError):
+                self.ctx.make_current(surf)
+            # Don't let the mock keep the surface alive past tearDown.
+            mock_makecurrent.reset_mock()
+        self.assertIsNone(context._binding.context)
+
+
+
+@unittest.skipIf(pegl.egl_version < (1, 4), 'EGL version too low')
+@needs_context
+class TestBoundScope(unittest.TestCase):
+    """Test scoped context binding."""
+    def test_nested(self):
+        """Try nesting bound blocks.
+
+        This test passes if:
+
+        - The inner context is current inside the inner block
+        - The outer context and surface are current again after it
+
+        """
+        ctx2 = self.cfg.create_context()
+        surf2 = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                 pegl.SurfaceAttrib.HEIGHT: 8})
+        with ctx2.bound(surf2) as bound_ctx:
+            self.assertIs(bound_ctx, ctx2)
+            self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                             ctx2._as_parameter_)
+        self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                         self.ctx._as_parameter_)
+        self.assertEqual(pegl.Context.current_draw_surface, self.surf)
+
+    def test_nothing_bound(self):
+        """Try a bound block when no context was current.
+
+        This test passes if:
+
+        - No context is current after the block
+
+        """
+        pegl.Context.release_current()
+        with self.ctx.bound(self.surf):
+            self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                             self.ctx._as_parameter_)
+        self.assertIsNone(pegl.egl.eglGetCurrentContext())
+
+    def test_exception(self):
+        """Try leaving a bound block by raising an exception.
+
+        This test passes if:
+
+        - The previous binding is restored anyway
+
+        """
+        ctx2 = self.cfg.create_context()
+        with self.assertRaises(RuntimeError):
+            with ctx2.bound(self.surf):
+                raise RuntimeError
+        self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                         self.ctx._as_parameter_)
+
+    def test_foreign_binding(self):
+        """Try a bound block after other code has changed the binding.
+
+        This test passes if:
+
+        - The binding made outside Pegl is restored after the block, when
+          the record is verified
+
+        """
+        ctx2 = self.cfg.create_context()
+        pegl.egl.eglMakeCurrent(self.dpy, self.surf, self.surf, ctx2)
+        with patch.object(pegl.Context, 'verify_binding', True):
+            with self.ctx.bound(self.surf):
+                pass
+        self.assertEqual(pegl.egl.eglGetCurrentContext(),
+                         ctx2._as_parameter_)
+
+    def test_foreign_surfaces(self):
+        """Try a bound block after other code has changed the surfaces.
+
+        This test passes if:
+
+        - The surfaces bound outside Pegl are restored after the block,
+          when the record is verified
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        pegl.egl.eglMakeCurrent(self.dpy, surf, surf, self.ctx)
+        with patch.object(pegl.Context, 'verify_binding', True):
+            with self.ctx.bound(self.surf):
+                pass
+        self.assertEqual(pegl.egl.eglGetCurrentSurface(pegl.egl.EGL_DRAW),
+                         surf._as_parameter_)
+        pegl.Context.release_current()
+        del surf
+
+    def test_no_queries(self):
+        """Check that a bound block trusts Pegl's own record.
+
+        This test passes if:
+
+        - Entering and leaving the block do not query the current context
+          or surfaces
+
+        """
+        ctx2 = self.cfg.create_context()
+        with patch('pegl.egl.eglGetCurrentContext',
+                   wraps=pegl.egl.eglGetCurrentContext) as mock_getcontext, \
+             patch('pegl.egl.eglGetCurrentSurface',
+                   wraps=pegl.egl.eglGetCurrentSurface) as mock_getsurface:
+            with ctx2.bound(self.surf):
+                pass
+            mock_getcontext.assert_not_called()
+            mock_getsurface.assert_not_called()
+
+
+
+@unittest.skipIf(pegl.egl_version < (1, 4), 'EGL version too low')
+@needs_context
+class TestCurrentQueries(unittest.TestCase):
+    """Test answering queries for the current binding."""
+    def test_from_record(self):
+        """Check queries after Pegl has made a context current.
+
+        This test passes if:
+
+        - The current display, context and surfaces are correct
+        - EGL is not asked for any of them
+
+        """
+        with patch('pegl.egl.eglGetCurrentContext') as mock_getcontext, \
+             patch('pegl.egl.eglGetCurrentSurface') as mock_getsurface, \
+             patch('pegl.egl.eglGetCurrentDisplay') as mock_getdisplay:
+            self.assertIs(pegl.Display.get_current_display(), self.dpy)
+            self.assertIs(pegl.Context.get_current_context(), self.ctx)
+            self.assertIs(pegl.Context.current_draw_surface, self.surf)
+            self.assertIs(pegl.Context.current_read_surface, self.surf)
+            mock_getcontext.assert_not_called()
+            mock_getsurface.assert_not_called()
+            mock_getdisplay.assert_not_called()
+
+    def test_released(self):
+        """Check queries after Pegl has released the context.
+
+        This test passes if:
+
+        - There is no current context or surface, and no current display
+
+        """
+        pegl.Context.release_current()
+        self.assertIsNone(pegl.Context.get_current_context())
+        self.assertIsNone(pegl.Context.current_draw_surface)
+        self.assertIs(pegl.Display.get_current_display(), pegl.NoDisplay)
+
+    def test_released_outside(self):
+        """Check queries after other code has released the context.
+
+        This test passes if:
+
+        - With verification on, EGL's null handles are reported as no
+          context and no surface
+
+        """
+        pegl.egl.eglMakeCurrent(self.dpy, pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_SURFACE,
+                                pegl.egl.EGL_NO_CONTEXT)
+        with patch.object(pegl.Context, 'verify_binding', True):
+            self.assertIsNone(pegl.Context.get_current_context())
+            self.assertIsNone(pegl.Context.current_draw_surface)
+            self.assertIsNone(pegl.Context.current_read_surface)
+
+    def test_verify(self):
+        """Check queries after other code has changed the binding.
+
+        This test passes if:
+
+        - With verification on, the binding made outside Pegl is found
+
+        """
+        ctx2 = self.cfg.create_context()
+        pegl.egl.eglMakeCurrent(self.dpy, self.surf, self.surf, ctx2)
+        with patch.object(pegl.Context, 'verify_binding', True):
+            self.assertIs(pegl.Context.get_current_context(), ctx2)
+        pegl.Context.release_current()
+        del ctx2
+
+
+@needs_context
+class TestProperties(unittest.TestCase):
+    """Test querying context properties."""
+    def test_memoised(self):
+        """Check that immutable properties are only queried once.
+
+        This test passes if:
+
+        - Reading config_id twice makes at most one EGL query
+
+        """
+        ctx = self.cfg.create_context()
+        with patch('pegl.egl.eglQueryContext',
+                   wraps=pegl.egl.eglQueryContext) as mock_query:
+            first = ctx.config_id
+            self.assertEqual(ctx.config_id, first)
+            self.assertEqual(mock_query.call_count, 1)
+            mock_query.reset_mock()
+        del ctx
+
+    def test_describe(self):
+        """Check a snapshot of the context's properties.
+
+        This test passes if:
+
+        - The snapshot agrees with the individual properties
+
+        """
+        ctx = self.cfg.create_context()
+        info = ctx.describe()
+        self.assertEqual(info['config_id'], self.cfg.config_id)
+        self.assertEqual(info['release_behavior'], ctx.release_behavior)
+        if pegl.egl_version >= (1, 2):
+            self.assertEqual(info['client_type'], ctx.client_type)
+        if pegl.egl_version >= (1, 3):
+            self.assertEqual(info['client_version'], ctx.client_version)
+            self.assertEqual(ctx.major_version, ctx.client_version)
+        del ctx
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.damage module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import unittest
+from unittest.mock import Mock
+
+# Import the module to be tested.
+import pegl
+
+FULL = (0, 0, 100, 50)
+
+
+class TestDamageTracker(unittest.TestCase):
+    """Test working out what to repaint for a given buffer age."""
+    def setUp(self):
+        self.surf = Mock(width=100, height=50, buffer_age=0)
+        self.tracker = pegl.DamageTracker(self.surf, max_age=3)
+        # Post one full frame, as any program must start with.
+        self.tracker.swap_buffers()
+
+    def test_first_frame(self):
+        """Check the region for a tracker that has posted nothing.
+
+        This test passes if:
+
+        - The whole surface must be repainted, even for a known age
+
+        """
+        tracker = pegl.DamageTracker(self.surf)
+        self.assertEqual(tracker.repaint_region(1), [FULL])
+
+    def test_age_zero(self):
+        """Check the region for a back buffer of unknown contents.
+
+        This test passes if:
+
+        - The whole surface must be repainted
+
+        """
+        self.tracker.add(1, 2, 3, 4)
+        self.assertEqual(self.tracker.repaint_region(), [FULL])
+
+    def test_age_one(self):
+        """Check the region for a back buffer holding the last frame.
+
+        This test passes if:
+
+        - Only the current frame's damage must be repainted
+        - Nothing must be repainted if nothing changed
+
+        """
+        self.assertEqual(self.tracker.repaint_region(1), [])
+        self.assertIsNone(self.tracker.repaint_bounds(1))
+        self.tracker.add(1, 2, 3, 4)
+        self.assertEqual(self.tracker.repaint_region(1), [(1, 2, 3, 4)])
+
+    def test_older(self):
+        """Check the region for back buffers several frames old.
+
+        This test passes if:
+
+        - Damage from the frames since the buffer's is included
+        - Damage from earlier frames is not
+        - A buffer older than the history is repainted in full
+
+        """
+        self.tracker.add(0, 0, 10, 10)
+        self.tracker.swap_buffers()
+        self.tracker.add(20, 20, 10, 10)
+        self.tracker.swap_buffers()
+        self.tracker.add(40, 40, 5, 5)
+        self.assertEqual(self.tracker.repaint_region(2),
+                         [(40, 40, 5, 5), (20, 20, 10, 10)])
+        self.assertEqual(self.tracker.repaint_region(3),
+                         [(40, 40, 5, 5), (20, 20, 10, 10), (0, 0, 10, 10)])
+        self.assertEqual(self.tracker.repaint_region(4), [FULL])
+        self.assertEqual(self.tracker.repaint_bounds(3), (0, 0, 45, 45))
+
+    def test_simplify(self):
+        """Check that the region is clipped and simplified.
+
+        This test passes if:
+
+        - Rectangles are clipped to the surface
+        - Duplicate and covered rectangles are dropped
+        - Rectangles entirely off the surface are dropped
+
+        """
+        self.tracker.add(90, 40, 20, 20)
+        self.tracker.add(90, 40, 20, 20)
+        self.tracker.add(92, 42, 2, 2)
+        self.tracker.add(200, 0, 5, 5)
+        self.assertEqual(self.tracker.repaint_region(1), [(90, 40, 10, 10)])
+
+    def test_resize(self):
+        """Check the region after the surface is resized.
+
+        This test passes if:
+
+        - The whole surface must be repainted for the new size
+        - Older history is forgotten after the resized frame is posted
+
+        """
+        self.surf.width = 200
+        self.assertEqual(self.tracker.repaint_region(1), [(0, 0, 200, 50)])
+        self.tracker.swap_buffers()
+        self.assertEqual(self.tracker.repaint_region(1), [])
+        self.assertEqual(self.tracker.repaint_region(2), [(0, 0, 200, 50)])
+        self.assertEqual(self.tracker.repaint_region(3), [(0, 0, 200, 50)])
+
+    def test_swap_buffers(self):
+        """Try posting a frame through the tracker.
+
+        This test passes if:
+
+        - The surface's buffers are swapped with the frame's damage
+        - The new frame starts with no damage
+
+        """
+        self.tracker.add(1, 2, 3, 4)
+        self.tracker.swap_buffers()
+        self.surf.swap_buffers.assert_called_with(damage=[(1, 2, 3, 4)])
+        self.assertEqual(self.tracker.damage, [])
+
+    def test_begin_frame(self):
+        """Try starting a frame through the tracker.
+
+        This test passes if:
+
+        - The repaint region is returned and set as the damage region
+
+        """
+        self.tracker.add(1, 2, 3, 4)
+        self.assertEqual(self.tracker.begin_frame(1), [(1, 2, 3, 4)])
+        self.surf.set_damage_region.assert_called_once_with([(1, 2, 3, 4)])
+
+    def test_reset(self):
+        """Try forgetting all damage.
+
+        This test passes if:
+
+        - The whole surface must be repainted afterwards
+
+        """
+        self.tracker.reset()
+        self.assertEqual(self.tracker.repaint_region(1), [FULL])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -22,6 +22,7 @@
 # Standard library imports.
 import re
 import unittest
+from unittest.mock import patch
 from warnings import warn
 
 # Import test utilities.
@@ -250,6 +251,115 @@ class TestMethods(unittest.TestCase):
         self.assertIsInstance(count, int)
         self.assertGreaterEqual(count, 0)
 
+    def test_warm_up(self):
+        """Try warming up the display on the calling thread.
+
+        This test passes if:
+
+        - The warm_up method can be called with no arguments
+        - It returns a non-negative number of seconds
+        - No context is left current afterwards, if none was before
+
+        """
+        elapsed = self.dpy.warm_up()
+        self.assertGreaterEqual(elapsed, 0)
+        if pegl.egl_version >= (1, 4):
+            self.assertIsNone(pegl.egl.eglGetCurrentContext())
+
+    def test_warm_up_background(self):
+        """Try warming up the display on a background thread.
+
+        This test passes if:
+
+        - The warm_up method returns a future when background is True
+        - The future's result is a non-negative number of seconds
+
+        """
+        future = self.dpy.warm_up(background=True)
+        self.assertGreaterEqual(future.result(timeout=60), 0)
+
+    def test_warm_up_api_before_1_2(self):
+        """Try warming up with a client API given, before EGL 1.2.
+
+        This test passes if:
+
+        - The API is not bound, since EGL 1.0 and 1.1 can't bind one
+
+        """
+        with patch('pegl.egl.egl_version', (1, 1)), \
+             patch('pegl.egl.eglBindAPI') as mock_bind:
+            self.dpy.warm_up(api=pegl.egl.EGL_OPENGL_ES_API)
+        mock_bind.assert_not_called()
+
+    @unittest.skipIf(pegl.egl_version < (1, 2), 'EGL version too low')
+    def test_warm_up_api_restored(self):
+        """Try warming up with a different client API given.
+
+        This test passes if:
+
+        - The given API is bound while the context is created
+        - The previously bound API is bound again afterwards, even if
+          creating the context fails
+
+        """
+        previous = pegl.egl.eglQueryAPI()
+        bound = []
+        def create_context(cfg, *args, **kwargs):
+            bound.append(pegl.egl.eglQueryAPI())
+            raise pegl.BadMatchError
+        with patch.object(pegl.Config, 'create_context', create_context):
+            with self.assertRaises(pegl.BadMatchError):
+                self.dpy.warm_up(api=pegl.egl.EGL_OPENGL_API)
+        self.assertEqual(bound, [pegl.egl.EGL_OPENGL_API])
+        self.assertEqual(pegl.egl.eglQueryAPI(), previous)
+
+    def test_warm_up_no_config(self):
+        """Try warming up with impossible config requirements.
+
+        This test passes if:
+
+        - ValueError is raised when no config matches
+
+        """
+        with patch.object(pegl.Display, 'choose_config', return_value=()):
+            with self.assertRaises(ValueError):
+                self.dpy.warm_up()
+
+    def test_has_extension(self):
+        """Try checking for supported extensions.
+
+        This test passes if:
+
+        - Every extension listed by the display is reported as supported
+        - A made-up extension is reported as unsupported
+        - The extension string is queried only once
+
+        """
+        extensions = self.dpy.extensions.split()
+        with patch('pegl.egl.eglQueryString',
+                   wraps=pegl.egl.eglQueryString) as mock_querystring:
+            for ext in extensions:
+                self.assertTrue(self.dpy.has_extension(ext))
+            self.assertFalse(self.dpy.has_extension('EGL_PEGL_made_up'))
+            self.assertLessEqual(mock_querystring.call_count, 1)
+            # Don't let the mock keep the display alive past tearDown.
+            mock_querystring.reset_mock()
+
+    def test_has_extension_reinitialized(self):
+        """Check that extensions are queried again after re-initializing.
+
+        This test passes if:
+
+        - The cached extensions are discarded by terminate and initialize
+
+        """
+        self.dpy.has_extension('EGL_PEGL_made_up')
+        self.dpy.terminate()
+        self.assertIsNone(self.dpy._extensions)
+        self.dpy.initialize()
+        self.assertIsNone(self.dpy._extensions)
+        self.assertFalse(self.dpy.has_extension('EGL_PEGL_made_up'))
+
 
 @needs_display
 class TestProperties(unittest.TestCase):
@@ -395,6 +505,36 @@ class TestWithContext(unittest.TestCase):
         self.assertIsInstance(dpy, display.Display)
         self.assertIs(dpy, self.dpy)
 
+    def test_resource_report(self):
+        """Check the resource counts for a display.
+
+        This test passes if:
+
+        - resource_report counts the context and surface in use
+        - A new surface is counted, and raises the peak count
+        - Once that surface is deleted, the live count drops but the peak
+          count does not
+        - The estimated surface memory is at least one byte per pixel
+
+        """
+        before = self.dpy.resource_report()
+        self.assertGreaterEqual(before.contexts.live, 1)
+        self.assertGreaterEqual(before.surfaces.live, 1)
+        self.assertGreaterEqual(before.surface_bytes, 32 * 32)
+
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        during = self.dpy.resource_report()
+        self.assertEqual(during.surfaces.live, before.surfaces.live + 1)
+        self.assertGreaterEqual(during.surfaces.peak, during.surfaces.live)
+        self.assertGreaterEqual(during.surface_bytes,
+                                before.surface_bytes + 8 * 8)
+
+        del surf
+        after = self.dpy.resource_report()
+        self.assertEqual(after.surfaces.live, before.surfaces.live)
+        self.assertEqual(after.surfaces.peak, during.surfaces.peak)
+
     @unittest.skipIf(pegl.egl_version < (1, 1), 'EGL version too low')
     def test_swap_interval(self):
         """Check the swap_interval property with a context.
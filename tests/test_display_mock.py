@@ -35,6 +35,8 @@ from pegl import display
 
 class TestClassMethods(unittest.TestCase):
     """Test the class methods defined on the Display class."""
+    # Without a known binding, EGL must be asked for the current display.
+    @patch('pegl.display._binding.known', False)
     @patch('pegl.display.Display._new_or_existing', return_value='a display')
     @patch('pegl.egl.eglGetCurrentDisplay', return_value='a handle')
     def test_get_current_display(self, mock_getcurrent, mock_cachelookup):
@@ -50,6 +52,21 @@ class TestClassMethods(unittest.TestCase):
         mock_getcurrent.assert_called_with()
         self.assertEqual(dpy, 'a display')
 
+    @patch('pegl.egl.eglGetCurrentDisplay')
+    def test_get_current_display_known(self, mock_getcurrent):
+        """Try fetching the current display after Pegl released it.
+
+        This test passes if:
+
+        - The answer comes from Pegl's record, without calling
+          eglGetCurrentDisplay
+
+        """
+        display._binding.clear()
+        self.assertIs(display.Display.get_current_display(),
+                      display.NoDisplay)
+        mock_getcurrent.assert_not_called()
+
     @unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
     def test_get_platform_display(self):
         """Try fetching a platform-specific display.
@@ -112,7 +129,7 @@ class TestMethods(unittest.TestCase):
         self.assertEqual(len(mock_cachelookup.call_args_list), get_back)
         self.assertEqual(cfgs, tuple(['a config'] * get_back))
 
-    @patch('pegl.Image.__new__', return_value='an image')
+    @patch('pegl.display.Image', return_value='an image')
     @patch('pegl.egl.eglCreateImage', return_value='a handle')
     @unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
     def test_create_image(self, mock_createimage, mock_Image):
@@ -129,7 +146,7 @@ class TestMethods(unittest.TestCase):
                                             'a target', 'a buffer', None)
         self.assertEqual(img, 'an image')
 
-    @patch('pegl.Sync.__new__', return_value='a sync object')
+    @patch('pegl.display.Sync', return_value='a sync object')
     @patch('pegl.egl.eglCreateSync', return_value='a handle')
     @unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
     def test_create_fence_sync(self, mock_createsync, mock_Sync):
@@ -146,7 +163,7 @@ class TestMethods(unittest.TestCase):
                                            None)
         self.assertEqual(sync, 'a sync object')
 
-    @patch('pegl.Sync.__new__', return_value='a sync object')
+    @patch('pegl.display.Sync', return_value='a sync object')
     @patch('pegl.egl.eglCreateSync', return_value='a handle')
     @unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
     def test_create_cl_sync(self, mock_createsync, mock_Sync):
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.executor module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+from threading import Barrier, current_thread
+import unittest
+from unittest.mock import patch
+
+# Import test utilities.
+from util_test_common import needs_config, needs_context
+
+# Import the module to be tested.
+import pegl
+
+
+def current_handle():
+    """Get the handle of the current context."""
+    return pegl.egl.eglGetCurrentContext()
+
+
+@unittest.skipIf(pegl.egl_version < (1, 4), 'EGL version too low')
+@needs_config
+class TestRenderExecutor(unittest.TestCase):
+    """Test running tasks with a bound context."""
+    def test_bound(self):
+        """Try running tasks on two workers at once.
+
+        This test passes if:
+
+        - Each task runs with a context current
+        - The two workers have different contexts
+        - Neither is the root context
+
+        """
+        barrier = Barrier(2, timeout=5)
+        def task():
+            barrier.wait()
+            return current_handle()
+
+        with pegl.RenderExecutor(self.cfg, workers=2) as executor:
+            handles = [executor.submit(task) for _ in range(2)]
+            handles = [future.result(timeout=5) for future in handles]
+            root = executor.root_context._as_parameter_
+        self.assertNotIn(None, handles)
+        self.assertNotEqual(handles[0], handles[1])
+        self.assertNotIn(root, handles)
+
+    def test_pbuffer(self):
+        """Try running a task on a worker bound to a pbuffer.
+
+        This test passes if:
+
+        - The task sees the requested surface size
+
+        """
+        def task():
+            return pegl.Context.current_draw_surface.width
+
+        with pegl.RenderExecutor(
+                self.cfg, surface_attribs={pegl.SurfaceAttrib.WIDTH: 4,
+                                           pegl.SurfaceAttrib.HEIGHT: 2}
+                ) as executor:
+            self.assertEqual(executor.submit(task).result(timeout=5), 4)
+
+    def test_surfaceless(self):
+        """Try running tasks with and without surfaceless contexts.
+
+        This test passes if:
+
+        - Workers bind no surface where the display supports it
+        - Workers bind a pbuffer where it doesn't
+
+        """
+        def task():
+            return pegl.Context.current_draw_surface
+
+        if self.dpy.has_extension('EGL_KHR_surfaceless_context'):
+            with pegl.RenderExecutor(self.cfg) as executor:
+                self.assertIsNone(executor.submit(task).result(timeout=5))
+        with patch.object(self.dpy, 'has_extension', return_value=False):
+            with pegl.RenderExecutor(self.cfg) as executor:
+                self.assertIsNotNone(executor.submit(task).result(timeout=5))
+
+    def test_same_thread(self):
+        """Try running several tasks on one worker.
+
+        This test passes if:
+
+        - The tasks all run on the same thread with the same context
+
+        """
+        def task(_):
+            return current_thread().name, current_handle()
+
+        with pegl.RenderExecutor(self.cfg) as executor:
+            results = set(executor.map(task, range(5), timeout=5))
+        self.assertEqual(len(results), 1)
+
+    def test_exception(self):
+        """Try running a task that raises an exception.
+
+        This test passes if:
+
+        - The exception is raised by the future's result method
+
+        """
+        def task():
+            raise KeyError('oops')
+
+        with pegl.RenderExecutor(self.cfg) as executor:
+            future = executor.submit(task)
+            with self.assertRaises(KeyError):
+                future.result(timeout=5)
+            del future
+
+    def test_shutdown(self):
+        """Try submitting a task after shutting down.
+
+        This test passes if:
+
+        - RuntimeError is raised
+        - The worker threads have exited
+
+        """
+        executor = pegl.RenderExecutor(self.cfg, workers=2)
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            executor.submit(current_handle)
+        for thread in executor._threads:
+            self.assertFalse(thread.is_alive())
+
+
+@unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
+@needs_context
+class TestResourceLoader(unittest.TestCase):
+    """Test uploading resources on a background thread."""
+    def test_upload(self):
+        """Try running an upload task.
+
+        This test passes if:
+
+        - The task runs with a context other than the main one current
+        - The result holds the task's return value and a fence sync
+        - The render thread can wait on the fence
+
+        """
+        with pegl.ResourceLoader(self.ctx) as loader:
+            value, sync = loader.submit(current_handle).result(timeout=5)
+        self.assertIsNotNone(value)
+        self.assertNotEqual(value, self.ctx._as_parameter_)
+        self.assertEqual(sync.sync_type, pegl.SyncType.FENCE)
+        sync.wait_sync()
+        self.assertEqual(sync.client_wait_sync(timeout=10**9),
+                         pegl.SyncResult.CONDITION_SATISFIED)
+        del sync
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.frames module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import unittest
+
+# Import the module to be tested.
+import pegl
+
+
+class TestFrameTimer(unittest.TestCase):
+    """Test summarising recorded swaps."""
+    def test_empty(self):
+        """Check the statistics before anything is recorded.
+
+        This test passes if:
+
+        - No frames are counted and every timing is None
+
+        """
+        stats = pegl.FrameTimer().stats(swap_interval=1)
+        self.assertEqual(stats.frames, 0)
+        self.assertEqual(stats.swap_interval, 1)
+        self.assertIsNone(stats.swap_time)
+        self.assertIsNone(stats.frame_time)
+        self.assertIsNone(stats.jitter)
+
+    def test_split(self):
+        """Check that swap time is told apart from the program's work.
+
+        This test passes if:
+
+        - Swap, work, and frame times are measured from the right ends
+        - A steady frame rate has no jitter
+
+        """
+        timer = pegl.FrameTimer()
+        # Each frame: 10 ms of work, then a 6 ms swap.
+        for frame in range(4):
+            start = frame * 0.016 + 0.010
+            timer.record(start, start + 0.006)
+        stats = timer.stats()
+        self.assertEqual(stats.frames, 4)
+        self.assertAlmostEqual(stats.swap_time.mean, 0.006)
+        self.assertAlmostEqual(stats.work_time.median, 0.010)
+        self.assertAlmostEqual(stats.frame_time.max, 0.016)
+        self.assertAlmostEqual(stats.jitter, 0)
+
+    def test_percentiles(self):
+        """Check the percentiles of the frame times.
+
+        This test passes if:
+
+        - Percentiles are interpolated between the recorded times
+
+        """
+        timer = pegl.FrameTimer()
+        end = 0
+        for frame_time in range(1, 12):
+            end += frame_time
+            timer.record(end, end)
+        frame_time = timer.stats().frame_time
+        # Frame times of 2 to 11 (the first swap has no frame before it).
+        self.assertAlmostEqual(frame_time.median, 6.5)
+        self.assertAlmostEqual(frame_time.p90, 10.1)
+        self.assertEqual(frame_time.max, 11)
+
+    def test_window(self):
+        """Check that only the latest swaps are kept.
+
+        This test passes if:
+
+        - Swaps beyond the window are forgotten
+        - Resetting forgets all swaps
+
+        """
+        timer = pegl.FrameTimer(window=3)
+        for frame in range(10):
+            timer.record(frame, frame + 0.5)
+        self.assertEqual(timer.stats().frames, 3)
+        timer.reset()
+        self.assertEqual(timer.stats().frames, 0)
+
+    def test_histogram(self):
+        """Check the histogram of frame times.
+
+        This test passes if:
+
+        - Each frame time is counted in the first bin it fits
+        - Frame times beyond the last bound are counted with it
+
+        """
+        timer = pegl.FrameTimer(bounds=[1, 2])
+        end = 0
+        for frame_time in (0, 0.5, 1, 1.5, 5):
+            end += frame_time
+            timer.record(end, end)
+        self.assertEqual(timer.stats().histogram, ((1, 2), (2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.handoff module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import ctypes
+from threading import Thread
+import unittest
+
+# Import test utilities.
+from util_test_common import needs_gles3_context
+
+# Import the module to be tested.
+import pegl
+
+GL_COLOR_BUFFER_BIT = 0x4000
+GL_FRAMEBUFFER = 0x8D40
+GL_COLOR_ATTACHMENT0 = 0x8CE0
+GL_TEXTURE_2D = 0x0DE1
+GL_RGBA = 0x1908
+GL_UNSIGNED_BYTE = 0x1401
+
+def gl(name, *argtypes):
+    """Get a client API function with no return value."""
+    return ctypes.CFUNCTYPE(None, *argtypes)(
+        pegl.egl.eglGetProcAddress(name.encode()))
+
+def attach(texture):
+    """Bind a new framebuffer to the current context, drawing to a texture."""
+    framebuffer = ctypes.c_uint()
+    gl('glGenFramebuffers', ctypes.c_int,
+       ctypes.POINTER(ctypes.c_uint))(1, framebuffer)
+    gl('glBindFramebuffer', ctypes.c_uint, ctypes.c_uint)(GL_FRAMEBUFFER,
+                                                          framebuffer)
+    gl('glFramebufferTexture2D', ctypes.c_uint, ctypes.c_uint, ctypes.c_uint,
+       ctypes.c_uint, ctypes.c_int)(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0,
+                                    GL_TEXTURE_2D, texture, 0)
+    return framebuffer
+
+def detach(framebuffer):
+    """Unbind and delete a framebuffer from attach()."""
+    gl('glBindFramebuffer', ctypes.c_uint, ctypes.c_uint)(GL_FRAMEBUFFER, 0)
+    gl('glDeleteFramebuffers', ctypes.c_int,
+       ctypes.POINTER(ctypes.c_uint))(1, framebuffer)
+
+def fill(texture, value):
+    """Fill a texture with a shade of red."""
+    framebuffer = attach(texture)
+    gl('glClearColor', *[ctypes.c_float] * 4)(value / 255, 0, 0, 1)
+    gl('glClear', ctypes.c_uint)(GL_COLOR_BUFFER_BIT)
+    detach(framebuffer)
+
+def first_pixel(texture):
+    """Read the bottom-left pixel of a texture."""
+    framebuffer = attach(texture)
+    pixel = (ctypes.c_ubyte * 4)()
+    gl('glReadPixels', ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+       ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p)(
+           0, 0, 1, 1, GL_RGBA, GL_UNSIGNED_BYTE, pixel)
+    detach(framebuffer)
+    return list(pixel)
+
+
+@unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
+@needs_gles3_context
+class TestHandoffPool(unittest.TestCase):
+    """Test passing frames between contexts."""
+    required_extensions = ('EGL_KHR_gl_texture_2D_image',)
+
+    def create_consumer(self):
+        """Create a consumer context like the producer, self.ctx."""
+        return self.cfg.create_context(attribs=self.ctx_attribs)
+
+    def test_handoff(self):
+        """Try passing frames from one context to another.
+
+        This test passes if:
+
+        - The consumer sees the pixels that the producer rendered
+        - Frames arrive in order, with their tags
+        - A frame received again reuses its consumer texture
+
+        """
+        consumer = self.create_consumer()
+        with pegl.HandoffPool(self.ctx, 4, 4, n_slots=2) as pool:
+            seen, textures = [], {}
+            for value in range(4):
+                frame = pool.acquire(timeout=5)
+                fill(frame.texture, value)
+                pool.submit(frame, tag=value)
+
+                with consumer.bound(self.surf):
+                    with pool.receiving(timeout=5) as frame:
+                        seen.append((frame.tag,
+                                     first_pixel(frame.consumer_texture)))
+                        texture = textures.setdefault(frame.texture,
+                                                      frame.consumer_texture)
+                        self.assertEqual(frame.consumer_texture, texture)
+                    if value == 3:
+                        pool.close_consumer()
+            self.assertEqual(seen, [(value, [value, 0, 0, 255])
+                                    for value in range(4)])
+            del frame
+        del consumer
+
+    def test_threads(self):
+        """Try passing frames from a producer thread.
+
+        This test passes if:
+
+        - Every frame arrives, in order and with the right pixels
+
+        """
+        pool = pegl.HandoffPool(self.ctx, 4, 4, n_slots=2)
+        pegl.Context.release_current()
+
+        def produce():
+            self.ctx.make_current(self.surf)
+            for value in range(6):
+                frame = pool.acquire(timeout=5)
+                fill(frame.texture, value * 10)
+                pool.submit(frame, tag=value)
+            pegl.Context.release_current()
+        producer = Thread(target=produce)
+        producer.start()
+
+        seen = []
+        consumer_surf = self.cfg.create_pbuffer_surface(
+            {pegl.SurfaceAttrib.WIDTH: 1, pegl.SurfaceAttrib.HEIGHT: 1})
+        consumer = self.create_consumer()
+        consumer.make_current(consumer_surf)
+        for _ in range(6):
+            with pool.receiving(timeout=5) as frame:
+                seen.append((frame.tag,
+                             first_pixel(frame.consumer_texture)[0]))
+        pool.close_consumer()
+        producer.join()
+
+        self.ctx.make_current(self.surf)
+        pool.close()
+        self.assertEqual(seen, [(value, value * 10) for value in range(6)])
+        del frame, consumer, consumer_surf
+
+    def test_timeout(self):
+        """Try acquiring and receiving when no frame is available.
+
+        This test passes if:
+
+        - TimeoutError is raised in both cases
+
+        """
+        with pegl.HandoffPool(self.ctx, 4, 4, n_slots=1) as pool:
+            frame = pool.acquire()
+            with self.assertRaises(TimeoutError):
+                pool.acquire(timeout=0.01)
+            with self.assertRaises(TimeoutError):
+                pool.receive(timeout=0.01)
+            del frame
+
+    def test_not_current(self):
+        """Try creating a pool for a producer that is not current.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        consumer = self.create_consumer()
+        with self.assertRaises(ValueError):
+            pegl.HandoffPool(consumer, 4, 4)
+        del consumer
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.pool module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+from threading import Event, Thread
+import time
+import unittest
+from unittest.mock import patch, PropertyMock
+from weakref import ref
+
+# Import test utilities.
+from util_test_common import needs_config
+
+# Import the module to be tested.
+import pegl
+
+
+def wait_for(condition, timeout=5):
+    """Poll until a condition is true, or fail after a timeout."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@needs_config
+class TestContextPool(unittest.TestCase):
+    """Test checking contexts in and out of a pool."""
+    def test_reuse(self):
+        """Try checking out a context, returning it, and checking out again.
+
+        This test passes if:
+
+        - The same context is handed out the second time
+        - Only one context is created
+
+        """
+        with pegl.ContextPool(self.cfg) as pool:
+            ctx = pool.acquire()
+            self.assertIsInstance(ctx, pegl.Context)
+            pool.release(ctx)
+            self.assertIs(pool.acquire(), ctx)
+            pool.release(ctx)
+            self.assertEqual(pool.stats().created, 1)
+            del ctx
+
+    def test_release_current(self):
+        """Try returning a context that is current in this thread.
+
+        This test passes if:
+
+        - The context is no longer current after being returned
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        with pegl.ContextPool(self.cfg) as pool:
+            with pool.checkout() as ctx:
+                ctx.make_current(surf)
+            if pegl.egl_version >= (1, 4):
+                self.assertIsNone(pegl.egl.eglGetCurrentContext())
+            del ctx
+        del surf
+
+    def test_release_foreign(self):
+        """Try returning a context that did not come from the pool.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        ctx = self.cfg.create_context()
+        with pegl.ContextPool(self.cfg) as pool:
+            with self.assertRaises(ValueError):
+                pool.release(ctx)
+        del ctx
+
+    def test_timeout(self):
+        """Try checking out of a full pool with a timeout.
+
+        This test passes if:
+
+        - TimeoutError is raised when no context becomes available
+        - The timeout is counted in the statistics
+
+        """
+        with pegl.ContextPool(self.cfg, max_size=1) as pool:
+            with pool.checkout():
+                with self.assertRaises(TimeoutError):
+                    pool.acquire(timeout=0.01)
+            self.assertEqual(pool.stats().timeouts, 1)
+
+    def test_wait(self):
+        """Try checking out of a full pool while another thread returns.
+
+        This test passes if:
+
+        - The check-out waits and then receives the returned context
+        - The wait is counted in the statistics
+
+        """
+        with pegl.ContextPool(self.cfg, max_size=1) as pool:
+            ctx = pool.acquire()
+            releaser = Thread(target=lambda: (time.sleep(0.05),
+                                              pool.release(ctx)))
+            releaser.start()
+            self.assertIs(pool.acquire(timeout=5), ctx)
+            releaser.join()
+            pool.release(ctx)
+
+            stats = pool.stats()
+            self.assertEqual(stats.waits, 1)
+            self.assertGreater(stats.max_wait, 0)
+            self.assertGreater(stats.utilisation, 0)
+            self.assertLessEqual(stats.utilisation, 1)
+            del ctx
+
+    def test_prewarm(self):
+        """Try prewarming the pool on its background thread.
+
+        This test passes if:
+
+        - The pool creates min_size idle contexts by itself
+
+        """
+        with pegl.ContextPool(self.cfg, min_size=2) as pool:
+            self.assertTrue(wait_for(lambda: pool.stats().idle == 2))
+            self.assertEqual(pool.stats().created, 2)
+
+    def test_evict(self):
+        """Try evicting idle contexts.
+
+        This test passes if:
+
+        - Idle contexts beyond min_size are destroyed after the timeout
+        - The evictions are counted in the statistics
+
+        """
+        with pegl.ContextPool(self.cfg, min_size=1,
+                              idle_timeout=0.05) as pool:
+            ctxs = [pool.acquire() for _ in range(3)]
+            for ctx in ctxs:
+                pool.release(ctx)
+            del ctxs, ctx
+            self.assertTrue(wait_for(lambda: pool.stats().size == 1))
+            self.assertEqual(pool.stats().evicted, 2)
+
+    def test_reset(self):
+        """Try resetting a pool with contexts idle and checked out.
+
+        This test passes if:
+
+        - Idle contexts are discarded and new ones created in their place
+        - A context checked out before the reset is not reused
+        - The reset is counted in the statistics
+
+        """
+        with pegl.ContextPool(self.cfg, min_size=1) as pool:
+            self.assertTrue(wait_for(lambda: pool.stats().idle == 1))
+            old = pool.acquire()
+            pool.reset()
+            self.assertTrue(wait_for(lambda: pool.stats().idle == 1))
+            pool.release(old)
+            self.assertEqual(pool.stats().size, 1)
+            with pool.checkout() as ctx:
+                self.assertIsNot(ctx, old)
+            stats = pool.stats()
+            self.assertEqual(stats.resets, 1)
+            self.assertEqual(stats.created, 2)
+            del old, ctx
+
+    def test_reset_while_creating(self):
+        """Try resetting a pool while it creates a context to check out.
+
+        This test passes if:
+
+        - The new context is still checked out
+        - It is discarded, not kept idle, when it is returned
+
+        """
+        with pegl.ContextPool(self.cfg) as pool:
+            create = pool._create
+            def reset_and_create():
+                pool.reset()
+                return create()
+            with patch.object(pool, '_create', side_effect=reset_and_create):
+                stale = pool.acquire()
+            pool.release(stale)
+            stats = pool.stats()
+            self.assertEqual((stats.size, stats.idle), (0, 0))
+            with pool.checkout() as ctx:
+                self.assertIsNot(ctx, stale)
+            del stale, ctx
+
+    def test_priority(self):
+        """Try creating contexts with a priority level.
+
+        This test passes if:
+
+        - The pool passes its priority on to the contexts it creates
+
+        """
+        with patch.object(self.cfg, 'create_context',
+                          wraps=self.cfg.create_context) as mock_create:
+            with pegl.ContextPool(self.cfg,
+                                  priority=pegl.ContextPriority.HIGH) as pool:
+                with pool.checkout():
+                    pass
+            self.assertEqual(mock_create.call_args[1]['priority'],
+                             pegl.ContextPriority.HIGH)
+            mock_create.reset_mock()
+
+    def test_close_while_prewarming(self):
+        """Try closing a pool while it is creating a context.
+
+        This test passes if:
+
+        - The context is not kept in the closed pool
+
+        """
+        creating, closed = Event(), Event()
+        created = []
+        def create():
+            creating.set()
+            closed.wait(5)
+            created.append(ref(self.cfg.create_context()))
+            return created[-1]()
+
+        pool = pegl.ContextPool(self.cfg, min_size=1)
+        with patch.object(pool, '_create', side_effect=create):
+            pool.reset()
+            self.assertTrue(creating.wait(5))
+            closer = Thread(target=pool.close)
+            closer.start()
+            self.assertTrue(wait_for(lambda: pool._closed))
+            closed.set()
+            closer.join()
+        self.assertEqual(pool.stats().idle, 0)
+        self.assertIsNone(created[0]())
+
+    def test_closed(self):
+        """Try checking out of a closed pool.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        pool = pegl.ContextPool(self.cfg)
+        pool.close()
+        with self.assertRaises(ValueError):
+            pool.acquire()
+
+    def test_max_size(self):
+        """Try creating a pool with an impossible maximum size.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        with self.assertRaises(ValueError):
+            pegl.ContextPool(self.cfg, min_size=2, max_size=1)
+
+
+
+@needs_config
+class TestSurfacePool(unittest.TestCase):
+    """Test checking pbuffer surfaces in and out of a pool."""
+    def test_bucket(self):
+        """Try rounding sizes up to buckets.
+
+        This test passes if:
+
+        - Sizes are rounded up to powers of two by default
+        - Custom buckets are used when given, and larger sizes are not
+          rounded
+
+        """
+        self.assertEqual([pegl.SurfacePool().bucket(size)
+                          for size in (1, 2, 3, 64, 65)],
+                         [1, 2, 4, 64, 128])
+        pool = pegl.SurfacePool(buckets=[100, 50])
+        self.assertEqual([pool.bucket(size) for size in (1, 50, 51, 101)],
+                         [50, 50, 100, 101])
+
+    def test_reuse(self):
+        """Try checking out surfaces of similar sizes.
+
+        This test passes if:
+
+        - The surface is rounded up to the bucket size
+        - A request in the same buckets reuses it
+        - A request in a different bucket creates a new surface
+        - The hits and misses are counted in the statistics
+
+        """
+        with pegl.SurfacePool() as pool:
+            with pool.checkout(self.cfg, 30, 20) as surf:
+                self.assertEqual((surf.width, surf.height), (32, 32))
+            with pool.checkout(self.cfg, 17, 32) as surf2:
+                self.assertIs(surf2, surf)
+            with pool.checkout(self.cfg, 33, 32) as surf3:
+                self.assertIsNot(surf3, surf)
+            stats = pool.stats()
+            self.assertEqual((stats.hits, stats.misses), (1, 2))
+            self.assertAlmostEqual(stats.hit_rate, 1 / 3)
+            self.assertEqual(stats.idle, 2)
+            del surf, surf2, surf3
+
+    def test_attribs(self):
+        """Try checking out surfaces with different attributes.
+
+        This test passes if:
+
+        - Surfaces with different attributes are not shared
+
+        """
+        with pegl.SurfacePool() as pool:
+            with pool.checkout(self.cfg, 8, 8) as surf:
+                pass
+            with pool.checkout(self.cfg, 8, 8, {
+                    pegl.SurfaceAttrib.LARGEST_PBUFFER: True}) as surf2:
+                self.assertIsNot(surf2, surf)
+            del surf, surf2
+
+    def test_estimate_from_config(self):
+        """Check that a new surface's size is estimated from its config.
+
+        This test passes if:
+
+        - The surface is not asked for its config or memory estimate
+        - The idle memory is the estimate for the bucketed size
+
+        """
+        with patch.object(pegl.Surface, 'memory_estimate',
+                          new_callable=PropertyMock,
+                          side_effect=pegl.BadConfigError) as mock_estimate, \
+             pegl.SurfacePool() as pool:
+            with pool.checkout(self.cfg, 10, 12) as surf:
+                pass
+            mock_estimate.assert_not_called()
+            bits = ((self.cfg.buffer_size + self.cfg.depth_size +
+                     self.cfg.stencil_size) * max(self.cfg.samples, 1))
+            self.assertEqual(pool.stats().idle_bytes, 16 * 16 * bits // 8)
+            del surf
+
+    def test_memory_cap(self):
+        """Try returning more surfaces than the memory cap allows.
+
+        This test passes if:
+
+        - The least recently used surface is evicted
+        - The idle surfaces stay within the cap
+
+        """
+        with pegl.SurfacePool() as sizer:
+            with sizer.checkout(self.cfg, 16, 16) as surf:
+                one_surface = surf.memory_estimate
+            del surf
+
+        with pegl.SurfacePool(max_bytes=one_surface) as pool:
+            first = pool.acquire(self.cfg, 16, 16)
+            second = pool.acquire(self.cfg, 16, 16)
+            pool.release(first)
+            pool.release(second)
+            stats = pool.stats()
+            self.assertEqual((stats.idle, stats.evicted), (1, 1))
+            self.assertLessEqual(stats.idle_bytes, one_surface)
+            with pool.checkout(self.cfg, 16, 16) as surf:
+                self.assertIs(surf, second)
+            del first, second, surf
+
+    def test_release_foreign(self):
+        """Try returning a surface that did not come from the pool.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 8})
+        with pegl.SurfacePool() as pool:
+            with self.assertRaises(ValueError):
+                pool.release(surf)
+        del surf
+
+    def test_reset(self):
+        """Try resetting a pool with surfaces idle and checked out.
+
+        This test passes if:
+
+        - Neither surface is reused after the reset
+
+        """
+        with pegl.SurfacePool() as pool:
+            with pool.checkout(self.cfg, 8, 8) as idle:
+                pass
+            out = pool.acquire(self.cfg, 8, 8)
+            pool.reset()
+            pool.release(out)
+            self.assertEqual(pool.stats().idle, 0)
+            with pool.checkout(self.cfg, 8, 8) as surf:
+                self.assertIsNot(surf, idle)
+                self.assertIsNot(surf, out)
+            del idle, out, surf
+
+    def test_closed(self):
+        """Try checking out of a closed pool.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        pool = pegl.SurfacePool()
+        pool.close()
+        with self.assertRaises(ValueError):
+            pool.acquire(self.cfg, 8, 8)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.readback module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import ctypes
+import unittest
+from unittest.mock import patch, PropertyMock
+
+# Import test utilities.
+from util_test_common import needs_gles3_context
+
+# Import the module to be tested.
+import pegl
+
+GL_COLOR_BUFFER_BIT = 0x4000
+
+def clear(red, green, blue, alpha):
+    """Clear the current surface to a colour, with values from 0 to 255."""
+    gl_clear_color = ctypes.CFUNCTYPE(None, *[ctypes.c_float] * 4)(
+        pegl.egl.eglGetProcAddress(b'glClearColor'))
+    gl_clear = ctypes.CFUNCTYPE(None, ctypes.c_uint)(
+        pegl.egl.eglGetProcAddress(b'glClear'))
+    gl_clear_color(red / 255, green / 255, blue / 255, alpha / 255)
+    gl_clear(GL_COLOR_BUFFER_BIT)
+
+
+@unittest.skipIf(pegl.egl_version < (1, 5), 'EGL version too low')
+@needs_gles3_context
+class TestReadbackQueue(unittest.TestCase):
+    """Test reading back frames through a queue."""
+    def test_read(self):
+        """Try reading back a frame.
+
+        This test passes if:
+
+        - The frame has the size of the surface and the given tag
+        - Its pixels are the colour the surface was cleared to
+
+        """
+        with pegl.ReadbackQueue(self.surf) as queue:
+            clear(255, 0, 128, 255)
+            queue.read(tag='first')
+            self.assertEqual(len(queue), 1)
+            with queue.get(block=True) as frame:
+                self.assertEqual(frame.tag, 'first')
+                self.assertEqual((frame.width, frame.height), (4, 4))
+                self.assertEqual(bytes(frame.buffer), bytes([255, 0, 128, 255])
+                                 * 16)
+            self.assertIsNone(queue.get())
+
+    def test_not_ready(self):
+        """Try getting a frame whose fence is not yet signalled.
+
+        This test passes if:
+
+        - Without blocking, None is returned and the frame stays queued
+        - The frame is returned once its fence is signalled
+
+        """
+        with pegl.ReadbackQueue(self.surf) as queue:
+            clear(0, 255, 0, 255)
+            queue.read(tag='pending')
+            with patch.object(pegl.Sync, 'sync_status',
+                              new_callable=PropertyMock,
+                              return_value=False):
+                self.assertIsNone(queue.get())
+            self.assertEqual(len(queue), 1)
+            with queue.get(block=True) as frame:
+                self.assertEqual(frame.tag, 'pending')
+
+    def test_order(self):
+        """Try reading back more frames than there are slots.
+
+        This test passes if:
+
+        - Reading into a full ring does not fail
+        - The frames are returned in order, each with its own pixels
+
+        """
+        with pegl.ReadbackQueue(self.ctx, n_slots=2) as queue:
+            for value in range(5):
+                clear(value, value, value, 255)
+                queue.read(tag=value)
+            frames = list(queue.drain())
+            self.assertEqual([frame.tag for frame in frames], list(range(5)))
+            for frame in frames:
+                self.assertEqual(frame.buffer[0], frame.tag)
+                frame.release()
+            self.assertEqual(len(queue), 0)
+
+    def test_reuse(self):
+        """Try releasing a frame and reading another.
+
+        This test passes if:
+
+        - The released frame's memory is used for the next frame
+        - Memory still in use elsewhere is not reused
+
+        """
+        with pegl.ReadbackQueue(self.surf, n_slots=1) as queue:
+            queue.read()
+            frame = queue.get(block=True)
+            data = frame._data
+            frame.release()
+            queue.read()
+            frame = queue.get(block=True)
+            self.assertIs(frame._data, data)
+
+            view = frame.buffer[:]
+            frame.release()
+            queue.read()
+            self.assertIsNot(queue.get(block=True)._data, data)
+            view.release()
+
+    def test_not_current(self):
+        """Try creating a queue for a context that is not current.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        pegl.Context.release_current()
+        with self.assertRaises(ValueError):
+            pegl.ReadbackQueue(self.ctx)
+
+    def test_closed(self):
+        """Try reading with a closed queue.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        queue = pegl.ReadbackQueue(self.surf)
+        queue.close()
+        with self.assertRaises(ValueError):
+            queue.read()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
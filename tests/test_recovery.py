@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.recovery module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import unittest
+from unittest.mock import Mock, patch
+
+# Import test utilities.
+from util_test_common import needs_config
+
+# Import the module to be tested.
+import pegl
+
+
+@patch('pegl.recovery.Context')
+class TestResetRecovery(unittest.TestCase):
+    """Test recovering from lost contexts."""
+    def test_guard(self, mock_context):
+        """Try losing a context inside a guarded block.
+
+        This test passes if:
+
+        - The current context is released from the thread
+        - Registered resources are reset and callbacks are called
+        - ContextLostError is raised again afterwards
+
+        """
+        recovery = pegl.ResetRecovery()
+        resource = recovery.register(Mock())
+        callback = recovery.on_reset(Mock())
+        with self.assertRaises(pegl.ContextLostError):
+            with recovery.guard():
+                raise pegl.ContextLostError
+        mock_context.release_current.assert_called_once_with()
+        resource.reset.assert_called_once_with()
+        callback.assert_called_once_with()
+        self.assertEqual(recovery.generation, 1)
+
+    def test_call_retry(self, mock_context):
+        """Try calling a function that loses its context once.
+
+        This test passes if:
+
+        - The function is retried after recovery, and its result returned
+
+        """
+        recovery = pegl.ResetRecovery()
+        fn = Mock(side_effect=[pegl.ContextLostError, 'done'])
+        self.assertEqual(recovery.call(fn, 1, key=2), 'done')
+        self.assertEqual(fn.call_count, 2)
+        fn.assert_called_with(1, key=2)
+        self.assertEqual(recovery.generation, 1)
+
+    def test_call_give_up(self, mock_context):
+        """Try calling a function that keeps losing its context.
+
+        This test passes if:
+
+        - ContextLostError is raised after max_retries retries
+
+        """
+        recovery = pegl.ResetRecovery(max_retries=2)
+        fn = Mock(side_effect=pegl.ContextLostError)
+        with self.assertRaises(pegl.ContextLostError):
+            recovery.call(fn)
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(recovery.generation, 3)
+
+    def test_recover_once(self, mock_context):
+        """Try recovering twice from the same loss.
+
+        This test passes if:
+
+        - Only the first recovery for a generation does anything
+
+        """
+        recovery = pegl.ResetRecovery()
+        resource = recovery.register(Mock())
+        self.assertTrue(recovery.recover(0))
+        self.assertFalse(recovery.recover(0))
+        resource.reset.assert_called_once_with()
+
+    def test_lost_share_context(self, mock_context):
+        """Try recovering a resource whose share context was also lost.
+
+        This test passes if:
+
+        - The share context function is called once
+        - The resource is reset with the new share context
+
+        """
+        recovery = pegl.ResetRecovery()
+        new_share = Mock(return_value='new share context')
+        resource = recovery.register(Mock(), share_context=new_share)
+        recovery.recover()
+        new_share.assert_called_once_with()
+        resource.reset.assert_called_once_with(
+            share_context='new share context')
+
+    def test_unregister(self, mock_context):
+        """Try recovering after unregistering a resource.
+
+        This test passes if:
+
+        - The resource is not reset
+
+        """
+        recovery = pegl.ResetRecovery()
+        resource = recovery.register(Mock())
+        recovery.unregister(resource)
+        recovery.recover()
+        resource.reset.assert_not_called()
+
+
+@needs_config
+class TestPoolRecovery(unittest.TestCase):
+    """Test recovering a context pool."""
+    def test_lost_share_context(self):
+        """Try recovering a pool whose share context was also lost.
+
+        This test passes if:
+
+        - The pool shares with the new context after recovery
+        - Contexts checked out afterwards are new
+
+        """
+        recovery = pegl.ResetRecovery()
+        lost = self.cfg.create_context()
+        replacement = []
+        def new_share():
+            replacement.append(self.cfg.create_context())
+            return replacement[-1]
+
+        with recovery.register(pegl.ContextPool(self.cfg, share_context=lost),
+                               share_context=new_share) as pool:
+            with pool.checkout() as old:
+                pass
+            recovery.recover()
+            self.assertIs(pool.share_context, replacement[0])
+            with pool.checkout() as ctx:
+                self.assertIsNot(ctx, old)
+            del old, ctx
+        del lost, replacement
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
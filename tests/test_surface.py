@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.surface module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+from array import array
+import ctypes
+import gc
+import unittest
+from unittest.mock import patch
+
+# Import test utilities.
+from util_test_common import needs_config, needs_context
+
+# Import the module to be tested.
+import pegl
+
+
+@needs_config
+class TestProperties(unittest.TestCase):
+    """Test querying surface properties."""
+    def test_pbuffer_memoised(self):
+        """Check that a pbuffer's size is only queried once.
+
+        This test passes if:
+
+        - The surface knows it is a pbuffer
+        - Reading its size again makes no further EGL queries
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 4})
+        self.assertEqual(surf.surface_type, pegl.SurfaceTypeFlag.PBUFFER)
+        self.assertEqual((surf.width, surf.height), (8, 4))
+        with patch('pegl.egl.eglQuerySurface') as mock_query:
+            self.assertEqual((surf.width, surf.height), (8, 4))
+            mock_query.assert_not_called()
+        del surf
+
+    def test_unknown_live(self):
+        """Check that a surface of unknown type has its size queried.
+
+        This test passes if:
+
+        - Each read of the width makes an EGL query
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 4})
+        surf._surface_type = None
+        with patch('pegl.egl.eglQuerySurface',
+                   wraps=pegl.egl.eglQuerySurface) as mock_query:
+            self.assertEqual(surf.width, 8)
+            self.assertEqual(surf.width, 8)
+            self.assertEqual(mock_query.call_count, 2)
+            # Don't let the mock keep the surface alive past tearDown.
+            mock_query.reset_mock()
+        del surf
+
+    def test_config_uncached(self):
+        """Get a surface's config after the original Config is deleted.
+
+        This test passes if:
+
+        - The surface's config is found by its ID
+        - The memory estimate can still be calculated
+
+        """
+        config_id = self.cfg.config_id
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 16,
+                                                pegl.SurfaceAttrib.HEIGHT: 16})
+        del self.cfg
+        gc.collect()
+        self.assertEqual(surf.config.config_id, config_id)
+        self.assertGreaterEqual(surf.memory_estimate, 16 * 16)
+        del surf
+
+    def test_describe(self):
+        """Check a snapshot of the surface's properties.
+
+        This test passes if:
+
+        - The snapshot agrees with the individual properties
+
+        """
+        surf = self.cfg.create_pbuffer_surface({pegl.SurfaceAttrib.WIDTH: 8,
+                                                pegl.SurfaceAttrib.HEIGHT: 4})
+        info = surf.describe()
+        self.assertEqual(info['surface_type'], pegl.SurfaceTypeFlag.PBUFFER)
+        self.assertEqual(info['config_id'], self.cfg.config_id)
+        self.assertEqual((info['width'], info['height']), (8, 4))
+        if pegl.egl_version >= (1, 1):
+            self.assertEqual(info['texture_format'], surf.texture_format)
+        del surf
+
+
+@needs_context
+class TestSwapping(unittest.TestCase):
+    """Test posting and reusing buffers."""
+    def test_swap_buffers(self):
+        """Try swapping the buffers of a pbuffer surface.
+
+        This test passes if:
+
+        - No exception is raised
+
+        """
+        self.surf.swap_buffers()
+
+    def test_swap_with_damage(self):
+        """Try swapping with damage rectangles where it is supported.
+
+        This test passes if:
+
+        - The KHR function is called with the rectangles and their count
+        - A writable buffer is passed to EGL without being copied
+
+        """
+        rects = array('i', [0, 0, 4, 4, 8, 8, 2, 2])
+        with patch.object(self.dpy, 'has_extension', return_value=True), \
+             patch('pegl.egl.eglSwapBuffersWithDamageKHR') as mock_swap:
+            self.surf.swap_buffers(damage=[(0, 0, 4, 4), (8, 8, 2, 2)])
+            _, _, passed, count = mock_swap.call_args[0]
+            self.assertEqual((list(passed), count), (list(rects), 2))
+
+            self.surf.swap_buffers(damage=rects)
+            _, _, passed, count = mock_swap.call_args[0]
+            passed[0] = 99
+            self.assertEqual((rects[0], count), (99, 2))
+            # Don't let the mock keep the surface alive past tearDown.
+            mock_swap.reset_mock()
+
+    def test_swap_damage_fallback(self):
+        """Try swapping with damage rectangles where it is unsupported.
+
+        This test passes if:
+
+        - The whole surface is swapped instead
+
+        """
+        with patch.object(self.dpy, 'has_extension', return_value=False), \
+             patch('pegl.egl.eglSwapBuffers') as mock_swap:
+            self.surf.swap_buffers(damage=[(0, 0, 4, 4)])
+            mock_swap.assert_called_once_with(self.dpy, self.surf)
+            # Don't let the mock keep the surface alive past tearDown.
+            mock_swap.reset_mock()
+
+    def test_set_damage_region(self):
+        """Try setting the damage region of a frame.
+
+        This test passes if:
+
+        - The KHR function is called where partial updates are supported
+        - Nothing is done where they are not
+
+        """
+        with patch('pegl.egl.eglSetDamageRegionKHR') as mock_set:
+            with patch.object(self.dpy, 'has_extension', return_value=True):
+                self.surf.set_damage_region([(1, 2, 3, 4)])
+                _, _, passed, count = mock_set.call_args[0]
+                self.assertEqual((list(passed), count), ([1, 2, 3, 4], 1))
+            mock_set.reset_mock()
+            with patch.object(self.dpy, 'has_extension', return_value=False):
+                self.surf.set_damage_region([(1, 2, 3, 4)])
+                mock_set.assert_not_called()
+
+    def test_bad_damage(self):
+        """Try swapping with malformed damage rectangles.
+
+        This test passes if:
+
+        - ValueError is raised for an incomplete rectangle
+        - TypeError is raised for a buffer of floats
+
+        """
+        with patch.object(self.dpy, 'has_extension', return_value=True), \
+             patch('pegl.egl.eglSwapBuffersWithDamageKHR'):
+            with self.assertRaises(ValueError):
+                self.surf.swap_buffers(damage=[(0, 0, 4)])
+            with self.assertRaises(TypeError):
+                self.surf.swap_buffers(damage=array('d', [0, 0, 4, 4]))
+
+    def test_frame_stats(self):
+        """Try recording the timing of swaps.
+
+        This test passes if:
+
+        - No statistics are available before recording starts
+        - Every swap afterwards is recorded
+        - No statistics are available after recording stops
+
+        """
+        self.assertIsNone(self.surf.frame_stats())
+        self.surf.track_frames(window=2)
+        for _ in range(3):
+            self.surf.swap_buffers()
+        stats = self.surf.frame_stats()
+        self.assertEqual(stats.frames, 2)
+        self.assertGreaterEqual(stats.swap_time.max, stats.swap_time.median)
+        self.assertEqual(sum(count for _, count in stats.histogram), 2)
+        self.surf.track_frames(None)
+        self.assertIsNone(self.surf.frame_stats())
+
+    def test_buffer_age(self):
+        """Check the age of the back buffer.
+
+        This test passes if:
+
+        - The age is a non-negative integer
+        - The age is zero when the display can't report it
+
+        """
+        self.assertGreaterEqual(self.surf.buffer_age, 0)
+        with patch.object(self.dpy, 'has_extension', return_value=False):
+            self.assertEqual(self.surf.buffer_age, 0)
+
+
+@needs_context
+class TestLocking(unittest.TestCase):
+    """Test mapping a surface's pixels into memory."""
+    def test_unsupported(self):
+        """Try locking a surface where locking is unsupported.
+
+        This test passes if:
+
+        - BadAccessError is raised
+
+        """
+        with patch.object(self.dpy, 'has_extension', return_value=False):
+            with self.assertRaises(pegl.BadAccessError):
+                with self.surf.lock():
+                    pass
+
+    def test_lock(self):
+        """Try locking a surface and writing to its pixels.
+
+        This test passes if:
+
+        - The bitmap's layout is as reported by EGL
+        - Writes through the bitmap reach the mapped memory directly
+        - The surface is unlocked, and the buffer released, afterwards
+
+        """
+        pixels = (ctypes.c_ubyte * (128 * 32))()
+        layout = {pegl.egl.EGL_BITMAP_POINTER_KHR: ctypes.addressof(pixels),
+                  pegl.egl.EGL_BITMAP_PITCH_KHR: 128,
+                  pegl.egl.EGL_BITMAP_ORIGIN_KHR: pegl.egl.EGL_UPPER_LEFT_KHR,
+                  pegl.egl.EGL_BITMAP_PIXEL_SIZE_KHR: 32,
+                  pegl.egl.EGL_BITMAP_PIXEL_RED_OFFSET_KHR: 0,
+                  pegl.egl.EGL_BITMAP_PIXEL_GREEN_OFFSET_KHR: 8,
+                  pegl.egl.EGL_BITMAP_PIXEL_BLUE_OFFSET_KHR: 16,
+                  pegl.egl.EGL_BITMAP_PIXEL_ALPHA_OFFSET_KHR: 24,
+                  pegl.egl.EGL_BITMAP_PIXEL_LUMINANCE_OFFSET_KHR: 0}
+        with patch.object(self.dpy, 'has_extension', return_value=True), \
+             patch('pegl.egl.eglLockSurfaceKHR') as mock_lock, \
+             patch('pegl.egl.eglUnlockSurfaceKHR') as mock_unlock, \
+             patch('pegl.egl.eglQuerySurface64KHR',
+                   side_effect=lambda dpy, surf, attr: layout[attr]
+                   ) as mock_query:
+            with self.surf.lock(write=True) as bitmap:
+                self.assertEqual((bitmap.width, bitmap.height), (32, 32))
+                self.assertEqual(bitmap.pitch, 128)
+                self.assertEqual(bitmap.origin, pegl.BitmapOrigin.UPPER_LEFT)
+                self.assertEqual(bitmap.alpha_offset, 24)
+                bitmap.buffer[128] = 255
+                mock_unlock.assert_not_called()
+            self.assertEqual(pixels[128], 255)
+            mock_lock.assert_called_once()
+            mock_unlock.assert_called_once()
+            with self.assertRaises(ValueError):
+                bitmap.buffer[0]
+            # Don't let the mocks keep the surface alive past tearDown.
+            mock_lock.reset_mock()
+            mock_unlock.reset_mock()
+            mock_query.reset_mock()
+
+    def test_view_kept(self):
+        """Try keeping a view of a locked surface's pixels past the lock.
+
+        This test passes if:
+
+        - BufferError is raised when the block ends
+        - The surface is still unlocked
+
+        """
+        pixels = (ctypes.c_ubyte * (128 * 32))()
+        layout = {pegl.egl.EGL_BITMAP_POINTER_KHR: ctypes.addressof(pixels),
+                  pegl.egl.EGL_BITMAP_PITCH_KHR: 128,
+                  pegl.egl.EGL_BITMAP_ORIGIN_KHR: pegl.egl.EGL_UPPER_LEFT_KHR,
+                  pegl.egl.EGL_BITMAP_PIXEL_SIZE_KHR: 32}
+        with patch.object(self.dpy, 'has_extension', return_value=True), \
+             patch('pegl.egl.eglLockSurfaceKHR') as mock_lock, \
+             patch('pegl.egl.eglUnlockSurfaceKHR') as mock_unlock, \
+             patch('pegl.egl.eglQuerySurface64KHR',
+                   side_effect=lambda dpy, surf, attr: layout.get(attr, 0)
+                   ) as mock_query:
+            with self.assertRaises(BufferError):
+                with self.surf.lock() as bitmap:
+                    row = bitmap.buffer[:128]
+            mock_unlock.assert_called_once()
+            del row
+            # Don't let the mocks keep the surface alive past tearDown.
+            mock_lock.reset_mock()
+            mock_unlock.reset_mock()
+            mock_query.reset_mock()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
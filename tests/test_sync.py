@@ -21,6 +21,7 @@
 
 # Standard library imports.
 import unittest
+from unittest.mock import patch
 
 # Import test utilities.
 from util_test_common import needs_context, needs_display
@@ -115,6 +116,27 @@ class TestSyncCreation(unittest.TestCase):
         self.assertIsInstance(sync, pegl.sync.Sync)
         self.assertEqual(sync.sync_type, pegl.SyncType.FENCE)
 
+    def test_sync_status(self):
+        """Try querying the status of a fence sync object.
+
+        This test passes if:
+
+        - The status is False while the sync is unsignalled
+        - The status is True once the fence has been waited on
+
+        """
+        try:
+            sync = self.dpy.create_sync(pegl.SyncType.FENCE)
+        except pegl.BadMatchError:
+            self.skipTest('context does not support fence commands')
+        with patch('pegl.sync.egl.eglGetSyncAttrib',
+                   return_value=pegl.egl.EGL_UNSIGNALED) as mock_getattrib:
+            self.assertFalse(sync.sync_status)
+            # Don't let the mock keep the sync alive past tearDown.
+            mock_getattrib.reset_mock()
+        sync.client_wait_sync(pegl.SyncFlag.FLUSH_COMMANDS)
+        self.assertIs(sync.sync_status, True)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
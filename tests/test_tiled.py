@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+'''Unit tests for the pegl.tiled module.'''
+
+# Copyright © 2026 Tim Pederick.
+#
+# This file is part of Pegl.
+#
+# Pegl is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Pegl is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public
+# License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pegl. If not, see <http://www.gnu.org/licenses/>.
+
+# Standard library imports.
+import ctypes
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+# Import test utilities.
+from util_test_common import needs_gles3_context
+
+# Import the module to be tested.
+import pegl
+
+GL_COLOR_BUFFER_BIT = 0x4000
+
+def draw_position(tile):
+    """Clear the current surface to a colour giving the tile's position."""
+    gl_clear_color = ctypes.CFUNCTYPE(None, *[ctypes.c_float] * 4)(
+        pegl.egl.eglGetProcAddress(b'glClearColor'))
+    gl_clear = ctypes.CFUNCTYPE(None, ctypes.c_uint)(
+        pegl.egl.eglGetProcAddress(b'glClear'))
+    gl_clear_color(tile.x / 255, tile.y / 255, 0, 1)
+    gl_clear(GL_COLOR_BUFFER_BIT)
+
+def expected_image(width, height, tile_width, tile_height):
+    """Get the image that draw_position renders, top row first."""
+    image = bytearray(width * height * 4)
+    for tile in pegl.split_tiles(width, height, tile_width, tile_height):
+        for row in range(tile.y, tile.y + tile.height):
+            offset = ((height - 1 - row) * width + tile.x) * 4
+            image[offset:offset + tile.width * 4] = (bytes((tile.x, tile.y,
+                                                            0, 255)) *
+                                                     tile.width)
+    return bytes(image)
+
+
+class TestSplitTiles(unittest.TestCase):
+    """Test splitting an image into tiles."""
+    def test_split(self):
+        """Try splitting an image that is not a multiple of the tile size.
+
+        This test passes if:
+
+        - The tiles cover the image, with smaller tiles at the edges
+        - The top row of tiles is listed first
+
+        """
+        self.assertEqual(pegl.split_tiles(10, 6, 4, 4),
+                         [pegl.Tile(0, 2, 4, 4), pegl.Tile(4, 2, 4, 4),
+                          pegl.Tile(8, 2, 2, 4), pegl.Tile(0, 0, 4, 2),
+                          pegl.Tile(4, 0, 4, 2), pegl.Tile(8, 0, 2, 2)])
+
+    def test_one_tile(self):
+        """Try splitting an image smaller than the tile size.
+
+        This test passes if:
+
+        - One tile covers the whole image
+
+        """
+        self.assertEqual(pegl.split_tiles(3, 5, 8, 8),
+                         [pegl.Tile(0, 0, 3, 5)])
+
+    def test_bad_size(self):
+        """Try splitting with a tile size of zero.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        with self.assertRaises(ValueError):
+            pegl.split_tiles(10, 10, 0, 4)
+
+    def test_default_tile_size(self):
+        """Try choosing the tile size from a config's limits.
+
+        This test passes if:
+
+        - Each dimension is a power of two within the pbuffer limits
+        - An image smaller than the limits needs only one tile
+        - The pixel limit is respected, unless it is zero
+
+        """
+        config = Mock(max_pbuffer_width=3000, max_pbuffer_height=4096,
+                      max_pbuffer_pixels=0)
+        renderer = pegl.TiledRenderer(config, 10000, 300, draw_position)
+        self.assertEqual(renderer.tile_size, (2048, 512))
+
+        config.max_pbuffer_pixels = 2048 * 256
+        renderer = pegl.TiledRenderer(config, 10000, 300, draw_position)
+        self.assertEqual(renderer.tile_size, (1024, 512))
+
+
+@unittest.skipIf(pegl.egl_version < (1, 4), 'EGL version too low')
+@needs_gles3_context
+class TestTiledRenderer(unittest.TestCase):
+    """Test rendering an image in tiles."""
+    def test_render_buffer(self):
+        """Try rendering into a buffer.
+
+        This test passes if:
+
+        - Every tile is drawn in its place, with the top row first
+        - The context is bound to its own surface again afterwards
+
+        """
+        renderer = pegl.TiledRenderer(self.cfg, 10, 6, draw_position,
+                                      tile_size=(4, 4))
+        image = bytearray(renderer.nbytes)
+        renderer.render(image)
+        self.assertEqual(image, expected_image(10, 6, 4, 4))
+        self.assertIs(pegl.Context.current_draw_surface, self.surf)
+
+    def test_render_file(self):
+        """Try rendering into a file, by path and by file object.
+
+        This test passes if:
+
+        - The file holds the whole image either way
+
+        """
+        renderer = pegl.TiledRenderer(self.cfg, 9, 5, draw_position,
+                                      tile_size=(4, 2))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'image.rgba')
+            renderer.render(path)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), expected_image(9, 5, 4, 2))
+
+            with tempfile.TemporaryFile() as file:
+                renderer.render(file)
+                file.seek(0)
+                self.assertEqual(file.read(), expected_image(9, 5, 4, 2))
+
+    def test_render_executor(self):
+        """Try rendering tiles on several worker threads.
+
+        This test passes if:
+
+        - Every tile is drawn in its place
+        - Surfaces are reused from the given pool
+
+        """
+        with pegl.RenderExecutor(
+                self.cfg, workers=2, share_context=self.ctx,
+                attribs=self.ctx_attribs,
+                surface_attribs={pegl.SurfaceAttrib.WIDTH: 1,
+                                 pegl.SurfaceAttrib.HEIGHT: 1}) as executor:
+            with pegl.SurfacePool() as pool:
+                renderer = pegl.TiledRenderer(self.cfg, 12, 8, draw_position,
+                                              tile_size=(4, 4),
+                                              executor=executor, pool=pool)
+                image = bytearray(renderer.nbytes)
+                renderer.render(image)
+                self.assertEqual(image, expected_image(12, 8, 4, 4))
+                self.assertLessEqual(pool.stats().created, 2)
+
+    def test_small_buffer(self):
+        """Try rendering into a buffer that is too small.
+
+        This test passes if:
+
+        - ValueError is raised
+
+        """
+        renderer = pegl.TiledRenderer(self.cfg, 10, 6, draw_position)
+        with self.assertRaises(ValueError):
+            renderer.render(bytearray(renderer.nbytes - 1))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -126,3 +126,55 @@ def needs_context(cls):
     setattr(cls, 'tearDown', tearDown)
 
     return cls
+
+def needs_gles3_context(cls):
+    """Decorator for test cases that need a current OpenGL ES 3 context.
+
+    The config has 8-bit RGBA color, and the attributes used to create
+    the context are kept as ctx_attribs, for creating others like it.
+    The test is skipped if no such config is available, or if the
+    display lacks any extension named in the class's
+    required_extensions attribute.
+
+    """
+    def setUp(self):
+        """Set up an OpenGL ES 3 context and a pbuffer for testing."""
+        self.dpy = pegl.Display()
+        missing = [name for name in getattr(self, 'required_extensions', ())
+                   if not self.dpy.has_extension(name)]
+        if missing:
+            self.dpy.terminate()
+            del self.dpy
+            self.skipTest('{} not supported'.format(', '.join(missing)))
+        configs = self.dpy.choose_config({
+            pegl.ConfigAttrib.RENDERABLE_TYPE: pegl.ClientAPIFlag.OPENGL_ES3,
+            pegl.ConfigAttrib.SURFACE_TYPE: pegl.SurfaceTypeFlag.PBUFFER,
+            pegl.ConfigAttrib.RED_SIZE: 8,
+            pegl.ConfigAttrib.GREEN_SIZE: 8,
+            pegl.ConfigAttrib.BLUE_SIZE: 8,
+            pegl.ConfigAttrib.ALPHA_SIZE: 8})
+        if not configs:
+            self.dpy.terminate()
+            del self.dpy
+            self.skipTest('no OpenGL ES 3 config available')
+
+        self.cfg = configs[0]
+        self.ctx_attribs = {pegl.ContextAttrib.CONTEXT_MAJOR_VERSION: 3}
+        self.ctx = self.cfg.create_context(attribs=self.ctx_attribs)
+        self.surf = self.cfg.create_pbuffer_surface(
+            {pegl.SurfaceAttrib.WIDTH: 4,
+             pegl.SurfaceAttrib.HEIGHT: 4})
+        self.ctx.make_current(self.surf)
+    setattr(cls, 'setUp', setUp)
+
+    def tearDown(self):
+        """Finalize the EGL objects used for testing."""
+        pegl.Context.release_current()
+        del self.surf
+        del self.ctx
+
+        self.dpy.terminate()
+        del self.dpy
+    setattr(cls, 'tearDown', tearDown)
+
+    return cls